@@ -4,39 +4,122 @@ Create benchmark comparison between baseline and optimized results.
 """
 
 import json
+import mmap
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 def load_results(filename: str) -> dict:
-    """Load benchmark results from JSON file."""
+    """
+    Load benchmark results from JSON file.
+
+    With orjson available the file is memory-mapped and parsed in place;
+    otherwise falls back to the stdlib json module.
+    """
     path = Path(__file__).parent / filename
-    with open(path) as f:
-        return json.load(f)
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as view,
+    ):
+        return orjson.loads(view)
+
+
+def index_results(results: list) -> dict:
+    """Index results by operation name."""
+    return {r.get("operation"): r for r in results if r.get("operation")}
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyResult:
+    """Latency statistics from a search benchmark."""
+
+    mean_ms: float | None = None
+    median_ms: float | None = None
+    p95_ms: float | None = None
+    p99_ms: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RegistryLoadingResult:
+    """Result of the baseline registry_loading benchmark."""
+
+    cold_time_ms: float | None = None
+    warm_time_ms: float | None = None
+    tool_count: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class IndexBuildResult:
+    """Result of the baseline index_building benchmark."""
+
+    time_ms: float | None = None
+    vocabulary_size: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingReuseResult:
+    """Result of the optimized embedding_reuse benchmark."""
+
+    build_time_ms: float | None = None
+    cache_size: int = 0
+    avg_cache_retrieval_ms: float | None = None
 
 
-def find_result(results: list, operation: str) -> dict:
-    """Find result by operation name."""
-    for result in results:
-        if result.get("operation") == operation:
-            return result
-    return {}
+@dataclass(frozen=True, slots=True)
+class MemoryFootprintResult:
+    """Result of the optimized memory_footprint benchmark."""
 
+    vocabulary_size: int = 0
+    cached_embeddings: int = 0
+    total_embedding_kb: float | None = None
+    total_embedding_mb: float | None = None
 
-def calculate_speedup(baseline_ms: float, optimized_ms: float) -> float:
-    """Calculate speedup ratio."""
-    if optimized_ms == 0:
-        return float("inf")
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Result of the optimized batch_vs_individual benchmark."""
+
+    individual_avg_ms: float | None = None
+    batch_total_ms: float | None = None
+    speedup: float | None = None
+    tool_count: int = 0
+
+
+def parse_result(cls, result: dict | None):
+    """Build a typed result from a raw result dict, or None if it is missing."""
+    if not result:
+        return None
+    return cls(**{f.name: result[f.name] for f in fields(cls) if f.name in result})
+
+
+def calculate_speedup(baseline_ms: float | None, optimized_ms: float | None) -> float | None:
+    """Calculate speedup ratio, or None if a timing is missing or zero."""
+    if baseline_ms is None or not optimized_ms:
+        return None
     return baseline_ms / optimized_ms
 
 
+def format_speedup(speedup: float | None) -> str:
+    """Format a speedup ratio, showing a missing one as n/a."""
+    return "n/a" if speedup is None else f"{speedup:.2f}x"
+
+
 def create_comparison():
     """Create comparison between baseline and optimized benchmarks."""
     baseline = load_results("baseline_results.json")
     optimized = load_results("optimized_results.json")
 
-    baseline_results = baseline.get("results", [])
-    optimized_results = optimized.get("results", [])
+    baseline_idx = index_results(baseline.get("results", []))
+    optimized_idx = index_results(optimized.get("results", []))
 
     comparison = {
         "timestamp": datetime.now().isoformat(),
@@ -46,81 +129,84 @@ def create_comparison():
         "summary": {},
     }
 
+    # Registry loading: page-cache cold vs warm
+    registry_raw = baseline_idx.get("registry_loading", {})
+    if "warm_time_ms" in registry_raw:  # Older baselines only recorded time_ms
+        comparison["registry_loading"] = asdict(parse_result(RegistryLoadingResult, registry_raw))
+
     # Compare search latency (baseline) vs cached search (optimized)
-    baseline_search = find_result(baseline_results, "search_latency")
-    optimized_search = find_result(optimized_results, "cached_search")
+    baseline_search = parse_result(LatencyResult, baseline_idx.get("search_latency"))
+    optimized_search = parse_result(LatencyResult, optimized_idx.get("cached_search"))
 
     if baseline_search and optimized_search:
         search_comparison = {
             "operation": "search_performance",
-            "baseline": {
-                "mean_ms": baseline_search.get("mean_ms"),
-                "median_ms": baseline_search.get("median_ms"),
-                "p95_ms": baseline_search.get("p95_ms"),
-                "p99_ms": baseline_search.get("p99_ms"),
-            },
+            "baseline": asdict(baseline_search),
             "optimized": {
-                "mean_ms": optimized_search.get("mean_ms"),
-                "median_ms": optimized_search.get("median_ms"),
-                "p95_ms": optimized_search.get("p95_ms"),
+                "mean_ms": optimized_search.mean_ms,
+                "median_ms": optimized_search.median_ms,
+                "p95_ms": optimized_search.p95_ms,
             },
             "speedup": {
-                "mean": calculate_speedup(
-                    baseline_search.get("mean_ms", 0), optimized_search.get("mean_ms", 1)
-                ),
-                "median": calculate_speedup(
-                    baseline_search.get("median_ms", 0), optimized_search.get("median_ms", 1)
-                ),
-                "p95": calculate_speedup(
-                    baseline_search.get("p95_ms", 0), optimized_search.get("p95_ms", 1)
-                ),
+                "mean": calculate_speedup(baseline_search.mean_ms, optimized_search.mean_ms),
+                "median": calculate_speedup(baseline_search.median_ms, optimized_search.median_ms),
+                "p95": calculate_speedup(baseline_search.p95_ms, optimized_search.p95_ms),
             },
         }
+        baseline_search_cold = parse_result(LatencyResult, baseline_idx.get("search_latency_cold"))
+        if baseline_search_cold:
+            search_comparison["baseline_cold"] = asdict(baseline_search_cold)
         comparison["comparisons"].append(search_comparison)
 
+    # Compare search latency (baseline) vs fused sparse-query scoring (optimized)
+    fused_search = parse_result(LatencyResult, optimized_idx.get("fused_search"))
+    if baseline_search and fused_search:
+        comparison["comparisons"].append(
+            {
+                "operation": "fused_search_performance",
+                "baseline": asdict(baseline_search),
+                "optimized": {
+                    "mean_ms": fused_search.mean_ms,
+                    "median_ms": fused_search.median_ms,
+                    "p95_ms": fused_search.p95_ms,
+                },
+                "speedup": {
+                    "mean": calculate_speedup(baseline_search.mean_ms, fused_search.mean_ms),
+                    "median": calculate_speedup(baseline_search.median_ms, fused_search.median_ms),
+                    "p95": calculate_speedup(baseline_search.p95_ms, fused_search.p95_ms),
+                },
+            }
+        )
+
     # Compare index building
-    baseline_index = find_result(baseline_results, "index_building")
-    optimized_embedding = find_result(optimized_results, "embedding_reuse")
+    baseline_index = parse_result(IndexBuildResult, baseline_idx.get("index_building"))
+    optimized_embedding = parse_result(EmbeddingReuseResult, optimized_idx.get("embedding_reuse"))
 
     if baseline_index and optimized_embedding:
         index_comparison = {
             "operation": "index_building",
             "baseline": {
-                "build_time_ms": baseline_index.get("time_ms"),
-                "vocabulary_size": baseline_index.get("vocabulary_size"),
-            },
-            "optimized": {
-                "build_time_ms": optimized_embedding.get("build_time_ms"),
-                "cache_size": optimized_embedding.get("cache_size"),
-                "avg_cache_retrieval_ms": optimized_embedding.get("avg_cache_retrieval_ms"),
+                "build_time_ms": baseline_index.time_ms,
+                "vocabulary_size": baseline_index.vocabulary_size,
             },
+            "optimized": asdict(optimized_embedding),
             "speedup": {
                 "build_time": calculate_speedup(
-                    baseline_index.get("time_ms", 0), optimized_embedding.get("build_time_ms", 1)
+                    baseline_index.time_ms, optimized_embedding.build_time_ms
                 )
             },
         }
         comparison["comparisons"].append(index_comparison)
 
     # Add memory footprint info
-    memory = find_result(optimized_results, "memory_footprint")
+    memory = parse_result(MemoryFootprintResult, optimized_idx.get("memory_footprint"))
     if memory:
-        comparison["memory_analysis"] = {
-            "vocabulary_size": memory.get("vocabulary_size"),
-            "cached_embeddings": memory.get("cached_embeddings"),
-            "total_embedding_kb": memory.get("total_embedding_kb"),
-            "total_embedding_mb": memory.get("total_embedding_mb"),
-        }
+        comparison["memory_analysis"] = asdict(memory)
 
     # Add batch performance info
-    batch = find_result(optimized_results, "batch_vs_individual")
+    batch = parse_result(BatchResult, optimized_idx.get("batch_vs_individual"))
     if batch:
-        comparison["batch_performance"] = {
-            "individual_avg_ms": batch.get("individual_avg_ms"),
-            "batch_total_ms": batch.get("batch_total_ms"),
-            "speedup": batch.get("speedup"),
-            "tool_count": batch.get("tool_count"),
-        }
+        comparison["batch_performance"] = asdict(batch)
 
     # Create summary
     if comparison["comparisons"]:
@@ -129,15 +215,15 @@ def create_comparison():
             "search_mean_speedup": search_comp["speedup"]["mean"],
             "search_p95_speedup": search_comp["speedup"]["p95"],
             "cache_hit_rate": "100%" if optimized_embedding else "N/A",
-            "memory_footprint_mb": memory.get("total_embedding_mb", 0) if memory else 0,
+            "memory_footprint_mb": memory.total_embedding_mb if memory else None,
             "optimization_status": "SUCCESS",
             "key_findings": [
-                f"Search latency improved by {search_comp['speedup']['mean']:.2f}x (mean)",
-                f"P95 latency improved by {search_comp['speedup']['p95']:.2f}x",
-                f"Memory footprint: {memory.get('total_embedding_mb', 0):.2f} MB"
-                if memory
+                f"Search latency improved by {format_speedup(search_comp['speedup']['mean'])} (mean)",
+                f"P95 latency improved by {format_speedup(search_comp['speedup']['p95'])}",
+                f"Memory footprint: {memory.total_embedding_mb:.2f} MB"
+                if memory and memory.total_embedding_mb is not None
                 else "Memory data unavailable",
-                f"Batch operations {batch.get('speedup', 0):.2f}x faster than individual"
+                f"Batch operations {format_speedup(batch.speedup)} faster than individual"
                 if batch
                 else "Batch data unavailable",
             ],
@@ -151,8 +237,12 @@ if __name__ == "__main__":
 
     # Save to JSON
     output_path = Path(__file__).parent / "comparison.json"
-    with open(output_path, "w") as f:
-        json.dump(comparison, f, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(
+            orjson.dumps(comparison, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        output_path.write_text(json.dumps(comparison, indent=2))
 
     print("Benchmark Comparison")
     print("=" * 60)
@@ -3,6 +3,7 @@
 Generate human-readable performance summary report.
 """
 
+import io
 import json
 from datetime import datetime
 from pathlib import Path
@@ -15,21 +16,28 @@ def load_json(filename: str) -> dict:
         return json.load(f)
 
 
-def find_result(results: list, operation: str) -> dict:
-    """Find result by operation name."""
-    for result in results:
-        if result.get("operation") == operation:
-            return result
-    return {}
+def index_results(results: list) -> dict:
+    """Index results by operation name."""
+    return {r.get("operation"): r for r in results if r.get("operation")}
+
+
+# (scale, format) per magnitude band: sub-microsecond, sub-millisecond, larger
+_MS_FORMATS = (
+    (1000.0, "{:.3f} µs"),
+    (1.0, "{:.3f} ms"),
+    (1.0, "{:.2f} ms"),
+)
 
 
 def format_ms(ms: float) -> str:
     """Format milliseconds with appropriate precision."""
-    if ms < 0.001:
-        return f"{ms * 1000:.3f} µs"
-    if ms < 1:
-        return f"{ms:.3f} ms"
-    return f"{ms:.2f} ms"
+    scale, fmt = _MS_FORMATS[0 if ms < 0.001 else 1 if ms < 1 else 2]
+    return fmt.format(ms * scale)
+
+
+def format_speedup(speedup: float | None) -> str:
+    """Format a speedup ratio; create_comparison stores undefined ones as null."""
+    return "n/a" if speedup is None else f"{speedup:.2f}x"
 
 
 def generate_summary():
@@ -38,153 +46,154 @@ def generate_summary():
     optimized = load_json("optimized_results.json")
     comparison = load_json("comparison.json")
 
-    baseline_results = baseline.get("results", [])
-    optimized_results = optimized.get("results", [])
+    baseline_idx = index_results(baseline.get("results", []))
+    optimized_idx = index_results(optimized.get("results", []))
+    comparison_idx = index_results(comparison.get("comparisons", []))
 
-    lines = []
-    lines.append("=" * 70)
-    lines.append("MetaMCP+ Performance Summary Report")
-    lines.append("=" * 70)
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"Baseline run: {baseline.get('timestamp', 'N/A')}")
-    lines.append(f"Optimized run: {optimized.get('timestamp', 'N/A')}")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("=" * 70 + "\n")
+    w("MetaMCP+ Performance Summary Report\n")
+    w("=" * 70 + "\n")
+    w(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w(f"Baseline run: {baseline.get('timestamp', 'N/A')}\n")
+    w(f"Optimized run: {optimized.get('timestamp', 'N/A')}\n")
+    w("\n")
 
     # Executive Summary
-    lines.append("EXECUTIVE SUMMARY")
-    lines.append("-" * 70)
+    w("EXECUTIVE SUMMARY\n")
+    w("-" * 70 + "\n")
     summary = comparison.get("summary", {})
     if summary:
-        lines.append(f"Overall Status: {summary.get('optimization_status', 'N/A')}")
-        lines.append(
-            f"Search Performance Improvement: {summary.get('search_mean_speedup', 0):.2f}x"
-        )
-        lines.append(f"P95 Latency Improvement: {summary.get('search_p95_speedup', 0):.2f}x")
-        lines.append(f"Cache Hit Rate: {summary.get('cache_hit_rate', 'N/A')}")
-        lines.append(f"Memory Footprint: {summary.get('memory_footprint_mb', 0):.2f} MB")
-    lines.append("")
+        w(f"Overall Status: {summary.get('optimization_status', 'N/A')}\n")
+        w(f"Search Performance Improvement: {format_speedup(summary.get('search_mean_speedup'))}\n")
+        w(f"P95 Latency Improvement: {format_speedup(summary.get('search_p95_speedup'))}\n")
+        w(f"Cache Hit Rate: {summary.get('cache_hit_rate', 'N/A')}\n")
+        memory_mb = summary.get("memory_footprint_mb")
+        w(f"Memory Footprint: {'N/A' if memory_mb is None else f'{memory_mb:.2f} MB'}\n")
+    w("\n")
 
     # Key Metrics Table
-    lines.append("KEY METRICS")
-    lines.append("-" * 70)
-    lines.append("")
+    w("KEY METRICS\n")
+    w("-" * 70 + "\n")
+    w("\n")
 
     # Registry Loading
-    registry_baseline = find_result(baseline_results, "registry_loading")
+    registry_baseline = baseline_idx.get("registry_loading", {})
     if registry_baseline:
-        lines.append("1. Registry Loading")
-        lines.append(f"   Time: {format_ms(registry_baseline.get('time_ms', 0))}")
-        lines.append(f"   Tool Count: {registry_baseline.get('tool_count', 0)}")
-        lines.append("")
+        w("1. Registry Loading\n")
+        w(f"   Time: {format_ms(registry_baseline.get('time_ms', 0))}\n")
+        w(f"   Tool Count: {registry_baseline.get('tool_count', 0)}\n")
+        w("\n")
 
     # Search Latency
-    search_baseline = find_result(baseline_results, "search_latency")
-    search_optimized = find_result(optimized_results, "cached_search")
+    search_baseline = baseline_idx.get("search_latency", {})
+    search_optimized = optimized_idx.get("cached_search", {})
 
-    lines.append("2. Search Performance (Baseline vs Optimized)")
-    lines.append("")
-    lines.append("   Metric          Baseline        Optimized       Improvement")
-    lines.append("   " + "-" * 62)
+    w("2. Search Performance (Baseline vs Optimized)\n")
+    w("\n")
+    w("   Metric          Baseline        Optimized       Improvement\n")
+    w("   " + "-" * 62 + "\n")
 
     if search_baseline and search_optimized:
+        # Speedups were already computed by create_comparison; reuse them so
+        # the report and comparison.json always agree
+        speedup = comparison_idx.get("search_performance", {}).get("speedup", {})
+        mean_speedup = format_speedup(speedup.get("mean"))
+        median_speedup = format_speedup(speedup.get("median"))
+        p95_speedup = format_speedup(speedup.get("p95"))
+
         mean_base = search_baseline.get("mean_ms", 0)
         mean_opt = search_optimized.get("mean_ms", 0)
-        mean_speedup = mean_base / mean_opt if mean_opt > 0 else 0
-
         median_base = search_baseline.get("median_ms", 0)
         median_opt = search_optimized.get("median_ms", 0)
-        median_speedup = median_base / median_opt if median_opt > 0 else 0
-
         p95_base = search_baseline.get("p95_ms", 0)
         p95_opt = search_optimized.get("p95_ms", 0)
-        p95_speedup = p95_base / p95_opt if p95_opt > 0 else 0
-
         p99_base = search_baseline.get("p99_ms", 0)
 
-        lines.append(
-            f"   Mean            {format_ms(mean_base):15s} {format_ms(mean_opt):15s} {mean_speedup:.2f}x"
+        w(
+            f"   Mean            {format_ms(mean_base):15s} {format_ms(mean_opt):15s} {mean_speedup}\n"
         )
-        lines.append(
-            f"   Median          {format_ms(median_base):15s} {format_ms(median_opt):15s} {median_speedup:.2f}x"
+        w(
+            f"   Median          {format_ms(median_base):15s} {format_ms(median_opt):15s} {median_speedup}\n"
         )
-        lines.append(
-            f"   P95             {format_ms(p95_base):15s} {format_ms(p95_opt):15s} {p95_speedup:.2f}x"
+        w(
+            f"   P95             {format_ms(p95_base):15s} {format_ms(p95_opt):15s} {p95_speedup}\n"
         )
-        lines.append(f"   P99             {format_ms(p99_base):15s} {'N/A':15s} N/A")
-    lines.append("")
+        w(f"   P99             {format_ms(p99_base):15s} {'N/A':15s} N/A\n")
+    w("\n")
 
     # Index Building
-    index_baseline = find_result(baseline_results, "index_building")
-    embedding_opt = find_result(optimized_results, "embedding_reuse")
+    index_baseline = baseline_idx.get("index_building", {})
+    embedding_opt = optimized_idx.get("embedding_reuse", {})
 
-    lines.append("3. Index Building & Embedding Cache")
+    w("3. Index Building & Embedding Cache\n")
     if index_baseline:
-        lines.append(f"   Build Time: {format_ms(index_baseline.get('time_ms', 0))}")
-        lines.append(f"   Vocabulary Size: {index_baseline.get('vocabulary_size', 0)}")
+        w(f"   Build Time: {format_ms(index_baseline.get('time_ms', 0))}\n")
+        w(f"   Vocabulary Size: {index_baseline.get('vocabulary_size', 0)}\n")
     if embedding_opt:
-        lines.append(f"   Cache Size: {embedding_opt.get('cache_size', 0)} embeddings")
-        lines.append(f"   Cache Hits: {embedding_opt.get('cache_hits', 0)}")
-        lines.append(
-            f"   Avg Cache Retrieval: {format_ms(embedding_opt.get('avg_cache_retrieval_ms', 0))}"
-        )
-    lines.append("")
+        w(f"   Cache Size: {embedding_opt.get('cache_size', 0)} embeddings\n")
+        w(f"   Cache Hits: {embedding_opt.get('cache_hits', 0)}\n")
+        w(f"   Avg Cache Retrieval: {format_ms(embedding_opt.get('avg_cache_retrieval_ms', 0))}\n")
+    w("\n")
 
     # Tool Retrieval
-    tool_retrieval = find_result(baseline_results, "tool_retrieval")
+    tool_retrieval = baseline_idx.get("tool_retrieval", {})
     if tool_retrieval:
-        lines.append("4. Tool Retrieval Performance")
-        lines.append(f"   Mean: {format_ms(tool_retrieval.get('mean_ms', 0))}")
-        lines.append(f"   Median: {format_ms(tool_retrieval.get('median_ms', 0))}")
-        lines.append(f"   Iterations: {tool_retrieval.get('iterations', 0)}")
-        lines.append("")
+        w("4. Tool Retrieval Performance\n")
+        w(f"   Mean: {format_ms(tool_retrieval.get('mean_ms', 0))}\n")
+        w(f"   Median: {format_ms(tool_retrieval.get('median_ms', 0))}\n")
+        w(f"   Iterations: {tool_retrieval.get('iterations', 0)}\n")
+        w("\n")
 
     # Memory Footprint
-    memory = find_result(optimized_results, "memory_footprint")
+    memory = optimized_idx.get("memory_footprint", {})
     if memory:
-        lines.append("MEMORY ANALYSIS")
-        lines.append("-" * 70)
-        lines.append(f"Vocabulary Size: {memory.get('vocabulary_size', 0)} terms")
-        lines.append(f"Cached Embeddings: {memory.get('cached_embeddings', 0)}")
-        lines.append(f"Bytes per Embedding: {memory.get('bytes_per_embedding', 0)}")
-        lines.append(f"Total Embedding Cache: {memory.get('total_embedding_kb', 0):.2f} KB")
-        lines.append(f"Total Embedding Cache: {memory.get('total_embedding_mb', 0):.3f} MB")
-        lines.append("")
+        w("MEMORY ANALYSIS\n")
+        w("-" * 70 + "\n")
+        w(f"Vocabulary Size: {memory.get('vocabulary_size', 0)} terms\n")
+        w(f"Cached Embeddings: {memory.get('cached_embeddings', 0)}\n")
+        w(f"Bytes per Embedding: {memory.get('bytes_per_embedding', 0)}\n")
+        w(f"Total Embedding Cache: {memory.get('total_embedding_kb', 0):.2f} KB\n")
+        w(f"Total Embedding Cache: {memory.get('total_embedding_mb', 0):.3f} MB\n")
+        if "int8_bytes_per_embedding" in memory:
+            w(f"Bytes per Embedding (int8): {memory['int8_bytes_per_embedding']}\n")
+            w(f"Total Embedding Cache (int8): {memory.get('int8_total_embedding_kb', 0):.2f} KB\n")
+        w("\n")
 
     # Cache Hit Rates
-    lines.append("CACHE PERFORMANCE")
-    lines.append("-" * 70)
+    w("CACHE PERFORMANCE\n")
+    w("-" * 70 + "\n")
     if embedding_opt:
         cache_size = embedding_opt.get("cache_size", 0)
         cache_hits = embedding_opt.get("cache_hits", 0)
         hit_rate = (cache_hits / cache_size * 100) if cache_size > 0 else 0
-        lines.append(f"Embedding Cache Hit Rate: {hit_rate:.1f}%")
-        lines.append(
-            f"Cache Retrieval Time: {format_ms(embedding_opt.get('avg_cache_retrieval_ms', 0))}"
-        )
-    lines.append("")
+        w(f"Embedding Cache Hit Rate: {hit_rate:.1f}%\n")
+        w(f"Cache Retrieval Time: {format_ms(embedding_opt.get('avg_cache_retrieval_ms', 0))}\n")
+    w("\n")
 
     # Batch Operations
-    batch = find_result(optimized_results, "batch_vs_individual")
+    batch = optimized_idx.get("batch_vs_individual", {})
     if batch:
-        lines.append("BATCH OPERATIONS")
-        lines.append("-" * 70)
-        lines.append(f"Individual Operations (avg): {format_ms(batch.get('individual_avg_ms', 0))}")
-        lines.append(f"Batch Operations (total): {format_ms(batch.get('batch_total_ms', 0))}")
-        lines.append(f"Speedup: {batch.get('speedup', 0):.2f}x")
-        lines.append(f"Tool Count: {batch.get('tool_count', 0)}")
-        lines.append("")
+        w("BATCH OPERATIONS\n")
+        w("-" * 70 + "\n")
+        w(f"Individual Operations (avg): {format_ms(batch.get('individual_avg_ms', 0))}\n")
+        w(f"Batch Operations (total): {format_ms(batch.get('batch_total_ms', 0))}\n")
+        w(f"Speedup: {batch.get('speedup', 0):.2f}x\n")
+        w(f"Tool Count: {batch.get('tool_count', 0)}\n")
+        w("\n")
 
     # Optimization Gains
-    lines.append("OPTIMIZATION GAINS")
-    lines.append("-" * 70)
+    w("OPTIMIZATION GAINS\n")
+    w("-" * 70 + "\n")
     if summary and summary.get("key_findings"):
         for finding in summary["key_findings"]:
-            lines.append(f"  • {finding}")
-    lines.append("")
+            w(f"  • {finding}\n")
+    w("\n")
 
     # Performance Bottlenecks
-    lines.append("PERFORMANCE BOTTLENECKS IDENTIFIED")
-    lines.append("-" * 70)
+    w("PERFORMANCE BOTTLENECKS IDENTIFIED\n")
+    w("-" * 70 + "\n")
     bottlenecks = []
 
     if search_baseline:
@@ -201,15 +210,15 @@ def generate_summary():
             bottlenecks.append(f"Registry loading time ({format_ms(reg_time)}) could be optimized")
 
     if not bottlenecks:
-        lines.append("  • No significant bottlenecks detected")
+        w("  • No significant bottlenecks detected\n")
     else:
         for bottleneck in bottlenecks:
-            lines.append(f"  • {bottleneck}")
-    lines.append("")
+            w(f"  • {bottleneck}\n")
+    w("\n")
 
     # Recommendations
-    lines.append("RECOMMENDATIONS")
-    lines.append("-" * 70)
+    w("RECOMMENDATIONS\n")
+    w("-" * 70 + "\n")
     recommendations = []
 
     if memory and memory.get("total_embedding_mb", 0) < 1:
@@ -225,14 +234,14 @@ def generate_summary():
         recommendations.append("System performance is optimal")
     else:
         for rec in recommendations:
-            lines.append(f"  • {rec}")
-    lines.append("")
+            w(f"  • {rec}\n")
+    w("\n")
 
-    lines.append("=" * 70)
-    lines.append("End of Report")
-    lines.append("=" * 70)
+    w("=" * 70 + "\n")
+    w("End of Report\n")
+    w("=" * 70 + "\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
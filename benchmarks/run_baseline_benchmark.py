@@ -3,76 +3,315 @@
 Run baseline benchmarks and save results to JSON.
 """
 
-import json
-import statistics
+import argparse
+import gc
+import heapq
+import os
+import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+import numpy as np
+import orjson
+import yaml
+
 # Set up proper Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
 # Now import from the project
 from meta_mcp.registry.registry import ToolRegistry
-from meta_mcp.retrieval.search import SemanticSearch
+from meta_mcp.retrieval.search import SemanticSearch, _top_k_indices
+
+DEFAULT_TOOLS_YAML_PATH = "config/tools.yaml"
+
+SEARCH_QUERIES = [
+    "read files from disk",
+    "write data to storage",
+    "network operations",
+    "send email messages",
+    "list directory contents",
+]
+
+_format_float = "{:.3f}".format
+
+# Per-field formatters for the results printout; fields not listed print via str()
+FORMATTERS = dict.fromkeys(
+    (
+        "time_ms",
+        "cold_time_ms",
+        "warm_time_ms",
+        "yaml_parse_ms",
+        "yaml_cparse_ms",
+        "mean_ms",
+        "median_ms",
+        "p95_ms",
+        "p99_ms",
+        "min_ms",
+        "max_ms",
+        "batch_total_ms",
+        "per_query_ms",
+        "argpartition_mean_ms",
+        "argpartition_median_ms",
+        "heap_mean_ms",
+        "heap_median_ms",
+    ),
+    _format_float,
+)
+
+
+# Times importing the registry module plus a ToolRegistry.from_yaml() call in a
+# fresh interpreter. The import itself builds the default registry singleton,
+# which is the real first load, so the timer has to start before it.
+_COLD_LOAD_SCRIPT = """
+import sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+from meta_mcp.registry.registry import ToolRegistry
+ToolRegistry.from_yaml({path!r})
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _cold_registry_load_ms() -> float:
+    """Time the registry import and a load in a fresh Python process, in ms."""
+    script = _COLD_LOAD_SCRIPT.format(src=str(project_root / "src"), path=DEFAULT_TOOLS_YAML_PATH)
+    proc = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return float(proc.stdout.strip().splitlines()[-1])
 
 
 def benchmark_registry_loading() -> dict:
-    """Benchmark registry loading time."""
+    """
+    Benchmark registry loading time.
+
+    time_ms is the first load in this process, as before. cold_time_ms is
+    importing the registry module plus a load in a fresh interpreter, so
+    module imports and the default registry's first load are paid again
+    (the file itself may still be in the page cache).
+    warm_time_ms is a repeat load after reading the file once, which
+    isolates YAML parsing and model construction from disk I/O.
+    """
     start = time.perf_counter()
-    registry = ToolRegistry.from_yaml("config/tools.yaml")
+    registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
     elapsed = time.perf_counter() - start
 
-    return {
+    Path(DEFAULT_TOOLS_YAML_PATH).read_bytes()  # Ensure the file is in the page cache
+    start = time.perf_counter()
+    registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
+    warm_elapsed = time.perf_counter() - start
+
+    result = {
         "operation": "registry_loading",
         "time_ms": elapsed * 1000,
+        "cold_time_ms": _cold_registry_load_ms(),
+        "warm_time_ms": warm_elapsed * 1000,
         "tool_count": len(registry.get_all_summaries()),
     }
 
+    # Parse-only timings: pure-Python SafeLoader vs libyaml CSafeLoader
+    text = Path(DEFAULT_TOOLS_YAML_PATH).read_text()
+    start = time.perf_counter()
+    yaml.load(text, Loader=yaml.SafeLoader)
+    result["yaml_parse_ms"] = (time.perf_counter() - start) * 1000
+    if hasattr(yaml, "CSafeLoader"):
+        start = time.perf_counter()
+        yaml.load(text, Loader=yaml.CSafeLoader)
+        result["yaml_cparse_ms"] = (time.perf_counter() - start) * 1000
+
+    return result
+
+
+def _latency_stats(operation: str, times_ns: np.ndarray) -> dict:
+    """Summarize per-call latencies (in ns) into a result dict reported in ms."""
+    times = times_ns.astype(np.float64) / 1e6
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {
+        "operation": operation,
+        "mean_ms": float(times.mean()),
+        "median_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "min_ms": float(times.min()),
+        "max_ms": float(times.max()),
+        "iterations": len(times),
+    }
+
 
-def benchmark_search_latency(iterations: int = 100) -> dict:
-    """Benchmark search operation latency."""
-    registry = ToolRegistry.from_yaml("config/tools.yaml")
+def benchmark_search_latency(iterations: int = 100, registry: ToolRegistry | None = None) -> dict:
+    """Benchmark search scoring latency with query embeddings computed up front."""
+    if registry is None:
+        registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
     searcher = SemanticSearch(registry)
 
     # Warm up
     searcher.search("read files")
 
-    # Benchmark queries
-    queries = [
-        "read files from disk",
-        "write data to storage",
-        "network operations",
-        "send email messages",
-        "list directory contents",
-    ]
+    # Embed each query once so the timed loop only measures scoring
+    query_vecs = {query: searcher.embedder.embed_query(query) for query in SEARCH_QUERIES}
 
-    times = []
+    times_ns = np.empty(iterations * len(SEARCH_QUERIES), dtype=np.int64)
+    idx = 0
     for _ in range(iterations):
-        for query in queries:
-            start = time.perf_counter()
-            results = searcher.search(query, limit=10)
-            elapsed = time.perf_counter() - start
-            times.append(elapsed * 1000)
+        for query in SEARCH_QUERIES:
+            start = time.perf_counter_ns()
+            results = searcher.search_by_vector(query_vecs[query], limit=10)
+            times_ns[idx] = time.perf_counter_ns() - start
+            idx += 1
+
+    return _latency_stats("search_latency", times_ns)
+
+
+def benchmark_search_latency_cold(
+    iterations: int = 100, registry: ToolRegistry | None = None
+) -> dict:
+    """Benchmark end-to-end search latency, re-embedding the query on every call."""
+    if registry is None:
+        registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
+    searcher = SemanticSearch(registry)
 
+    # Warm up
+    searcher.search("read files")
+
+    times_ns = np.empty(iterations * len(SEARCH_QUERIES), dtype=np.int64)
+    idx = 0
+    for _ in range(iterations):
+        for query in SEARCH_QUERIES:
+            start = time.perf_counter_ns()
+            results = searcher.search(query, limit=10, use_cache=False)
+            times_ns[idx] = time.perf_counter_ns() - start
+            idx += 1
+
+    return _latency_stats("search_latency_cold", times_ns)
+
+
+def benchmark_batch_search_latency(
+    iterations: int = 100, limit: int = 10, registry: ToolRegistry | None = None
+) -> dict:
+    """Benchmark scoring all queries at once as a single matrix product."""
+    if registry is None:
+        registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
+    searcher = SemanticSearch(registry)
+    searcher._build_index()
+
+    queries = SEARCH_QUERIES
+    embedder = searcher.embedder
+    # Score against the float32 matrix search uses; as in benchmark_search_latency,
+    # the queries are embedded up front so only scoring and top-k are timed
+    tool_matrix, tool_ids = embedder.get_embedding_matrix()
+    query_matrix = np.array([embedder.embed_query(query) for query in queries], dtype=np.float32)
+    top_k = min(limit, len(tool_ids))
+
+    times_ns = np.empty(iterations, dtype=np.int64)
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        scores = query_matrix @ tool_matrix.T
+        _top_k_indices(scores, top_k)
+        times_ns[i] = time.perf_counter_ns() - start
+
+    batch_total_ms = float(times_ns.mean()) / 1e6
     return {
-        "operation": "search_latency",
-        "mean_ms": statistics.mean(times),
-        "median_ms": statistics.median(times),
-        "p95_ms": statistics.quantiles(times, n=20)[18],  # 95th percentile
-        "p99_ms": statistics.quantiles(times, n=100)[98],  # 99th percentile
-        "min_ms": min(times),
-        "max_ms": max(times),
-        "iterations": len(times),
+        "operation": "batch_search_latency",
+        "batch_total_ms": batch_total_ms,
+        "per_query_ms": batch_total_ms / len(queries),
+        "query_count": len(queries),
+        "tool_count": len(tool_ids),
+        "top_k": top_k,
+        "iterations": iterations,
+    }
+
+
+def benchmark_batch_search(
+    batch_sizes: tuple[int, ...] = (1, 8, 64, 256),
+    limit: int = 10,
+    registry: ToolRegistry | None = None,
+) -> dict:
+    """Benchmark SemanticSearch.batch_search throughput across batch sizes."""
+    if registry is None:
+        registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
+    searcher = SemanticSearch(registry)
+
+    # Warm up
+    searcher.batch_search(SEARCH_QUERIES, limit=limit)
+
+    batches = []
+    for batch_size in batch_sizes:
+        queries = [SEARCH_QUERIES[i % len(SEARCH_QUERIES)] for i in range(batch_size)]
+        start = time.perf_counter_ns()
+        searcher.batch_search(queries, limit=limit)
+        elapsed_ns = time.perf_counter_ns() - start
+
+        total_ms = elapsed_ns / 1e6
+        batches.append(
+            {
+                "batch_size": batch_size,
+                "batch_total_ms": total_ms,
+                "per_query_ms": total_ms / batch_size,
+                "queries_per_second": batch_size / (elapsed_ns / 1e9),
+            }
+        )
+
+    return {
+        "operation": "batch_search",
+        "limit": limit,
+        "tool_count": len(registry.get_all_summaries()),
+        "batches": batches,
     }
 
 
-def benchmark_index_building() -> dict:
+def benchmark_search_topk10(iterations: int = 1000, registry: ToolRegistry | None = None) -> dict:
+    """Benchmark top-10 selection: numpy partial selection vs a Python heap."""
+    if registry is None:
+        registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
+    searcher = SemanticSearch(registry)
+    searcher._build_index()
+
+    embedder = searcher.embedder
+    tool_matrix, tool_ids = embedder.get_embedding_matrix()
+    scores = tool_matrix @ np.array(embedder.embed_query(SEARCH_QUERIES[0]), dtype=np.float32)
+    score_list = scores.tolist()
+
+    clock = time.perf_counter_ns
+    numpy_ns = np.empty(iterations, dtype=np.int64)
+    heap_ns = np.empty(iterations, dtype=np.int64)
+    for i in range(iterations):
+        start = clock()
+        _top_k_indices(scores, 10)
+        numpy_ns[i] = clock() - start
+
+        start = clock()
+        heapq.nlargest(10, range(len(score_list)), key=score_list.__getitem__)
+        heap_ns[i] = clock() - start
+
+    numpy_ms = numpy_ns.astype(np.float64) / 1e6
+    heap_ms = heap_ns.astype(np.float64) / 1e6
+    return {
+        "operation": "search_topk10",
+        "argpartition_mean_ms": float(numpy_ms.mean()),
+        "argpartition_median_ms": float(np.median(numpy_ms)),
+        "heap_mean_ms": float(heap_ms.mean()),
+        "heap_median_ms": float(np.median(heap_ms)),
+        "tool_count": len(tool_ids),
+        "iterations": iterations,
+    }
+
+
+def benchmark_index_building(registry: ToolRegistry | None = None) -> dict:
     """Benchmark embedding index building time."""
-    registry = ToolRegistry.from_yaml("config/tools.yaml")
+    if registry is None:
+        registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
+    # SemanticSearch builds its index lazily, so the timed call below is the
+    # only build. Fail loudly if that ever changes rather than timing a no-op.
     searcher = SemanticSearch(registry)
+    if searcher._index_built:
+        msg = "SemanticSearch built its index on construction"
+        raise RuntimeError(msg)
 
     start = time.perf_counter()
     searcher._build_index()
@@ -85,9 +324,10 @@ def benchmark_index_building() -> dict:
     }
 
 
-def benchmark_tool_retrieval(iterations: int = 1000) -> dict:
+def benchmark_tool_retrieval(iterations: int = 1000, registry: ToolRegistry | None = None) -> dict:
     """Benchmark individual tool retrieval."""
-    registry = ToolRegistry.from_yaml("config/tools.yaml")
+    if registry is None:
+        registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
 
     # Get a sample tool ID
     tools = registry.get_all_summaries()
@@ -96,49 +336,142 @@ def benchmark_tool_retrieval(iterations: int = 1000) -> dict:
 
     tool_id = tools[0].tool_id
 
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        tool = registry.get(tool_id)
-        elapsed = time.perf_counter() - start
-        times.append(elapsed * 1000)
+    # Bind the lookup and clock once so the loop body is just the timed call
+    get = registry.get
+    clock = time.perf_counter_ns
+
+    times_ns = np.empty(iterations, dtype=np.int64)
+    for i in range(iterations):
+        start = clock()
+        get(tool_id)
+        times_ns[i] = clock() - start
+
+    times = times_ns.astype(np.float64) / 1e6
 
     return {
         "operation": "tool_retrieval",
-        "mean_ms": statistics.mean(times),
-        "median_ms": statistics.median(times),
+        "mean_ms": float(times.mean()),
+        "median_ms": float(np.median(times)),
         "iterations": iterations,
     }
 
 
-def run_baseline_benchmarks():
-    """Run all baseline benchmarks."""
+@contextmanager
+def pinned_cpu(cpu: int | None = None, enabled: bool = True):
+    """
+    Pin the process to a single CPU and raise its priority (best effort).
+
+    Keeps the scheduler from migrating the benchmark between cores, which
+    inflates tail latencies. A no-op where CPU affinity is unsupported
+    (macOS, Windows) or when disabled.
+    """
+    if not enabled or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {cpu if cpu in previous else max(previous)})
+    try:
+        os.nice(-5)
+        reniced = True
+    except OSError:
+        reniced = False  # Raising priority needs privileges; pinning still helps
+
+    try:
+        yield
+    finally:
+        if reniced:
+            os.nice(5)
+        os.sched_setaffinity(0, previous)
+
+
+@contextmanager
+def gc_paused():
+    """Disable the cyclic garbage collector so collections don't land in timed loops."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _run_isolated(bench, pin: bool = True) -> dict:
+    """Run a benchmark pinned to one CPU with the garbage collector paused."""
+    with pinned_cpu(enabled=pin), gc_paused():
+        return bench()
+
+
+def _collect_result(bench, run) -> dict:
+    """Run (or wait for) a benchmark, reporting progress and capturing failures."""
+    name = getattr(bench, "func", bench).__name__
+    print(f"Running {name}...", end=" ")
+    sys.stdout.flush()
+
+    try:
+        result = run()
+        print("DONE")
+        return result
+    except Exception as e:
+        print(f"FAILED: {e}")
+        return {"operation": "unknown", "error": str(e)}
+
+
+def print_result(result: dict) -> None:
+    """Print one benchmark result, formatting each field via FORMATTERS."""
+    print()
+    print(f"Operation: {result['operation']}")
+
+    if "error" in result:
+        print(f"  ERROR: {result['error']}")
+        return
+
+    for key, value in result.items():
+        if key != "operation":
+            print(f"  {key}: {FORMATTERS.get(key, str)(value)}")
+
+
+def run_baseline_benchmarks(parallel: bool = False, pin: bool = True):
+    """
+    Run all baseline benchmarks.
+
+    Args:
+        parallel: Run each benchmark in its own worker process. Faster
+            wall-clock, but the benchmarks contend for CPU, so use serial
+            mode for measurement-quality runs.
+        pin: Pin serial runs to a single CPU (ignored in parallel mode).
+    """
     print("=" * 60)
     print("MetaMCP+ Baseline Performance Benchmarks")
     print("=" * 60)
     print()
 
+    # Load the registry once and share it; only benchmark_registry_loading
+    # times a YAML load.
+    registry = ToolRegistry.from_yaml(DEFAULT_TOOLS_YAML_PATH)
+
+    # Partials rather than lambdas so they can be sent to worker processes.
     benchmarks = [
         benchmark_registry_loading,
-        benchmark_index_building,
-        lambda: benchmark_search_latency(iterations=20),
-        lambda: benchmark_tool_retrieval(iterations=1000),
+        partial(benchmark_index_building, registry=registry),
+        partial(benchmark_search_latency, iterations=20, registry=registry),
+        partial(benchmark_search_latency_cold, iterations=20, registry=registry),
+        partial(benchmark_batch_search_latency, iterations=20, registry=registry),
+        partial(benchmark_batch_search, registry=registry),
+        partial(benchmark_search_topk10, iterations=1000, registry=registry),
+        partial(benchmark_tool_retrieval, iterations=1000, registry=registry),
     ]
 
     results = []
-    for bench in benchmarks:
-        print(
-            f"Running {bench.__name__ if hasattr(bench, '__name__') else 'benchmark'}...", end=" "
-        )
-        sys.stdout.flush()
-
-        try:
-            result = bench()
-            results.append(result)
-            print("DONE")
-        except Exception as e:
-            print(f"FAILED: {e}")
-            results.append({"operation": "unknown", "error": str(e)})
+    if parallel:
+        with ProcessPoolExecutor(max_workers=len(benchmarks)) as executor:
+            futures = [executor.submit(_run_isolated, bench, pin=False) for bench in benchmarks]
+            for bench, future in zip(benchmarks, futures, strict=True):
+                results.append(_collect_result(bench, future.result))
+    else:
+        for bench in benchmarks:
+            results.append(_collect_result(bench, partial(_run_isolated, bench, pin=pin)))
 
     print()
     print("=" * 60)
@@ -146,21 +479,7 @@ def run_baseline_benchmarks():
     print("=" * 60)
 
     for result in results:
-        print()
-        print(f"Operation: {result['operation']}")
-
-        if "error" in result:
-            print(f"  ERROR: {result['error']}")
-            continue
-
-        for key, value in result.items():
-            if key == "operation":
-                continue
-
-            if isinstance(value, float):
-                print(f"  {key}: {value:.3f}")
-            else:
-                print(f"  {key}: {value}")
+        print_result(result)
 
     print()
     print("=" * 60)
@@ -169,9 +488,22 @@ def run_baseline_benchmarks():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run benchmarks concurrently in worker processes (noisier timings)",
+    )
+    parser.add_argument(
+        "--no-pin",
+        action="store_true",
+        help="Don't pin the benchmark process to a single CPU",
+    )
+    args = parser.parse_args()
+
     try:
         print("Running baseline benchmarks...")
-        results = run_baseline_benchmarks()
+        results = run_baseline_benchmarks(parallel=args.parallel, pin=not args.no_pin)
 
         # Add timestamp
         output = {
@@ -182,8 +514,9 @@ if __name__ == "__main__":
 
         # Save to JSON
         output_path = project_root / "benchmarks" / "baseline_results.json"
-        with open(output_path, "w") as f:
-            json.dump(output, f, indent=2)
+        output_path.write_bytes(
+            orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
 
         print(f"\nResults saved to: {output_path}")
 
@@ -202,7 +535,8 @@ if __name__ == "__main__":
         }
 
         output_path = project_root / "benchmarks" / "baseline_results.json"
-        with open(output_path, "w") as f:
-            json.dump(error_output, f, indent=2)
+        output_path.write_bytes(
+            orjson.dumps(error_output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
 
         sys.exit(1)
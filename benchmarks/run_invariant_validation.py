@@ -3,10 +3,13 @@
 Run invariant validation and save results to text file.
 """
 
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 # Set up proper Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
@@ -15,6 +18,9 @@ sys.path.insert(0, str(project_root / "src"))
 from meta_mcp.registry.registry import ToolRegistry
 from meta_mcp.retrieval.search import SemanticSearch
 
+# Keywords suggesting a tool is dangerous; one case-insensitive pattern scans each text once
+DANGEROUS_KEYWORDS_RE = re.compile(r"execute|shell|command|admin", re.IGNORECASE)
+
 
 class InvariantValidator:
     """Validate system invariants."""
@@ -41,6 +47,24 @@ class InvariantValidator:
             else:
                 self.warnings.append(message)
 
+    def check_each(self, passed, message: str, critical: bool = True, **columns):
+        """
+        Check an invariant for every row of a vectorized result.
+
+        Records one check per row; only failing rows are formatted.
+
+        Args:
+            passed: Boolean array, one entry per row
+            message: Format string for a failing row, filled from columns
+            critical: If True, failure is critical; if False, it's a warning
+            **columns: Arrays aligned with passed, used to fill message
+        """
+        self.checks += len(passed)
+
+        target = self.failures if critical else self.warnings
+        for i in np.flatnonzero(~passed).tolist():
+            target.append(message.format(**{name: col[i] for name, col in columns.items()}))
+
     def report(self) -> bool:
         """
         Print validation report.
@@ -82,42 +106,50 @@ class InvariantValidator:
         return False
 
 
-def validate_registry_invariants(validator: InvariantValidator):
+def _first_duplicate(values):
+    """Return the first value seen twice, or None; stops at the first repeat."""
+    seen = set()
+    add = seen.add
+    for value in values:
+        if value in seen:
+            return value
+        add(value)
+    return None
+
+
+def validate_registry_invariants(validator: InvariantValidator, registry: ToolRegistry):
     """Validate tool registry invariants."""
     print("Validating registry invariants...")
 
-    try:
-        registry = ToolRegistry.from_yaml("config/tools.yaml")
-    except Exception as e:
-        validator.check(False, f"Failed to load registry: {e}")
-        return
-
-    tools = registry.get_all_summaries()
+    # Columnar view: the per-tool checks below run as vectorized array operations
+    columns = registry.get_summary_columns()
+    tool_ids = columns["tool_id"]
 
     # Check: At least one tool exists
-    validator.check(len(tools) > 0, "Registry must contain at least one tool")
+    validator.check(len(tool_ids) > 0, "Registry must contain at least one tool")
 
     # Check: All tool IDs are unique
-    tool_ids = [tool.tool_id for tool in tools]
-    validator.check(len(tool_ids) == len(set(tool_ids)), "All tool IDs must be unique")
+    duplicate = _first_duplicate(tool_ids.tolist())
+    validator.check(duplicate is None, f"All tool IDs must be unique (duplicate: {duplicate})")
 
     # Check: All tools have valid risk levels
-    valid_risks = {"safe", "sensitive", "dangerous"}
-    for tool in tools:
-        validator.check(
-            tool.risk_level in valid_risks,
-            f"Tool {tool.tool_id} has invalid risk level: {tool.risk_level}",
-        )
+    valid_risks = ["safe", "sensitive", "dangerous"]
+    validator.check_each(
+        np.isin(columns["risk_level"], valid_risks),
+        "Tool {tool_id} has invalid risk level: {risk_level}",
+        tool_id=tool_ids,
+        risk_level=columns["risk_level"],
+    )
 
     # Check: All tools have non-empty descriptions
-    for tool in tools:
-        validator.check(
-            len(tool.description_1line) > 0, f"Tool {tool.tool_id} has empty description_1line"
-        )
+    validator.check_each(
+        np.char.str_len(columns["description_1line"]) > 0,
+        "Tool {tool_id} has empty description_1line",
+        tool_id=tool_ids,
+    )
 
     # Check: All tools have at least one tag
-    for tool in tools:
-        validator.check(len(tool.tags) > 0, f"Tool {tool.tool_id} has no tags")
+    validator.check_each(columns["tag_count"] > 0, "Tool {tool_id} has no tags", tool_id=tool_ids)
 
     # Check: Bootstrap tools exist
     bootstrap_tools = registry.get_bootstrap_tools()
@@ -127,21 +159,10 @@ def validate_registry_invariants(validator: InvariantValidator):
     )
 
 
-def validate_search_invariants(validator: InvariantValidator):
+def validate_search_invariants(validator: InvariantValidator, searcher: SemanticSearch):
     """Validate semantic search invariants."""
     print("Validating search invariants...")
 
-    registry = ToolRegistry.from_yaml("config/tools.yaml")
-    searcher = SemanticSearch(registry)
-
-    # Check: Index builds successfully
-    try:
-        searcher._build_index()
-        validator.check(True, "Embedding index built successfully")
-    except Exception as e:
-        validator.check(False, f"Failed to build embedding index: {e}")
-        return
-
     # Check: Search returns results
     test_queries = ["read files", "write data", "network operations"]
 
@@ -168,52 +189,55 @@ def validate_search_invariants(validator: InvariantValidator):
         )
 
 
-def validate_embedding_invariants(validator: InvariantValidator):
+def validate_embedding_invariants(validator: InvariantValidator, searcher: SemanticSearch):
     """Validate embedding invariants."""
     print("Validating embedding invariants...")
 
-    registry = ToolRegistry.from_yaml("config/tools.yaml")
-    searcher = SemanticSearch(registry)
-    searcher._build_index()
-
+    registry = searcher.registry
     tools = registry.get_all_summaries()
 
-    # Check: All tools have embeddings
-    for tool in tools:
-        embedding = searcher.embedder.get_cached_embedding(tool.tool_id)
-        validator.check(embedding is not None, f"Tool {tool.tool_id} has no embedding")
+    # Check: Embedding dimension consistency (stacking fails on ragged rows)
+    try:
+        matrix, tool_ids = searcher.embedder.get_embedding_matrix()
+    except ValueError:
+        validator.check(False, "Tools have inconsistent embedding dimensions")
+        return
+    validator.check(
+        matrix.shape[1] == len(searcher.embedder._vocabulary),
+        "Embedding dimension must match vocabulary size",
+    )
 
-    # Check: Embeddings are normalized (unit length)
+    # Check: All tools have embeddings
+    embedded = set(tool_ids)
     for tool in tools:
-        embedding = searcher.embedder.get_cached_embedding(tool.tool_id)
-        if embedding:
-            magnitude = sum(x * x for x in embedding) ** 0.5
-            validator.check(
-                abs(magnitude - 1.0) < 0.01,  # Allow small floating point error
-                f"Tool {tool.tool_id} embedding not normalized (magnitude={magnitude:.3f})",
-                critical=False,
-            )
+        validator.check(tool.tool_id in embedded, f"Tool {tool.tool_id} has no embedding")
 
-    # Check: Embedding dimension consistency
-    if tools:
-        first_embedding = searcher.embedder.get_cached_embedding(tools[0].tool_id)
-        expected_dim = len(first_embedding) if first_embedding else 0
+    # Check: Embeddings are normalized (unit length), in one vectorized pass
+    magnitudes = np.linalg.norm(matrix, axis=1)
+    normalized = np.abs(magnitudes - 1.0) < 0.01  # Allow small floating point error
+    for tool_id, magnitude, ok in zip(tool_ids, magnitudes.tolist(), normalized.tolist()):
+        validator.check(
+            ok,
+            f"Tool {tool_id} embedding not normalized (magnitude={magnitude:.3f})",
+            critical=False,
+        )
 
-        for tool in tools[1:]:
-            embedding = searcher.embedder.get_cached_embedding(tool.tool_id)
-            if embedding:
-                validator.check(
-                    len(embedding) == expected_dim,
-                    f"Tool {tool.tool_id} has inconsistent embedding dimension",
-                )
+    # Check: int8-quantized embeddings dequantize to within 1e-2 of the float values
+    quantized, scales = searcher.embedder.get_int8_matrix()
+    if matrix.size:
+        max_error = float(np.abs(quantized * scales[:, None] - matrix).max())
+        validator.check(
+            max_error < 1e-2,
+            f"int8 embedding dequantization error too large ({max_error:.4f})",
+            critical=False,
+        )
 
 
-def validate_security_properties(validator: InvariantValidator):
+def validate_security_properties(validator: InvariantValidator, searcher: SemanticSearch):
     """Validate security-related invariants."""
     print("Validating security properties...")
 
-    registry = ToolRegistry.from_yaml("config/tools.yaml")
-    searcher = SemanticSearch(registry)
+    registry = searcher.registry
 
     # Check: Search results don't leak schemas
     results = searcher.search("operations", limit=10)
@@ -230,15 +254,9 @@ def validate_security_properties(validator: InvariantValidator):
 
     # Check: Dangerous tools are marked correctly
     tools = registry.get_all_summaries()
-    dangerous_keywords = ["execute", "shell", "command", "admin"]
 
     for tool in tools:
-        has_dangerous_keyword = any(
-            kw in tool.tool_id.lower() or kw in tool.description_1line.lower()
-            for kw in dangerous_keywords
-        )
-
-        if has_dangerous_keyword:
+        if DANGEROUS_KEYWORDS_RE.search(f"{tool.tool_id}\n{tool.description_1line}"):
             validator.check(
                 tool.risk_level in ["sensitive", "dangerous"],
                 f"Tool {tool.tool_id} appears dangerous but has risk_level={tool.risk_level}",
@@ -250,44 +268,61 @@ def main():
     """Run all invariant validations."""
     validator = InvariantValidator()
 
-    validate_registry_invariants(validator)
-    validate_search_invariants(validator)
-    validate_embedding_invariants(validator)
-    validate_security_properties(validator)
+    # Load the registry and build the index once; every validation shares them
+    try:
+        registry = ToolRegistry.from_yaml("config/tools.yaml")
+    except Exception as e:
+        validator.check(False, f"Failed to load registry: {e}")
+        registry = None
+
+    if registry is not None:
+        validate_registry_invariants(validator, registry)
+
+        searcher = SemanticSearch(registry)
+        # Check: Index builds successfully
+        try:
+            searcher._build_index()
+            validator.check(True, "Embedding index built successfully")
+        except Exception as e:
+            validator.check(False, f"Failed to build embedding index: {e}")
+        else:
+            validate_search_invariants(validator, searcher)
+            validate_embedding_invariants(validator, searcher)
+            validate_security_properties(validator, searcher)
 
     success = validator.report()
 
     # Save report to file
     output_path = project_root / "benchmarks" / "invariant_validation.txt"
 
-    # Capture the report in text format
-    with open(output_path, "w") as f:
-        f.write("MetaMCP+ Invariant Validation Report\n")
-        f.write(f"Generated: {datetime.now().isoformat()}\n")
-        f.write("=" * 60 + "\n\n")
-
-        f.write(f"Total checks: {validator.checks}\n")
-        f.write(f"Failures: {len(validator.failures)}\n")
-        f.write(f"Warnings: {len(validator.warnings)}\n\n")
-
-        if validator.failures:
-            f.write("CRITICAL FAILURES:\n")
-            for i, failure in enumerate(validator.failures, 1):
-                f.write(f"  {i}. {failure}\n")
-            f.write("\n")
-
-        if validator.warnings:
-            f.write("WARNINGS:\n")
-            for i, warning in enumerate(validator.warnings, 1):
-                f.write(f"  {i}. {warning}\n")
-            f.write("\n")
-
-        if not validator.failures and not validator.warnings:
-            f.write("✅ All invariants validated successfully!\n")
-        elif not validator.failures:
-            f.write("⚠️  All critical checks passed, but warnings exist\n")
-        else:
-            f.write("❌ Critical invariant violations detected!\n")
+    # Capture the report in text format and write it in one call
+    lines = [
+        "MetaMCP+ Invariant Validation Report",
+        f"Generated: {datetime.now().isoformat()}",
+        "=" * 60,
+        "",
+        f"Total checks: {validator.checks}",
+        f"Failures: {len(validator.failures)}",
+        f"Warnings: {len(validator.warnings)}",
+        "",
+    ]
+    for title, messages in (
+        ("CRITICAL FAILURES:", validator.failures),
+        ("WARNINGS:", validator.warnings),
+    ):
+        if messages:
+            lines.append(title)
+            lines.extend(f"  {i}. {message}" for i, message in enumerate(messages, 1))
+            lines.append("")
+
+    if not validator.failures and not validator.warnings:
+        lines.append("✅ All invariants validated successfully!")
+    elif not validator.failures:
+        lines.append("⚠️  All critical checks passed, but warnings exist")
+    else:
+        lines.append("❌ Critical invariant violations detected!")
+
+    output_path.write_text("\n".join(lines) + "\n")
 
     print(f"\nReport saved to: {output_path}")
 
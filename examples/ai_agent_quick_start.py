@@ -98,6 +98,17 @@ async def example_single_agent():
     print(markdown[:500] + "...\n")
 
 
+def _describe_agent(config, agent_class) -> dict:
+    """Collect one agent's model metadata."""
+    # Only metadata is shown, so read it from config instead of building the agent
+    model_config = config.get_model_config(agent_class.agent_role)
+    return {
+        "model": model_config.model,
+        "provider": model_config.provider,
+        "prompt_length": len(agent_class.SYSTEM_PROMPT),
+    }
+
+
 async def example_all_agents():
     """Example: Run all agents on a PR."""
     print("=" * 80)
@@ -105,6 +116,9 @@ async def example_all_agents():
     print("=" * 80)
     print()
     
+    from scripts.agents.llm_config import get_config
+    
+    config = get_config()
     agents = [
         ("Validator", LLMValidationAgent),
         ("Remediator", LLMRemediationAgent),
@@ -112,20 +126,13 @@ async def example_all_agents():
         ("Verifier", LLMFunctionalVerifier),
     ]
     
-    results = {}
+    results = {name: _describe_agent(config, agent_class) for name, agent_class in agents}
     
-    for name, agent_class in agents:
+    for name, info in results.items():
         print(f"\n--- {name} Agent ---")
-        agent = agent_class(dry_run=True)
-        print(f"Model: {agent.model_config.model}")
-        print(f"Provider: {agent.model_config.provider}")
-        print(f"System Prompt: {len(agent.system_prompt)} characters")
-        
-        # Each agent would analyze the PR and return results
-        results[name] = {
-            "model": agent.model_config.model,
-            "provider": agent.model_config.provider,
-        }
+        print(f"Model: {info['model']}")
+        print(f"Provider: {info['provider']}")
+        print(f"System Prompt: {info['prompt_length']} characters")
     
     print("\n" + "=" * 80)
     print("Summary of All Agents")
@@ -150,26 +157,24 @@ async def example_with_api_keys():
     
     print("Checking for required API keys:\n")
     
-    all_set = True
+    # Empty values count as missing, as the agents would get no usable key
+    missing = [key for key in required_keys if not os.environ.get(key)]
+    
     for key, description in required_keys.items():
-        is_set = os.environ.get(key) is not None
-        status = "✅ Set" if is_set else "❌ Not Set"
+        status = "❌ Not Set" if key in missing else "✅ Set"
         print(f"{status} - {key}")
         print(f"         Used by: {description}")
-        if not is_set:
-            all_set = False
     
     print()
-    if all_set:
+    if not missing:
         print("✅ All API keys are configured!")
         print("You can run agents with real API calls.")
     else:
         print("⚠️  Some API keys are missing.")
         print("To run agents with real LLM calls, set the missing API keys:")
         print()
-        for key, description in required_keys.items():
-            if not os.environ.get(key):
-                print(f"  export {key}='your-api-key-here'")
+        for key in missing:
+            print(f"  export {key}='your-api-key-here'")
         print()
         print("For GitHub Actions, add these as repository secrets.")
 
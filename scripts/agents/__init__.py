@@ -1,21 +1,41 @@
 """AI agents for PR validation and auto-remediation."""
 
+import importlib
+import importlib.util
+
+# Exports are imported on first attribute access (PEP 562), so importing the
+# package only pays for the agents a caller actually uses.
+
 # Legacy workflow agents (test runners, git operations)
-from . import validation_agent
-from . import remediation_agent
-from . import architectural_guardian
-from . import functional_verifier
-from . import meta_pr_creator
-from . import generate_summary
-
-# New LLM-based agents
-from .llm_config import AgentRole, AgentConfig, get_config
-from .llm_client import LLMClient, ChatMessage, ChatResponse
-from .llm_base_agent import BaseAgent, AgentOutput
-from .llm_validation_agent import LLMValidationAgent
-from .llm_remediation_agent import LLMRemediationAgent
-from .llm_architectural_guardian import LLMArchitecturalGuardian
-from .llm_functional_verifier import LLMFunctionalVerifier
+_LAZY_MODULES = frozenset(
+    {
+        "validation_agent",
+        "remediation_agent",
+        "architectural_guardian",
+        "functional_verifier",
+        "meta_pr_creator",
+        "generate_summary",
+    }
+)
+
+# New LLM-based agents: exported name -> defining submodule
+_LAZY_ATTRS = {
+    "AgentRole": ".llm_config",
+    "AgentConfig": ".llm_config",
+    "get_config": ".llm_config",
+    "LLMClient": ".llm_client",
+    "ChatMessage": ".llm_client",
+    "ChatResponse": ".llm_client",
+    "BaseAgent": ".llm_base_agent",
+    "AgentOutput": ".llm_base_agent",
+    "LLMValidationAgent": ".llm_validation_agent",
+    "LLMRemediationAgent": ".llm_remediation_agent",
+    "LLMArchitecturalGuardian": ".llm_architectural_guardian",
+    "LLMFunctionalVerifier": ".llm_functional_verifier",
+}
+
+# LLM agents need PyYAML (config) and httpx (client); probe without importing them
+_LLM_AVAILABLE = all(importlib.util.find_spec(dep) is not None for dep in ("yaml", "httpx"))
 
 __all__ = [
     # Legacy agents
@@ -25,17 +45,38 @@ __all__ = [
     "functional_verifier",
     "meta_pr_creator",
     "generate_summary",
-    # LLM agents
-    "AgentRole",
-    "AgentConfig",
-    "get_config",
-    "LLMClient",
-    "ChatMessage",
-    "ChatResponse",
-    "BaseAgent",
-    "AgentOutput",
-    "LLMValidationAgent",
-    "LLMRemediationAgent",
-    "LLMArchitecturalGuardian",
-    "LLMFunctionalVerifier",
 ]
+
+if _LLM_AVAILABLE:
+    __all__ += [
+        # LLM agents
+        "AgentRole",
+        "AgentConfig",
+        "get_config",
+        "LLMClient",
+        "ChatMessage",
+        "ChatResponse",
+        "BaseAgent",
+        "AgentOutput",
+        "LLMValidationAgent",
+        "LLMRemediationAgent",
+        "LLMArchitecturalGuardian",
+        "LLMFunctionalVerifier",
+    ]
+
+
+def __getattr__(name: str):
+    """Import an exported agent module or symbol on first access and cache it."""
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -16,19 +16,96 @@ Classification:
 Output: reports/architectural_analysis.json
 """
 
+import os
 import sys
-import json
 import argparse
+import contextlib
+import functools
+import io
+import json
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Set
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple, Union
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from scripts.agents.utils.github_client import GitHubClient
 from scripts.agents.utils.git_operations import GitOperations
-from scripts.agents.utils.ast_analyzer import ASTAnalyzer
+from scripts.agents.utils.ast_analyzer import (
+    AnalysisCache,
+    ASTAnalyzer,
+    CodeAnalysis,
+    default_analysis_cache_dir,
+)
+
+# Vendored, generated and fixture code isn't part of the project's API surface
+IGNORED_PREFIXES = ("vendor/", "build/", ".tox/", "tests/fixtures/")
+
+# A detected change: (kind, file_path, function name, change descriptions).
+# Changes are only rendered as text when a verdict is serialized.
+SignatureChange = Tuple[str, str, str, Tuple[str, ...]]
+
+_CHANGE_FORMATS = {
+    "removed": "Function removed: {0}::{1}",
+    "breaking": "Breaking change in {0}::{1}: {2}",
+    "behavioral": "Behavioral change in {0}::{1}: {2}",
+    "added": "New public function: {0}::{1}",
+}
+
+# details entries that hold per-file signature changes
+_CHANGE_CATEGORIES = ("api_changes", "tool_changes", "governance_changes")
+
+
+def _format_changes(changes: List[SignatureChange]) -> List[str]:
+    """Render signature changes as report lines."""
+    return [
+        _CHANGE_FORMATS[kind].format(file_path, func_name, ", ".join(descriptions))
+        for kind, file_path, func_name, descriptions in changes
+    ]
+
+
+def _format_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy details with every recorded signature change rendered as text."""
+    formatted = dict(details)
+    rendered = {}  # id(entry) -> rendered entry, for entries shared by categories
+    
+    for category in _CHANGE_CATEGORIES:
+        entries = formatted.get(category)
+        if not entries:
+            continue
+        
+        formatted[category] = []
+        for entry in entries:
+            if id(entry) not in rendered:
+                rendered[id(entry)] = {
+                    "file": entry["file"],
+                    "changes": {
+                        kind: _format_changes(changes)
+                        for kind, changes in entry["changes"].items()
+                    },
+                }
+            formatted[category].append(rendered[id(entry)])
+    
+    return formatted
+
+
+# Analyzer used by process pool workers; created once per worker process
+# (analyze_source doesn't depend on the repository path)
+_WORKER_ANALYZER = ASTAnalyzer()
+
+
+def _parse_source(source: bytes, file_path: str) -> CodeAnalysis:
+    """Parse one source file (module-level so process pool workers can pickle it)."""
+    return _WORKER_ANALYZER.analyze_source(source, file_path)
 
 
 @dataclass
@@ -39,20 +116,89 @@ class ArchitecturalVerdict:
     title: str
     architectural_verdict: str  # SAFE, REVIEW, REJECT
     change_classification: str  # bug_fix, refactor, feature, etc.
-    breaking_changes: List[str]
-    behavioral_changes: List[str]
+    breaking_changes: List[SignatureChange]
+    behavioral_changes: List[SignatureChange]
     risk_level: str  # low, medium, high
     recommendation: str  # APPROVE, REVIEW, REJECT
     details: Dict[str, Any]
     
     def to_dict(self):
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary, rendering signature changes as text."""
+        return {
+            "pr_number": self.pr_number,
+            "title": self.title,
+            "architectural_verdict": self.architectural_verdict,
+            "change_classification": self.change_classification,
+            "breaking_changes": _format_changes(self.breaking_changes),
+            "behavioral_changes": _format_changes(self.behavioral_changes),
+            "risk_level": self.risk_level,
+            "recommendation": self.recommendation,
+            "details": _format_details(self.details),
+        }
 
 
 class ArchitecturalGuardian:
     """Architectural guardian agent."""
     
+    # Title keywords by classification. The lookahead reports every keyword
+    # occurrence (overlapping ones included) in a single scan of the title.
+    TITLE_KEYWORDS_RE = re.compile(
+        r"(?=(?P<bug_fix>fix|bug|patch|correct)"
+        r"|(?P<refactor>refactor|reorganize|restructure)"
+        r"|(?P<feature>feat|add|new)"
+        r"|(?P<performance>perf|optimize)"
+        r"|(?P<documentation>doc)"
+        r"|(?P<test>test))",
+        re.IGNORECASE,
+    )
+    
+    # Uncached source bytes to parse inline before starting the parse pool.
+    # analyze_source() handles roughly 3-4 MB/s and a forkserver pool takes
+    # about 0.4 s to start, so smaller runs finish sooner without one.
+    PARALLEL_PARSE_MIN_BYTES = 2 * 1024 * 1024
+    
+    # Path keywords that put a file's changes under details["<category>_changes"]
+    PATH_CATEGORIES_RE = re.compile(
+        r"(?=(?P<api>api|tool)|(?P<governance>governance|middleware))"
+    )
+    
+    # Verdict per classification: (without behavioral changes, with them).
+    # Any breaking change means REJECT regardless of classification.
+    VERDICTS = {
+        "bug_fix": ("SAFE", "REVIEW"),
+        "documentation": ("SAFE", "REVIEW"),
+        "test": ("SAFE", "REVIEW"),
+        "internal_refactor": ("SAFE", "REVIEW"),
+        "refactor": ("REVIEW", "REVIEW"),
+        "performance": ("REVIEW", "REVIEW"),
+        "feature": ("REJECT", "REJECT"),  # Per requirements: reject new features
+        "breaking_change": ("SAFE", "REVIEW"),
+        "unknown": ("SAFE", "REVIEW"),
+    }
+    
+    # Baseline risk per classification, before looking at the changes themselves
+    CLASSIFICATION_RISK = {
+        "feature": "high",
+        "refactor": "medium",
+        "performance": "medium",
+    }
+    
+    # Recommendation per (verdict, risk level) for PRs that aren't rejected;
+    # anything not listed needs manual review
+    RECOMMENDATIONS = {
+        ("SAFE", "low"): "APPROVE",
+    }
+    
+    # When a title matches several classifications, the first listed wins
+    TITLE_CLASSIFICATIONS = (
+        "bug_fix",
+        "refactor",
+        "feature",
+        "performance",
+        "documentation",
+        "test",
+    )
+    
     def __init__(self, repo_path: str = ".", github_token: str = None):
         """
         Initialize architectural guardian.
@@ -65,10 +211,21 @@ class ArchitecturalGuardian:
         self.github = GitHubClient(token=github_token)
         self.git = GitOperations(repo_path=repo_path)
         self.ast_analyzer = ASTAnalyzer(repo_path=repo_path)
-        self.original_branch = None
         
-        # Cache for file contents to avoid repeated git operations
-        self._file_cache = {}
+        # Base-ref file contents by (ref, path), shared by PRs against the same
+        # base; bounded so long PR batches don't grow memory without limit. Head
+        # contents are read once per PR, so they bypass the cache.
+        self._get_base_content = functools.lru_cache(maxsize=512)(self._read_file_content)
+        self._cat_file = None
+        
+        # Parse worker pool, shared by every PR in a run once enough source
+        # has been parsed inline; see PARALLEL_PARSE_MIN_BYTES
+        self._executor = None
+        self._inline_parse_bytes = 0
+        
+        # Parsed analyses persist across runs in the user cache dir, keyed by
+        # content hash
+        self.analysis_cache = AnalysisCache(default_analysis_cache_dir())
     
     def analyze_prs(self, validation_results: Dict[str, Any]) -> List[ArchitecturalVerdict]:
         """
@@ -80,14 +237,23 @@ class ArchitecturalGuardian:
         Returns:
             List of ArchitecturalVerdict objects
         """
+        return list(self.iter_verdicts(validation_results))
+    
+    def iter_verdicts(self, validation_results: Dict[str, Any]) -> Iterator[ArchitecturalVerdict]:
+        """
+        Analyze PRs for architectural changes, yielding each verdict as it completes.
+        
+        Args:
+            validation_results: Validation results dictionary
+            
+        Yields:
+            ArchitecturalVerdict objects
+        """
         print("=" * 80)
         print("🏛️  ARCHITECTURAL GUARDIAN - Analyzing PRs")
         print("=" * 80)
         print()
         
-        # Save original branch
-        self.original_branch = self.git.get_current_branch()
-        
         # Get passing PRs (only analyze those that could be merged)
         results = validation_results.get("results", [])
         passing_prs = [r for r in results if r["status"] == "PASS"]
@@ -96,67 +262,85 @@ class ArchitecturalGuardian:
         print()
         
         # Analyze each PR
-        verdicts = []
+        counts = {"SAFE": 0, "REVIEW": 0, "REJECT": 0}
         for i, pr_result in enumerate(passing_prs, 1):
-            pr_number = pr_result["pr_number"]
-            print(f"[{i}/{len(passing_prs)}] Analyzing PR #{pr_number}: {pr_result['title']}")
-            print("-" * 80)
-            
-            try:
-                verdict = self.analyze_pr(pr_result)
-                verdicts.append(verdict)
-                
-                emoji = {"SAFE": "✅", "REVIEW": "⚠️", "REJECT": "❌"}
-                status_emoji = emoji.get(verdict.architectural_verdict, "❓")
-                print(f"{status_emoji} PR #{pr_number}: {verdict.architectural_verdict} ({verdict.risk_level} risk)")
-                print(f"   Classification: {verdict.change_classification}")
-                print(f"   Recommendation: {verdict.recommendation}")
-                
-                if verdict.breaking_changes:
-                    print(f"   Breaking changes: {len(verdict.breaking_changes)}")
-                
-                if verdict.behavioral_changes:
-                    print(f"   Behavioral changes: {len(verdict.behavioral_changes)}")
-                
-            except Exception as e:
-                print(f"❌ Error analyzing PR #{pr_number}: {e}")
-                
-                verdict = ArchitecturalVerdict(
-                    pr_number=pr_number,
-                    title=pr_result["title"],
-                    architectural_verdict="REVIEW",
-                    change_classification="unknown",
-                    breaking_changes=[],
-                    behavioral_changes=[],
-                    risk_level="unknown",
-                    recommendation="MANUAL_REVIEW",
-                    details={"error": str(e)},
-                )
-                verdicts.append(verdict)
+            # Buffer the PR's report so it reaches stdout in a single write
+            report = io.StringIO()
+            with contextlib.redirect_stdout(report):
+                verdict = self._analyze_and_report(pr_result, f"{i}/{len(passing_prs)}")
+            sys.stdout.write(report.getvalue())
+            sys.stdout.flush()
             
-            print()
+            counts[verdict.architectural_verdict] = counts.get(verdict.architectural_verdict, 0) + 1
+            yield verdict
         
-        # Return to original branch
-        print(f"Returning to original branch: {self.original_branch}")
-        self.git.checkout(self.original_branch)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
         
-        print()
         print("=" * 80)
         print("🏁 ARCHITECTURAL ANALYSIS COMPLETE")
         print("=" * 80)
         
         # Print summary
-        safe = sum(1 for v in verdicts if v.architectural_verdict == "SAFE")
-        review = sum(1 for v in verdicts if v.architectural_verdict == "REVIEW")
-        reject = sum(1 for v in verdicts if v.architectural_verdict == "REJECT")
-        
-        print(f"Total PRs analyzed: {len(verdicts)}")
-        print(f"Safe: {safe}")
-        print(f"Review: {review}")
-        print(f"Reject: {reject}")
+        print(f"Total PRs analyzed: {sum(counts.values())}")
+        print(f"Safe: {counts['SAFE']}")
+        print(f"Review: {counts['REVIEW']}")
+        print(f"Reject: {counts['REJECT']}")
+        print(f"AST cache: {self.analysis_cache.hits} hits, {self.analysis_cache.misses} misses")
+        file_cache = self._get_base_content.cache_info()
+        print(f"Base file cache: {file_cache.hits} hits, {file_cache.misses} misses")
+        print()
+    
+    def _analyze_and_report(self, pr_result: Dict[str, Any], position: str) -> ArchitecturalVerdict:
+        """
+        Analyze a single PR and print its report (a failed analysis yields a
+        manual review verdict).
+        
+        Args:
+            pr_result: PR validation result dictionary
+            position: Progress label, e.g. "2/5"
+            
+        Returns:
+            ArchitecturalVerdict object
+        """
+        pr_number = pr_result["pr_number"]
+        print(f"[{position}] Analyzing PR #{pr_number}: {pr_result['title']}")
+        print("-" * 80)
+        
+        try:
+            verdict = self.analyze_pr(pr_result)
+            
+            emoji = {"SAFE": "✅", "REVIEW": "⚠️", "REJECT": "❌"}
+            status_emoji = emoji.get(verdict.architectural_verdict, "❓")
+            print(f"{status_emoji} PR #{pr_number}: {verdict.architectural_verdict} ({verdict.risk_level} risk)")
+            print(f"   Classification: {verdict.change_classification}")
+            print(f"   Recommendation: {verdict.recommendation}")
+            
+            if verdict.breaking_changes:
+                print(f"   Breaking changes: {len(verdict.breaking_changes)}")
+            
+            if verdict.behavioral_changes:
+                print(f"   Behavioral changes: {len(verdict.behavioral_changes)}")
+            
+        except Exception as e:
+            print(f"❌ Error analyzing PR #{pr_number}: {e}")
+            
+            verdict = ArchitecturalVerdict(
+                pr_number=pr_number,
+                title=pr_result["title"],
+                architectural_verdict="REVIEW",
+                change_classification="unknown",
+                breaking_changes=[],
+                behavioral_changes=[],
+                risk_level="unknown",
+                recommendation="MANUAL_REVIEW",
+                details={"error": str(e)},
+            )
+        
         print()
         
-        return verdicts
+        return verdict
     
     def analyze_pr(self, pr_result: Dict[str, Any]) -> ArchitecturalVerdict:
         """
@@ -170,15 +354,20 @@ class ArchitecturalGuardian:
         """
         pr_number = pr_result["pr_number"]
         
-        # Checkout PR branch
-        print(f"  → Checking out PR #{pr_number}")
+        # Fetch the PR head; both versions are read straight from git objects,
+        # so the working tree is never checked out
+        print(f"  → Fetching PR #{pr_number}")
         pr = self.github.get_pr(pr_number)
-        self.git.checkout_pr(pr_number, f"pr-{pr_number}")
+        self.git.fetch_pr(pr_number, f"pr-{pr_number}")
+        head = self.git.resolve_ref(f"pr-{pr_number}")
         
         # Get changed files
         print(f"  → Analyzing changed files...")
-        changed_files = self.git.get_changed_files(pr.base_ref)
-        python_files = [f for f in changed_files if f.endswith(".py")]
+        changed_files = self.git.get_changed_files(pr.base_ref, head)
+        python_files = [
+            f for f in changed_files
+            if f.endswith(".py") and not f.startswith(IGNORED_PREFIXES)
+        ]
         
         print(f"     Found {len(python_files)} Python files changed")
         
@@ -192,44 +381,69 @@ class ArchitecturalGuardian:
             "governance_changes": [],
         }
         
-        # Analyze function signatures
+        # Files whose blob is identical on both sides can't change any signature.
+        # The diff still lists them when only the file mode changed (chmod +x).
+        base_shas = self.git.get_blob_shas(pr.base_ref, python_files)
+        new_shas = self.git.get_blob_shas(head, python_files)
+        unchanged = {
+            f for f in python_files
+            if f in base_shas and base_shas[f] == new_shas.get(f)
+        }
+        
+        # Stream both versions of every other file into the parser; misses are
+        # parsed while the remaining files are still being read from git
         print(f"  → Analyzing function signatures...")
-        for file_path in python_files:
-            try:
-                # Get old version with caching
-                cache_key = f"{pr.base_ref}:{file_path}"
-                if cache_key not in self._file_cache:
-                    old_content = self.git.get_file_at_ref(file_path, pr.base_ref)
-                    self._file_cache[cache_key] = old_content
-                else:
-                    old_content = self._file_cache[cache_key]
+        fetched = []
+        
+        def iter_sources():
+            for file_path in python_files:
+                if file_path in unchanged:
+                    continue
+                try:
+                    old_content = self._get_base_content(pr.base_ref, file_path)
+                    new_content = self._read_file_content(head, file_path)
                 
-                # Parse both versions
-                old_analysis = self._analyze_content(old_content, file_path)
-                new_analysis = self.ast_analyzer.analyze_file(file_path)
+                except Exception as e:
+                    print(f"     Warning: Failed to analyze {file_path}: {e}")
+                    continue
+                
+                fetched.append(file_path)
+                yield old_content, file_path
+                yield new_content, file_path
+        
+        with self.git.open_cat_file_batch() as self._cat_file:
+            results = self._analyze_contents(iter_sources())
+        
+        analyses = {
+            file_path: (results[2 * i], results[2 * i + 1])
+            for i, file_path in enumerate(fetched)
+        }
+        
+        for file_path in python_files:
+            if file_path in unchanged:
+                signature_changes = {"breaking": [], "behavioral": []}
+            elif file_path in analyses:
+                old_analysis, new_analysis = analyses[file_path]
+                failures = [a for a in analyses[file_path] if isinstance(a, Exception)]
+                if failures:
+                    print(f"     Warning: Failed to analyze {file_path}: {failures[0]}")
+                    continue
                 
                 # Compare signatures
                 signature_changes = self._compare_signatures(old_analysis, new_analysis, file_path)
-                breaking_changes.extend(signature_changes["breaking"])
-                behavioral_changes.extend(signature_changes["behavioral"])
-                
-                # Check for API changes
-                if "api" in file_path or "tool" in file_path:
-                    details["api_changes"].append({
-                        "file": file_path,
-                        "changes": signature_changes,
-                    })
-                
-                # Check for governance changes
-                if "governance" in file_path or "middleware" in file_path:
-                    details["governance_changes"].append({
-                        "file": file_path,
-                        "changes": signature_changes,
-                    })
-                
-            except Exception as e:
-                print(f"     Warning: Failed to analyze {file_path}: {e}")
+            else:
+                # Fetching this file already failed with a warning
                 continue
+            
+            breaking_changes.extend(signature_changes["breaking"])
+            behavioral_changes.extend(signature_changes["behavioral"])
+            
+            # Check for API and governance changes; a file in both shares one entry
+            categories = {m.lastgroup for m in self.PATH_CATEGORIES_RE.finditer(file_path)}
+            if categories:
+                entry = {"file": file_path, "changes": signature_changes}
+                for category in categories:
+                    details[f"{category}_changes"].append(entry)
         
         # Classify the PR
         classification = self._classify_pr(pr, changed_files, breaking_changes, behavioral_changes)
@@ -260,17 +474,95 @@ class ArchitecturalGuardian:
             details=details,
         )
     
-    def _analyze_content(self, content: str, file_path: str):
-        """Analyze Python content from string."""
-        import ast
-        from scripts.agents.utils.ast_analyzer import CodeAnalysis
-        
-        tree = ast.parse(content, filename=str(file_path))
-        analysis = CodeAnalysis()
-        self.ast_analyzer._analyze_node(tree, analysis, file_path)
-        return analysis
+    def _read_file_content(self, ref: str, file_path: str) -> bytes:
+        """Read a file's raw bytes at a reference through the PR's cat-file batch."""
+        blob = self._cat_file.read_blob(ref, file_path)
+        if blob is None:
+            raise FileNotFoundError(f"{file_path} not found at {ref}")
+        return blob[1]
+    
+    def _analyze_contents(
+        self,
+        sources: Iterable[Tuple[bytes, str]],
+    ) -> List[Union[CodeAnalysis, Exception]]:
+        """
+        Analyze Python sources, reusing cached analyses.
+        
+        Cache misses are parsed inline. Once a run has parsed more than
+        PARALLEL_PARSE_MIN_BYTES inline on a machine with more than one CPU,
+        later misses are submitted to a process pool as soon as they are
+        read, so parsing (pure CPU work) overlaps with fetching the remaining
+        sources when they come from a lazy iterable.
+        
+        Args:
+            sources: Iterable of (raw content, file_path) pairs
+            
+        Returns:
+            CodeAnalysis per pair, or the exception raised while parsing it
+        """
+        keys = []
+        results = []
+        misses = []
+        pending = {}
+        
+        for i, (content, file_path) in enumerate(sources):
+            key = self.analysis_cache.key(content, file_path)
+            keys.append(key)
+            results.append(self.analysis_cache.get(key))
+            if results[i] is not None:
+                continue
+            
+            misses.append(i)
+            executor = self._get_executor()
+            if executor is not None:
+                pending[i] = executor.submit(_parse_source, content, file_path)
+                continue
+            
+            self._inline_parse_bytes += len(content)
+            try:
+                results[i] = self.ast_analyzer.analyze_source(content, file_path)
+            except Exception as e:
+                results[i] = e
+        
+        for i, future in pending.items():
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = e
+        
+        for i in misses:
+            if not isinstance(results[i], Exception):
+                self.analysis_cache.put(keys[i], results[i])
+        
+        return results
+    
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Get the parse worker pool, or None to parse inline.
+        
+        The pool is started once PARALLEL_PARSE_MIN_BYTES have been parsed
+        inline, and never on one CPU.
+        """
+        if (
+            self._executor is None
+            and self._inline_parse_bytes >= self.PARALLEL_PARSE_MIN_BYTES
+            and (os.cpu_count() or 1) > 1
+        ):
+            # Workers start while a cat-file batch is open; forked workers would
+            # inherit its stdin pipe and keep git from ever seeing EOF on close
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            self._executor = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+        return self._executor
     
-    def _compare_signatures(self, old_analysis, new_analysis, file_path: str) -> Dict[str, List[str]]:
+    def _compare_signatures(
+        self,
+        old_analysis,
+        new_analysis,
+        file_path: str,
+    ) -> Dict[str, List[SignatureChange]]:
         """
         Compare function signatures between two versions.
         
@@ -284,32 +576,32 @@ class ArchitecturalGuardian:
         old_functions = {f.name: f for f in old_analysis.functions}
         new_functions = {f.name: f for f in new_analysis.functions}
         
-        # Check for removed functions
-        for func_name in old_functions:
-            if func_name not in new_functions:
+        # Single pass over the old functions: each is either removed or compared.
+        # Removals are reported ahead of signature changes.
+        changed = []
+        for func_name, old_func in old_functions.items():
+            new_func = new_functions.get(func_name)
+            
+            if new_func is None:
                 # Check if it's a public API function
                 if not func_name.startswith("_"):
-                    breaking.append(f"Function removed: {file_path}::{func_name}")
-        
-        # Check for modified functions
-        for func_name in old_functions:
-            if func_name in new_functions:
-                old_func = old_functions[func_name]
-                new_func = new_functions[func_name]
-                
-                comparison = self.ast_analyzer.compare_signatures(old_func, new_func)
-                
-                if comparison["is_breaking"]:
-                    breaking.append(f"Breaking change in {file_path}::{func_name}: "
-                                    f"{', '.join(comparison['changes'])}")
-                elif comparison["changes"]:
-                    behavioral.append(f"Behavioral change in {file_path}::{func_name}: "
-                                      f"{', '.join(comparison['changes'])}")
+                    breaking.append(("removed", file_path, func_name, ()))
+                continue
+            
+            comparison = self.ast_analyzer.compare_signatures(old_func, new_func)
+            
+            if comparison["is_breaking"]:
+                changed.append(("breaking", file_path, func_name, tuple(comparison["changes"])))
+            elif comparison["changes"]:
+                behavioral.append(
+                    ("behavioral", file_path, func_name, tuple(comparison["changes"]))
+                )
+        breaking.extend(changed)
         
         # Check for new public functions (might be a feature)
         for func_name in new_functions:
             if func_name not in old_functions and not func_name.startswith("_"):
-                behavioral.append(f"New public function: {file_path}::{func_name}")
+                behavioral.append(("added", file_path, func_name, ()))
         
         return {"breaking": breaking, "behavioral": behavioral}
     
@@ -317,8 +609,8 @@ class ArchitecturalGuardian:
         self,
         pr,
         changed_files: List[str],
-        breaking_changes: List[str],
-        behavioral_changes: List[str],
+        breaking_changes: List[SignatureChange],
+        behavioral_changes: List[SignatureChange],
     ) -> str:
         """
         Classify the type of PR.
@@ -326,26 +618,11 @@ class ArchitecturalGuardian:
         Returns:
             Classification string
         """
-        title_lower = pr.title.lower()
-        
         # Check title keywords
-        if any(kw in title_lower for kw in ["fix", "bug", "patch", "correct"]):
-            return "bug_fix"
-        
-        if any(kw in title_lower for kw in ["refactor", "reorganize", "restructure"]):
-            return "refactor"
-        
-        if any(kw in title_lower for kw in ["feat", "feature", "add", "new"]):
-            return "feature"
-        
-        if any(kw in title_lower for kw in ["perf", "performance", "optimize"]):
-            return "performance"
-        
-        if any(kw in title_lower for kw in ["doc", "documentation"]):
-            return "documentation"
-        
-        if any(kw in title_lower for kw in ["test", "testing"]):
-            return "test"
+        found = {m.lastgroup for m in self.TITLE_KEYWORDS_RE.finditer(pr.title)}
+        for classification in self.TITLE_CLASSIFICATIONS:
+            if classification in found:
+                return classification
         
         # Infer from changes
         if breaking_changes:
@@ -360,8 +637,8 @@ class ArchitecturalGuardian:
     def _determine_verdict(
         self,
         classification: str,
-        breaking_changes: List[str],
-        behavioral_changes: List[str],
+        breaking_changes: List[SignatureChange],
+        behavioral_changes: List[SignatureChange],
     ) -> str:
         """
         Determine architectural verdict.
@@ -373,40 +650,13 @@ class ArchitecturalGuardian:
         if breaking_changes:
             return "REJECT"
         
-        # Safe classifications
-        safe_classifications = [
-            "bug_fix",
-            "documentation",
-            "test",
-            "internal_refactor",
-        ]
-        
-        if classification in safe_classifications and not behavioral_changes:
-            return "SAFE"
-        
-        # Review classifications
-        review_classifications = [
-            "refactor",
-            "performance",
-        ]
-        
-        if classification in review_classifications:
-            return "REVIEW"
-        
-        # Features require review
-        if classification == "feature":
-            return "REJECT"  # Per requirements: reject new features
-        
-        # Default to review for behavioral changes
-        if behavioral_changes:
-            return "REVIEW"
-        
-        return "SAFE"
+        safe, with_behavioral = self.VERDICTS.get(classification, ("SAFE", "REVIEW"))
+        return with_behavioral if behavioral_changes else safe
     
     def _calculate_risk_level(
         self,
-        breaking_changes: List[str],
-        behavioral_changes: List[str],
+        breaking_changes: List[SignatureChange],
+        behavioral_changes: List[SignatureChange],
         classification: str,
         details: Dict[str, Any],
     ) -> str:
@@ -417,33 +667,22 @@ class ArchitecturalGuardian:
             Risk level: low, medium, high
         """
         # High risk
-        if breaking_changes:
-            return "high"
-        
-        if classification == "feature":
+        if breaking_changes or details.get("governance_changes"):
             return "high"
         
-        if details.get("governance_changes"):
-            return "high"
+        risk = self.CLASSIFICATION_RISK.get(classification, "low")
         
         # Medium risk
-        if len(behavioral_changes) > 5:
-            return "medium"
-        
-        if classification in ["refactor", "performance"]:
-            return "medium"
-        
-        if details.get("api_changes"):
+        if risk == "low" and (len(behavioral_changes) > 5 or details.get("api_changes")):
             return "medium"
         
-        # Low risk
-        return "low"
+        return risk
     
     def _determine_recommendation(
         self,
         verdict: str,
         risk_level: str,
-        breaking_changes: List[str],
+        breaking_changes: List[SignatureChange],
     ) -> str:
         """
         Determine recommendation.
@@ -454,13 +693,7 @@ class ArchitecturalGuardian:
         if verdict == "REJECT":
             return "REJECT"
         
-        if verdict == "REVIEW" or risk_level in ["medium", "high"]:
-            return "MANUAL_REVIEW"
-        
-        if verdict == "SAFE" and risk_level == "low":
-            return "APPROVE"
-        
-        return "MANUAL_REVIEW"
+        return self.RECOMMENDATIONS.get((verdict, risk_level), "MANUAL_REVIEW")
 
 
 def main():
@@ -495,28 +728,37 @@ def main():
     args = parser.parse_args()
     
     # Load validation results
-    with open(args.validation) as f:
-        validation_results = json.load(f)
+    with open(args.validation, "rb") as f:
+        data = f.read()
+    validation_results = orjson.loads(data) if orjson is not None else json.loads(data)
     
     # Create output directory
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Run analysis
+    # Run analysis, writing each verdict as soon as it completes
     agent = ArchitecturalGuardian(repo_path=args.repo)
-    verdicts = agent.analyze_prs(validation_results)
-    
-    # Save results
-    output_data = {
-        "total_analyzed": len(verdicts),
-        "safe": sum(1 for v in verdicts if v.architectural_verdict == "SAFE"),
-        "review": sum(1 for v in verdicts if v.architectural_verdict == "REVIEW"),
-        "reject": sum(1 for v in verdicts if v.architectural_verdict == "REJECT"),
-        "verdicts": [v.to_dict() for v in verdicts],
-    }
+    counts = {"SAFE": 0, "REVIEW": 0, "REJECT": 0}
+    total = 0
     
-    with open(output_path, "w") as f:
-        json.dump(output_data, f, indent=2)
+    with open(output_path, "wb") as f:
+        f.write(b'{\n  "verdicts": [')
+        for verdict in agent.iter_verdicts(validation_results):
+            f.write(b",\n    " if total else b"\n    ")
+            if orjson is not None:
+                f.write(orjson.dumps(verdict.to_dict()))
+            else:
+                f.write(json.dumps(verdict.to_dict()).encode())
+            f.flush()
+            total += 1
+            counts[verdict.architectural_verdict] = counts.get(verdict.architectural_verdict, 0) + 1
+        
+        f.write(b"\n  ],\n")
+        f.write(f'  "total_analyzed": {total},\n'.encode())
+        f.write(f'  "safe": {counts["SAFE"]},\n'.encode())
+        f.write(f'  "review": {counts["REVIEW"]},\n'.encode())
+        f.write(f'  "reject": {counts["REJECT"]}\n'.encode())
+        f.write(b"}\n")
     
     print(f"Results saved to: {output_path}")
     
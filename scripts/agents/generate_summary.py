@@ -17,12 +17,41 @@ import json
 import argparse
 from pathlib import Path
 from typing import Dict, Any, List
+from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+@dataclass
+class SummaryAggregates:
+    """Counts and item lists shared by the summary sections."""
+    
+    failure_categories: Dict[str, int] = field(default_factory=lambda: {
+        "test_failures": 0,
+        "security_issues": 0,
+        "merge_conflicts": 0,
+        "invariant_failures": 0,
+    })
+    fix_types: Dict[str, int] = field(default_factory=dict)
+    classifications: Dict[str, int] = field(default_factory=dict)
+    breaking_count: int = 0
+    ready_meta_prs: List[Dict[str, Any]] = field(default_factory=list)
+    review_prs: List[Dict[str, Any]] = field(default_factory=list)
+    failed_prs: List[Dict[str, Any]] = field(default_factory=list)
+
 
 class SummaryGenerator:
     """Generate final summary report."""
     
+    # Per-result NDJSON sidecars, preferred over the aggregate JSON when newer
+    NDJSON_REPORTS = {
+        "functional": "functional_verification.ndjson",
+    }
+    
     def __init__(self, reports_dir: str = "reports"):
         """
         Initialize summary generator.
@@ -32,6 +61,7 @@ class SummaryGenerator:
         """
         self.reports_dir = Path(reports_dir)
         self.reports = {}
+        self.aggregates = SummaryAggregates()
     
     def load_reports(self):
         """Load all report files."""
@@ -45,14 +75,84 @@ class SummaryGenerator:
         
         for key, filename in report_files.items():
             file_path = self.reports_dir / filename
+            ndjson_path = self.reports_dir / self.NDJSON_REPORTS.get(key, filename)
             
-            if file_path.exists():
-                with open(file_path) as f:
-                    self.reports[key] = json.load(f)
+            if key in self.NDJSON_REPORTS and self._sidecar_is_current(ndjson_path, file_path):
+                self.reports[key] = self._load_verification_ndjson(ndjson_path)
+            elif file_path.exists():
+                data = file_path.read_bytes()
+                self.reports[key] = orjson.loads(data) if orjson is not None else json.loads(data)
             else:
                 print(f"Warning: {filename} not found")
                 self.reports[key] = {}
     
+    def _sidecar_is_current(self, ndjson_path: Path, file_path: Path) -> bool:
+        """
+        Check whether an NDJSON sidecar should be read instead of its JSON report.
+        
+        The sidecar wins only when the JSON is missing or older, so a stale sidecar
+        left by a run with a different --output can't shadow a fresh report.
+        
+        Args:
+            ndjson_path: Streamed NDJSON sidecar
+            file_path: Aggregate JSON report
+            
+        Returns:
+            True if the sidecar is the most recent report
+        """
+        try:
+            sidecar_mtime = ndjson_path.stat().st_mtime
+        except OSError:
+            return False
+        try:
+            return sidecar_mtime > file_path.stat().st_mtime
+        except OSError:
+            return True
+    
+    def _load_verification_ndjson(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Load functional verification results from the NDJSON sidecar.
+        
+        Reads one result per line, so a partial file from an interrupted run
+        still loads, and rebuilds the counts the aggregate report carries.
+        
+        Args:
+            file_path: Path to the NDJSON file
+            
+        Returns:
+            Report dictionary in the functional_verification.json layout
+        """
+        report = {
+            "total_verified": 0,
+            "passed": 0,
+            "failed": 0,
+            "ready_to_merge": 0,
+            "results": [],
+        }
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        
+        with open(file_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    result = loads(line)
+                except ValueError:
+                    # Last line of an interrupted write
+                    break
+                
+                report["results"].append(result)
+                report["total_verified"] += 1
+                if result.get("functional_verdict") == "PASS":
+                    report["passed"] += 1
+                elif result.get("functional_verdict") == "FAIL":
+                    report["failed"] += 1
+                if result.get("recommendation") == "READY_TO_MERGE":
+                    report["ready_to_merge"] += 1
+        
+        return report
+    
     def generate_summary(self) -> str:
         """
         Generate summary markdown.
@@ -61,17 +161,69 @@ class SummaryGenerator:
             Summary markdown string
         """
         self.load_reports()
+        self.aggregates = self._compute_aggregates()
+        
+        sections = [
+            self._generate_header(),
+            self._generate_validation_summary(),
+            self._generate_remediation_summary(),
+            self._generate_architectural_summary(),
+            self._generate_meta_pr_summary(),
+            self._generate_functional_summary(),
+            self._generate_action_items(),
+            self._generate_footer(),
+        ]
         
-        summary = self._generate_header()
-        summary += self._generate_validation_summary()
-        summary += self._generate_remediation_summary()
-        summary += self._generate_architectural_summary()
-        summary += self._generate_meta_pr_summary()
-        summary += self._generate_functional_summary()
-        summary += self._generate_action_items()
-        summary += self._generate_footer()
+        return "".join(sections)
+    
+    def _compute_aggregates(self) -> SummaryAggregates:
+        """
+        Walk each report's item list once, collecting everything the sections need.
         
-        return summary
+        Returns:
+            SummaryAggregates object
+        """
+        aggregates = SummaryAggregates()
+        
+        # Validation: failure categories and failed PRs
+        failure_categories = aggregates.failure_categories
+        for result in self.reports.get("validation", {}).get("results", []):
+            if result.get("status") != "FAIL":
+                continue
+            aggregates.failed_prs.append(result)
+            for reason in result.get("failure_reasons", []):
+                reason = reason.lower()
+                if "test" in reason:
+                    failure_categories["test_failures"] += 1
+                if "security" in reason:
+                    failure_categories["security_issues"] += 1
+                if "conflict" in reason:
+                    failure_categories["merge_conflicts"] += 1
+                if "invariant" in reason:
+                    failure_categories["invariant_failures"] += 1
+        
+        # Remediation: fix types
+        fix_types = aggregates.fix_types
+        for result in self.reports.get("remediation", {}).get("results", []):
+            for fix in result.get("fixes_applied", []):
+                fix_type = fix.split(":")[0] if ":" in fix else fix
+                fix_types[fix_type] = fix_types.get(fix_type, 0) + 1
+        
+        # Architecture: classifications, breaking changes and PRs needing review
+        classifications = aggregates.classifications
+        for verdict in self.reports.get("architectural", {}).get("verdicts", []):
+            classification = verdict.get("change_classification", "unknown")
+            classifications[classification] = classifications.get(classification, 0) + 1
+            aggregates.breaking_count += len(verdict.get("breaking_changes", []))
+            if verdict.get("recommendation") == "MANUAL_REVIEW":
+                aggregates.review_prs.append(verdict)
+        
+        # Functional verification: meta-PRs ready to merge
+        for result in self.reports.get("functional", {}).get("results", []):
+            if result.get("recommendation") == "READY_TO_MERGE":
+                aggregates.ready_meta_prs.append(result)
+        
+        return aggregates
     
     def _generate_header(self) -> str:
         """Generate report header."""
@@ -100,7 +252,7 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
         passed = validation.get("passed", 0)
         failed = validation.get("failed", 0)
         
-        summary = f"""## 🔍 Validation Results
+        parts: List[str] = [f"""## 🔍 Validation Results
 
 **Total PRs Validated:** {total}
 - ✅ Passed: {passed}
@@ -109,38 +261,20 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
 
 ### Validation Breakdown
 
-"""
+"""]
         
-        # Categorize failures
-        failure_categories = {
-            "test_failures": 0,
-            "security_issues": 0,
-            "merge_conflicts": 0,
-            "invariant_failures": 0,
-        }
+        failure_categories = self.aggregates.failure_categories
         
-        for result in validation.get("results", []):
-            if result["status"] == "FAIL":
-                for reason in result.get("failure_reasons", []):
-                    if "test" in reason.lower():
-                        failure_categories["test_failures"] += 1
-                    if "security" in reason.lower():
-                        failure_categories["security_issues"] += 1
-                    if "conflict" in reason.lower():
-                        failure_categories["merge_conflicts"] += 1
-                    if "invariant" in reason.lower():
-                        failure_categories["invariant_failures"] += 1
-        
-        summary += f"""| Category | Count |
+        parts.append(f"""| Category | Count |
 |----------|-------|
 | Test Failures | {failure_categories['test_failures']} |
 | Security Issues | {failure_categories['security_issues']} |
 | Merge Conflicts | {failure_categories['merge_conflicts']} |
 | Invariant Failures | {failure_categories['invariant_failures']} |
 
-"""
+""")
         
-        return summary
+        return "".join(parts)
     
     def _generate_remediation_summary(self) -> str:
         """Generate remediation summary section."""
@@ -154,7 +288,7 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
         partial = remediation.get("partial", 0)
         failed = remediation.get("failed", 0)
         
-        summary = f"""## 🔧 Remediation Results
+        parts: List[str] = [f"""## 🔧 Remediation Results
 
 **Total PRs Remediated:** {total}
 - ✅ Successful: {successful}
@@ -164,24 +298,19 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
 
 ### Common Fixes Applied
 
-"""
+"""]
         
-        # Count fix types
-        fix_types = {}
-        for result in remediation.get("results", []):
-            for fix in result.get("fixes_applied", []):
-                fix_type = fix.split(":")[0] if ":" in fix else fix
-                fix_types[fix_type] = fix_types.get(fix_type, 0) + 1
+        fix_types = self.aggregates.fix_types
         
         if fix_types:
             for fix_type, count in sorted(fix_types.items(), key=lambda x: -x[1])[:10]:
-                summary += f"- {fix_type}: {count}\n"
+                parts.append(f"- {fix_type}: {count}\n")
         else:
-            summary += "*No fixes applied*\n"
+            parts.append("*No fixes applied*\n")
         
-        summary += "\n"
+        parts.append("\n")
         
-        return summary
+        return "".join(parts)
     
     def _generate_architectural_summary(self) -> str:
         """Generate architectural analysis summary section."""
@@ -195,7 +324,7 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
         review = architectural.get("review", 0)
         reject = architectural.get("reject", 0)
         
-        summary = f"""## 🏛️  Architectural Analysis
+        parts: List[str] = [f"""## 🏛️  Architectural Analysis
 
 **Total PRs Analyzed:** {total}
 - ✅ Safe: {safe}
@@ -205,31 +334,24 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
 
 ### Change Classification
 
-"""
+"""]
         
-        # Count classifications
-        classifications = {}
-        for verdict in architectural.get("verdicts", []):
-            classification = verdict.get("change_classification", "unknown")
-            classifications[classification] = classifications.get(classification, 0) + 1
+        classifications = self.aggregates.classifications
         
         if classifications:
             for classification, count in sorted(classifications.items(), key=lambda x: -x[1]):
-                summary += f"- {classification.replace('_', ' ').title()}: {count}\n"
+                parts.append(f"- {classification.replace('_', ' ').title()}: {count}\n")
         
-        summary += "\n### Breaking Changes Detected\n\n"
+        parts.append("\n### Breaking Changes Detected\n\n")
         
-        breaking_count = sum(
-            len(v.get("breaking_changes", []))
-            for v in architectural.get("verdicts", [])
-        )
+        breaking_count = self.aggregates.breaking_count
         
-        summary += f"**Total Breaking Changes:** {breaking_count}\n\n"
+        parts.append(f"**Total Breaking Changes:** {breaking_count}\n\n")
         
         if breaking_count > 0:
-            summary += "⚠️  **Warning:** Breaking changes detected in some PRs. These should not be merged.\n\n"
+            parts.append("⚠️  **Warning:** Breaking changes detected in some PRs. These should not be merged.\n\n")
         
-        return summary
+        return "".join(parts)
     
     def _generate_meta_pr_summary(self) -> str:
         """Generate meta-PR creation summary section."""
@@ -241,13 +363,13 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
         total_created = meta_prs.get("total_created", 0)
         total_attempted = meta_prs.get("total_attempted", 0)
         
-        summary = f"""## 📦 Meta-PRs Created
+        parts: List[str] = [f"""## 📦 Meta-PRs Created
 
 **Total Meta-PRs Created:** {total_created}/{total_attempted}
 
 ### Meta-PR Breakdown
 
-"""
+"""]
         
         for meta_pr in meta_prs.get("meta_prs", []):
             title = meta_pr.get("title", "Unknown")
@@ -258,19 +380,19 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
             
             status = "✅" if created else "❌"
             
-            summary += f"{status} **{title}**\n"
-            summary += f"   - Branch: `{branch}`\n"
-            summary += f"   - Bundled PRs: {bundled}\n"
+            parts.append(f"{status} **{title}**\n")
+            parts.append(f"   - Branch: `{branch}`\n")
+            parts.append(f"   - Bundled PRs: {bundled}\n")
             
             if pr_number:
-                summary += f"   - PR Number: #{pr_number}\n"
+                parts.append(f"   - PR Number: #{pr_number}\n")
             
             if meta_pr.get("error"):
-                summary += f"   - Error: {meta_pr['error']}\n"
+                parts.append(f"   - Error: {meta_pr['error']}\n")
             
-            summary += "\n"
+            parts.append("\n")
         
-        return summary
+        return "".join(parts)
     
     def _generate_functional_summary(self) -> str:
         """Generate functional verification summary section."""
@@ -284,7 +406,7 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
         failed = functional.get("failed", 0)
         ready = functional.get("ready_to_merge", 0)
         
-        summary = f"""## ✅ Functional Verification
+        parts: List[str] = [f"""## ✅ Functional Verification
 
 **Total Meta-PRs Verified:** {total}
 - ✅ Passed: {passed}
@@ -293,87 +415,78 @@ The MetaServer PR Validation & Auto-Remediation system has completed its analysi
 
 ### Verification Details
 
-"""
+"""]
         
         for result in functional.get("results", []):
             branch = result.get("meta_pr_branch", "unknown")
             verdict = result.get("functional_verdict", "UNKNOWN")
             tests_passed = result.get("tests_passed", 0)
             tests_failed = result.get("tests_failed", 0)
+            behavioral = result.get("behavioral_changes_detected")
             perf_delta = result.get("performance_delta", "N/A")
             recommendation = result.get("recommendation", "UNKNOWN")
             
             status = "✅" if verdict == "PASS" else "❌"
+            if behavioral is None:
+                behavioral_status = "not checked"
+            else:
+                behavioral_status = "detected" if behavioral else "none"
             
-            summary += f"{status} **{branch}**\n"
-            summary += f"   - Tests: {tests_passed} passed, {tests_failed} failed\n"
-            summary += f"   - Performance: {perf_delta}\n"
-            summary += f"   - Recommendation: {recommendation}\n"
-            summary += "\n"
-        
-        return summary
+            parts.append(f"{status} **{branch}**\n")
+            parts.append(f"   - Tests: {tests_passed} passed, {tests_failed} failed\n")
+            parts.append(f"   - Behavioral changes: {behavioral_status}\n")
+            parts.append(f"   - Performance: {perf_delta}\n")
+            parts.append(f"   - Recommendation: {recommendation}\n")
+            parts.append("\n")
+        
+        return "".join(parts)
     
     def _generate_action_items(self) -> str:
         """Generate action items section."""
-        summary = """## 📋 Action Items
+        parts: List[str] = ["""## 📋 Action Items
 
 ### Ready to Merge
 
-"""
+"""]
         
-        # Get ready-to-merge meta-PRs
-        functional = self.reports.get("functional", {})
-        ready_meta_prs = [
-            r for r in functional.get("results", [])
-            if r.get("recommendation") == "READY_TO_MERGE"
-        ]
+        ready_meta_prs = self.aggregates.ready_meta_prs
         
         if ready_meta_prs:
             for meta_pr in ready_meta_prs:
                 branch = meta_pr.get("meta_pr_branch", "unknown")
                 bundled = meta_pr.get("bundled_prs", [])
-                summary += f"- [ ] Merge meta-PR: `{branch}` (bundles {len(bundled)} PRs)\n"
+                parts.append(f"- [ ] Merge meta-PR: `{branch}` (bundles {len(bundled)} PRs)\n")
         else:
-            summary += "*No meta-PRs ready to merge*\n"
+            parts.append("*No meta-PRs ready to merge*\n")
         
-        summary += "\n### Requires Manual Review\n\n"
+        parts.append("\n### Requires Manual Review\n\n")
         
-        # Get PRs requiring review
-        architectural = self.reports.get("architectural", {})
-        review_prs = [
-            v for v in architectural.get("verdicts", [])
-            if v.get("recommendation") == "MANUAL_REVIEW"
-        ]
+        review_prs = self.aggregates.review_prs
         
         if review_prs:
             for pr in review_prs[:10]:  # Limit to 10
                 pr_number = pr.get("pr_number", 0)
                 title = pr.get("title", "Unknown")
-                summary += f"- [ ] Review PR #{pr_number}: {title}\n"
+                parts.append(f"- [ ] Review PR #{pr_number}: {title}\n")
         else:
-            summary += "*No PRs require manual review*\n"
+            parts.append("*No PRs require manual review*\n")
         
-        summary += "\n### Failed PRs (Require Fixes)\n\n"
+        parts.append("\n### Failed PRs (Require Fixes)\n\n")
         
-        # Get failed PRs
-        validation = self.reports.get("validation", {})
-        failed_prs = [
-            r for r in validation.get("results", [])
-            if r.get("status") == "FAIL"
-        ]
+        failed_prs = self.aggregates.failed_prs
         
         if failed_prs:
             for pr in failed_prs[:10]:  # Limit to 10
                 pr_number = pr.get("pr_number", 0)
                 title = pr.get("title", "Unknown")
                 reasons = ", ".join(pr.get("failure_reasons", [])[:2])
-                summary += f"- [ ] Fix PR #{pr_number}: {title} ({reasons})\n"
+                parts.append(f"- [ ] Fix PR #{pr_number}: {title} ({reasons})\n")
         else:
-            summary += "*No failed PRs*\n"
+            parts.append("*No failed PRs*\n")
         
-        summary += "\n"
+        parts.append("\n")
         
-        return summary
+        return "".join(parts)
     
     def _generate_footer(self) -> str:
         """Generate report footer."""
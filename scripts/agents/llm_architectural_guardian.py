@@ -13,13 +13,9 @@ from .llm_base_agent import BaseAgent, AgentOutput
 class LLMArchitecturalGuardian(BaseAgent):
     """AI-powered architectural validation agent."""
     
-    def __init__(self, **kwargs):
-        super().__init__(role=AgentRole.GUARDIAN, **kwargs)
+    agent_role = AgentRole.GUARDIAN
     
-    @property
-    def system_prompt(self) -> str:
-        """Return the system prompt for architectural validation."""
-        return """You are a senior software architect specializing in system design and API design.
+    SYSTEM_PROMPT = """You are a senior software architect specializing in system design and API design.
 
 Your task is to review pull requests for architectural integrity and breaking changes.
 
@@ -62,6 +58,14 @@ Classification guide:
 
 Be strict about breaking changes and new features."""
     
+    def __init__(self, **kwargs):
+        super().__init__(role=self.agent_role, **kwargs)
+    
+    @property
+    def system_prompt(self) -> str:
+        """Return the system prompt for architectural validation."""
+        return self.SYSTEM_PROMPT
+    
     def build_user_prompt(self, pr_context: dict) -> str:
         """Build user prompt with PR details."""
         prompt = f"""Perform an architectural review of this pull request:
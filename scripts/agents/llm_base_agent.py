@@ -2,6 +2,7 @@
 Abstract base class for all AI agents.
 """
 
+import asyncio
 import os
 import json
 from abc import ABC, abstractmethod
@@ -17,7 +18,7 @@ from .llm_config import AgentRole, get_config
 from .llm_client import LLMClient, ChatMessage
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentOutput:
     """Structured output from an agent."""
     pr_number: int
@@ -81,12 +82,16 @@ class BaseAgent(ABC):
     5. Takes action (comment, push fix, label)
     """
     
+    # Role of the concrete agent; subclasses set it alongside SYSTEM_PROMPT
+    agent_role: AgentRole
+    
     def __init__(
         self,
         role: AgentRole,
         repo_owner: str = "itstanner5216",
         repo_name: str = "MetaServer",
         dry_run: bool = False,
+        pr_context_tasks: Optional[dict] = None,
     ):
         if httpx is None:
             raise ImportError(
@@ -102,6 +107,10 @@ class BaseAgent(ABC):
         self.github_token = os.environ.get("GITHUB_TOKEN")
         self.config = get_config()
         self.model_config = self.config.get_model_config(role)
+        # In-flight or finished PR context fetches, keyed by (owner, repo, PR
+        # number), shared by the agents of one pipeline run. The caller (see
+        # run_all_agents) owns and clears it; without one, every call fetches.
+        self._pr_context_tasks = pr_context_tasks
     
     @property
     @abstractmethod
@@ -120,7 +129,32 @@ class BaseAgent(ABC):
         pass
     
     async def get_pr_context(self, pr_number: int) -> dict:
-        """Fetch PR details from GitHub API."""
+        """
+        Fetch PR details from GitHub API.
+        
+        The fetch is shared: agents given the same pr_context_tasks dict (e.g.
+        the four run concurrently by run_all_agents) await one request instead
+        of each calling the API. A failed fetch is dropped so the next call
+        retries. An agent without a shared dict fetches fresh context each call.
+        """
+        if self._pr_context_tasks is None:
+            return await self._fetch_pr_context(pr_number)
+        
+        key = (self.repo_owner, self.repo_name, pr_number)
+        task = self._pr_context_tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_pr_context(pr_number))
+            self._pr_context_tasks[key] = task
+        try:
+            # Shield so one cancelled agent doesn't cancel the others' fetch
+            return await asyncio.shield(task)
+        except Exception:
+            if task.done():
+                self._pr_context_tasks.pop(key, None)
+            raise
+    
+    async def _fetch_pr_context(self, pr_number: int) -> dict:
+        """Fetch PR details, diff and changed files from GitHub API."""
         headers = {
             "Authorization": f"Bearer {self.github_token}",
             "Accept": "application/vnd.github.v3+json",
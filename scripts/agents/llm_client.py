@@ -16,14 +16,14 @@ except ImportError:
 from .llm_config import AgentRole, get_config, ModelConfig, ProviderConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """A single chat message."""
     role: str  # "system", "user", "assistant"
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     """Response from LLM."""
     content: str
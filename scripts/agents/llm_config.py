@@ -20,7 +20,7 @@ class AgentRole(str, Enum):
     VERIFIER = "verifier"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     """Provider-specific configuration."""
     auth_header: str = "Authorization"
@@ -28,7 +28,7 @@ class ProviderConfig:
     extra_headers: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for a single agent's model."""
     display_name: str
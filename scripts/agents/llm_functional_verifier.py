@@ -13,13 +13,9 @@ from .llm_base_agent import BaseAgent, AgentOutput
 class LLMFunctionalVerifier(BaseAgent):
     """AI-powered functional verification agent."""
     
-    def __init__(self, **kwargs):
-        super().__init__(role=AgentRole.VERIFIER, **kwargs)
+    agent_role = AgentRole.VERIFIER
     
-    @property
-    def system_prompt(self) -> str:
-        """Return the system prompt for functional verification."""
-        return """You are a QA expert specializing in test analysis and functional verification.
+    SYSTEM_PROMPT = """You are a QA expert specializing in test analysis and functional verification.
 
 Your task is to analyze pull requests from a testing and quality perspective.
 
@@ -61,6 +57,14 @@ Merge readiness guide:
 
 Be practical but thorough. Consider the scope and risk of changes."""
     
+    def __init__(self, **kwargs):
+        super().__init__(role=self.agent_role, **kwargs)
+    
+    @property
+    def system_prompt(self) -> str:
+        """Return the system prompt for functional verification."""
+        return self.SYSTEM_PROMPT
+    
     def build_user_prompt(self, pr_context: dict) -> str:
         """Build user prompt with PR details."""
         prompt = f"""Analyze the testing and quality aspects of this pull request:
@@ -13,13 +13,9 @@ from .llm_base_agent import BaseAgent, AgentOutput
 class LLMRemediationAgent(BaseAgent):
     """AI-powered code remediation agent."""
     
-    def __init__(self, **kwargs):
-        super().__init__(role=AgentRole.REMEDIATOR, **kwargs)
+    agent_role = AgentRole.REMEDIATOR
     
-    @property
-    def system_prompt(self) -> str:
-        """Return the system prompt for code remediation."""
-        return """You are an expert software engineer specializing in automated code fixes and refactoring.
+    SYSTEM_PROMPT = """You are an expert software engineer specializing in automated code fixes and refactoring.
 
 Your task is to analyze pull requests and suggest specific, actionable fixes for any issues found.
 
@@ -63,6 +59,14 @@ Verdict guide:
 
 Only suggest fixes you're confident about. Be specific with code snippets."""
     
+    def __init__(self, **kwargs):
+        super().__init__(role=self.agent_role, **kwargs)
+    
+    @property
+    def system_prompt(self) -> str:
+        """Return the system prompt for code remediation."""
+        return self.SYSTEM_PROMPT
+    
     def build_user_prompt(self, pr_context: dict) -> str:
         """Build user prompt with PR details."""
         prompt = f"""Analyze this pull request and suggest fixes:
@@ -13,13 +13,9 @@ from .llm_base_agent import BaseAgent, AgentOutput
 class LLMValidationAgent(BaseAgent):
     """AI-powered code quality validation agent."""
     
-    def __init__(self, **kwargs):
-        super().__init__(role=AgentRole.VALIDATOR, **kwargs)
+    agent_role = AgentRole.VALIDATOR
     
-    @property
-    def system_prompt(self) -> str:
-        """Return the system prompt for code validation."""
-        return """You are an expert code reviewer specializing in Python, security, and best practices.
+    SYSTEM_PROMPT = """You are an expert code reviewer specializing in Python, security, and best practices.
 
 Your task is to analyze pull requests and provide detailed feedback on:
 1. Code quality and maintainability
@@ -53,6 +49,14 @@ Verdict guide:
 
 Be thorough but fair. Focus on actionable feedback."""
     
+    def __init__(self, **kwargs):
+        super().__init__(role=self.agent_role, **kwargs)
+    
+    @property
+    def system_prompt(self) -> str:
+        """Return the system prompt for code validation."""
+        return self.SYSTEM_PROMPT
+    
     def build_user_prompt(self, pr_context: dict) -> str:
         """Build user prompt with PR details."""
         prompt = f"""Please review this pull request:
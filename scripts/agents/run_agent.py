@@ -60,6 +60,42 @@ async def run_single_agent(
     return output.to_dict()
 
 
+async def _run_pipeline_agent(
+    agent_name: str,
+    agent_class: type,
+    pr_number: int,
+    repo_owner: str,
+    repo_name: str,
+    dry_run: bool,
+    provider_limits: dict,
+    pr_context_tasks: dict,
+) -> dict:
+    """Run one agent for run_all_agents(), one request at a time per provider."""
+    print(f"\n{'='*80}")
+    print(f"Running {agent_name}...")
+    print(f"{'='*80}\n")
+    
+    try:
+        agent = agent_class(
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            dry_run=dry_run,
+            pr_context_tasks=pr_context_tasks,
+        )
+        
+        limit = provider_limits.setdefault(agent.model_config.provider, asyncio.Semaphore(1))
+        async with limit:
+            output = await agent.run(pr_number)
+        return output.to_dict()
+        
+    except Exception as e:
+        print(f"❌ Error running {agent_name}: {e}")
+        return {
+            "error": str(e),
+            "verdict": "ERROR",
+        }
+
+
 async def run_all_agents(
     pr_number: int,
     repo_owner: str = "itstanner5216",
@@ -67,7 +103,11 @@ async def run_all_agents(
     dry_run: bool = False,
 ) -> dict:
     """
-    Run all agents on a PR in sequence.
+    Run all agents on a PR concurrently.
+    
+    The agents are independent and I/O-bound, so they run together with
+    asyncio.gather; agents that share an LLM provider take turns to respect
+    its rate limits. The PR context is fetched once for the whole run.
     
     Args:
         pr_number: PR number to analyze
@@ -78,31 +118,28 @@ async def run_all_agents(
     Returns:
         Dictionary with all agent outputs
     """
-    results = {}
-    
-    for agent_name, agent_class in AGENTS.items():
-        print(f"\n{'='*80}")
-        print(f"Running {agent_name}...")
-        print(f"{'='*80}\n")
-        
-        try:
-            agent = agent_class(
-                repo_owner=repo_owner,
-                repo_name=repo_name,
-                dry_run=dry_run,
+    provider_limits: dict = {}
+    pr_context_tasks: dict = {}
+    try:
+        outputs = await asyncio.gather(
+            *(
+                _run_pipeline_agent(
+                    agent_name,
+                    agent_class,
+                    pr_number,
+                    repo_owner,
+                    repo_name,
+                    dry_run,
+                    provider_limits,
+                    pr_context_tasks,
+                )
+                for agent_name, agent_class in AGENTS.items()
             )
-            
-            output = await agent.run(pr_number)
-            results[agent_name] = output.to_dict()
-            
-        except Exception as e:
-            print(f"❌ Error running {agent_name}: {e}")
-            results[agent_name] = {
-                "error": str(e),
-                "verdict": "ERROR",
-            }
-    
-    return results
+        )
+    finally:
+        pr_context_tasks.clear()
+    
+    return dict(zip(AGENTS, outputs, strict=True))
 
 
 def main():
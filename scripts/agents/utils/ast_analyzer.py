@@ -2,9 +2,15 @@
 """AST analysis utilities for architectural verification."""
 
 import ast
+import functools
+import hashlib
+import json
+import os
+import sys
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional
-from dataclasses import dataclass, field
+from typing import Dict, List, Set, Any, Optional, Tuple, Union
+from dataclasses import asdict, dataclass, field
 
 
 @dataclass
@@ -57,6 +63,179 @@ class CodeAnalysis:
     global_vars: List[str] = field(default_factory=list)
 
 
+# Bump when the CodeAnalysis shape or extraction logic changes so stale
+# on-disk cache entries are never read back.
+ANALYSIS_CACHE_VERSION = "4"
+
+# Definitions and imports only ever appear in statement lists, so walking
+# these node types alone covers them without visiting any expressions
+_BLOCK_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _iter_statements(tree: ast.AST):
+    """Yield the tree's statement-level nodes in the same order as ast.walk."""
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if isinstance(value, list):
+                todo.extend(child for child in value if isinstance(child, _BLOCK_NODES))
+        yield node
+
+
+def default_analysis_cache_dir() -> Path:
+    """
+    Get the per-user directory for persisted analyses.
+    
+    Kept outside the repository under $XDG_CACHE_HOME (default ~/.cache),
+    so a checked-out branch can never supply cache entries of its own.
+    
+    Returns:
+        Cache directory path (not created)
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "metaserver" / "arch_guardian"
+
+
+def _analysis_from_dict(data: Dict[str, Any]) -> CodeAnalysis:
+    """Rebuild a CodeAnalysis from its asdict() form."""
+    return CodeAnalysis(
+        functions=[FunctionSignature(**f) for f in data["functions"]],
+        classes=[
+            ClassInfo(**{**c, "methods": [FunctionSignature(**m) for m in c["methods"]]})
+            for c in data["classes"]
+        ],
+        imports=[ImportInfo(**i) for i in data["imports"]],
+        global_vars=list(data["global_vars"]),
+    )
+
+
+class AnalysisCache:
+    """Persistent on-disk JSON cache of CodeAnalysis results keyed by source hash."""
+    
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize analysis cache.
+        
+        Args:
+            cache_dir: Directory holding serialized analyses; see
+                default_analysis_cache_dir()
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+    
+    def key(self, source: Union[str, bytes], file_path: str) -> str:
+        """
+        Build a cache key for a source file.
+        
+        The key embeds the content hash, so edited files miss automatically.
+        The path is included because every extracted record carries it.
+        
+        Args:
+            source: Python source code (raw bytes are hashed as-is)
+            file_path: Path recorded in the analysis
+            
+        Returns:
+            Hex digest key
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8", "surrogatepass")
+        
+        digest = hashlib.sha256()
+        digest.update(source)
+        digest.update(
+            f"|{file_path}|{sys.version_info[0]}.{sys.version_info[1]}"
+            f"|{ANALYSIS_CACHE_VERSION}".encode()
+        )
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[CodeAnalysis]:
+        """
+        Load a cached analysis.
+        
+        Entries are plain JSON, so reading one never runs code; anything
+        that fails to read or rebuild counts as a miss.
+        
+        Args:
+            key: Cache key from key()
+            
+        Returns:
+            CodeAnalysis, or None on a miss or unreadable entry
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                analysis = _analysis_from_dict(json.load(f))
+        except Exception:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return analysis
+    
+    def put(self, key: str, analysis: CodeAnalysis):
+        """
+        Store an analysis (best effort; failures are ignored).
+        
+        Analyses whose default values have no JSON form (bytes, complex,
+        Ellipsis) are not cached.
+        
+        Args:
+            key: Cache key from key()
+            analysis: CodeAnalysis to store
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            data = json.dumps(asdict(analysis))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+
+
+def _signature_key(sig: FunctionSignature) -> Tuple:
+    """Hashable projection of the fields compare_signatures looks at."""
+    return (tuple(sig.args), sig.return_type, tuple(sig.decorators))
+
+
+@functools.lru_cache(maxsize=8192)
+def _compare_signature_keys(old_key: Tuple, new_key: Tuple) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Compare two signature keys (memoized; identical pairs recur across PRs).
+    
+    Returns:
+        Tuple of (is_breaking, change descriptions)
+    """
+    old_args, old_return, old_decorators = old_key
+    new_args, new_return, new_decorators = new_key
+    is_breaking = False
+    changes = []
+    
+    # Check argument changes
+    if old_args != new_args:
+        is_breaking = True
+        changes.append(f"Arguments changed: {list(old_args)} -> {list(new_args)}")
+    
+    # Check return type changes
+    if old_return != new_return:
+        changes.append(f"Return type changed: {old_return} -> {new_return}")
+    
+    # Check decorator changes (might affect behavior)
+    if set(old_decorators) != set(new_decorators):
+        changes.append(
+            f"Decorators changed: {list(old_decorators)} -> {list(new_decorators)}"
+        )
+    
+    return is_breaking, tuple(changes)
+
+
 class ASTAnalyzer:
     """Python AST analysis for architectural verification."""
     
@@ -87,8 +266,22 @@ class ASTAnalyzer:
         with open(full_path) as f:
             source = f.read()
         
+        return self.analyze_source(source, file_path)
+    
+    def analyze_source(self, source: Union[str, bytes], file_path: str) -> CodeAnalysis:
+        """
+        Analyze Python source code.
+        
+        Args:
+            source: Python source code; raw bytes are decoded by the parser
+                itself (honoring any PEP 263 coding declaration)
+            file_path: Path recorded in the analysis
+            
+        Returns:
+            CodeAnalysis object
+        """
         try:
-            tree = ast.parse(source, filename=str(file_path))
+            tree = ast.parse(source, filename=str(file_path), type_comments=False)
         except SyntaxError as e:
             raise ValueError(f"Syntax error in {file_path}: {e}")
         
@@ -108,7 +301,7 @@ class ASTAnalyzer:
             analysis: CodeAnalysis to populate
             file_path: Current file path
         """
-        for child in ast.walk(node):
+        for child in _iter_statements(node):
             # Function definitions
             if isinstance(child, ast.FunctionDef):
                 sig = self._extract_function_signature(child, file_path)
@@ -252,22 +445,12 @@ class ASTAnalyzer:
             changes["changes"].append("Function removed")
             return changes
         
-        # Check argument changes
-        if old_sig.args != new_sig.args:
-            changes["is_breaking"] = True
-            changes["changes"].append(f"Arguments changed: {old_sig.args} -> {new_sig.args}")
-        
-        # Check return type changes
-        if old_sig.return_type != new_sig.return_type:
-            changes["changes"].append(
-                f"Return type changed: {old_sig.return_type} -> {new_sig.return_type}"
-            )
-        
-        # Check decorator changes (might affect behavior)
-        if set(old_sig.decorators) != set(new_sig.decorators):
-            changes["changes"].append(
-                f"Decorators changed: {old_sig.decorators} -> {new_sig.decorators}"
-            )
+        is_breaking, found = _compare_signature_keys(
+            _signature_key(old_sig),
+            _signature_key(new_sig),
+        )
+        changes["is_breaking"] = is_breaking
+        changes["changes"].extend(found)
         
         return changes
     
@@ -4,7 +4,7 @@
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -18,6 +18,64 @@ class MergeConflict:
     their_content: str
 
 
+class CatFileBatch:
+    """Long-lived `git cat-file --batch` process for reading many blobs."""
+    
+    def __init__(self, repo_path: Path):
+        """
+        Start the batch process.
+        
+        Args:
+            repo_path: Path to git repository
+        """
+        self._proc = subprocess.Popen(
+            ["git", "-C", str(repo_path), "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+    
+    def read_blob(self, ref: str, file_path: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Read a file's blob at a reference.
+        
+        Args:
+            ref: Git reference
+            file_path: File path
+            
+        Returns:
+            Tuple of (blob SHA, raw content), or None if the path doesn't exist at ref
+        """
+        self._proc.stdin.write(f"{ref}:{file_path}\n".encode())
+        self._proc.stdin.flush()
+        
+        header = self._proc.stdout.readline().decode().rstrip("\n")
+        if not header:
+            raise RuntimeError("git cat-file --batch exited unexpectedly")
+        if header.endswith((" missing", " ambiguous")):
+            return None
+        
+        # Header is "<sha> <type> <size>"; payload is followed by a newline
+        sha, obj_type, size = header.split(" ")
+        content = self._proc.stdout.read(int(size) + 1)[:-1]
+        if obj_type != "blob":
+            return None
+        return sha, content
+    
+    def close(self):
+        """Stop the batch process."""
+        if self._proc.stdin:
+            self._proc.stdin.close()
+        self._proc.wait()
+        if self._proc.stdout:
+            self._proc.stdout.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class GitOperations:
     """Git operations wrapper for safe repository manipulation."""
     
@@ -57,16 +115,19 @@ class GitOperations:
         """Fetch all remote branches."""
         self._run_git("fetch", "--all", "--prune")
     
-    def checkout(self, branch: str, create: bool = False):
+    def checkout(self, branch: str, create: bool = False, detach: bool = False):
         """
         Checkout a branch.
         
         Args:
             branch: Branch name
             create: Create branch if it doesn't exist
+            detach: Check out the branch's commit without holding the branch
         """
         if create:
             self._run_git("checkout", "-b", branch)
+        elif detach:
+            self._run_git("checkout", "--detach", branch)
         else:
             self._run_git("checkout", branch)
     
@@ -79,10 +140,33 @@ class GitOperations:
             branch_name: Local branch name to create
             remote: Remote name (default: origin)
         """
-        # Fetch the PR
-        self._run_git("fetch", remote, f"pull/{pr_number}/head:{branch_name}")
+        self.fetch_pr(pr_number, branch_name, remote)
         self.checkout(branch_name)
     
+    def fetch_pr(self, pr_number: int, branch_name: str, remote: str = "origin"):
+        """
+        Fetch a PR into a local branch without checking it out.
+        
+        Args:
+            pr_number: PR number
+            branch_name: Local branch name to create
+            remote: Remote name (default: origin)
+        """
+        self._run_git("fetch", remote, f"pull/{pr_number}/head:{branch_name}")
+    
+    def resolve_ref(self, ref: str) -> str:
+        """
+        Resolve a reference to its commit SHA.
+        
+        Args:
+            ref: Git reference
+            
+        Returns:
+            Commit SHA
+        """
+        result = self._run_git("rev-parse", "--verify", f"{ref}^{{commit}}")
+        return result.stdout.strip()
+    
     def get_current_branch(self) -> str:
         """
         Get current branch name.
@@ -273,17 +357,22 @@ class GitOperations:
         result = self._run_git(*args)
         return result.stdout
     
-    def get_changed_files(self, ref: str = "HEAD") -> List[str]:
+    def get_changed_files(self, ref: str = "HEAD", head: Optional[str] = None) -> List[str]:
         """
         Get list of changed files.
         
         Args:
             ref: Reference to compare against
+            head: Reference to compare (None for working tree)
             
         Returns:
             List of changed file paths
         """
-        result = self._run_git("diff", "--name-only", ref)
+        args = ["diff", "--name-only", ref]
+        if head:
+            args.append(head)
+        
+        result = self._run_git(*args)
         files = [f.strip() for f in result.stdout.split("\n") if f.strip()]
         return files
     
@@ -301,6 +390,62 @@ class GitOperations:
         result = self._run_git("show", f"{ref}:{file_path}")
         return result.stdout
     
+    def get_blob_shas(self, ref: str, file_paths: List[str]) -> Dict[str, str]:
+        """
+        Get blob SHAs for files at a reference with a single ls-tree call.
+        
+        Args:
+            ref: Git reference
+            file_paths: File paths to look up
+            
+        Returns:
+            Dictionary of file path -> blob SHA (paths missing at ref are omitted)
+        """
+        if not file_paths:
+            return {}
+        
+        result = self._run_git("ls-tree", "-r", "-z", ref, "--", *file_paths)
+        shas = {}
+        for entry in result.stdout.split("\0"):
+            if not entry:
+                continue
+            # Entry is "<mode> <type> <sha>\t<path>"
+            meta, path = entry.split("\t", 1)
+            _, obj_type, sha = meta.split(" ")
+            if obj_type == "blob":
+                shas[path] = sha
+        return shas
+    
+    def open_cat_file_batch(self) -> CatFileBatch:
+        """
+        Open a batch reader for fetching many files with one git process.
+        
+        Returns:
+            CatFileBatch (use as a context manager to close it)
+        """
+        return CatFileBatch(self.repo_path)
+    
+    def add_worktree(self, path: str, ref: str = "HEAD"):
+        """
+        Create a detached worktree, replacing any stale one at the same path.
+        
+        Args:
+            path: Directory for the worktree
+            ref: Commit to check out
+        """
+        self.remove_worktree(path)
+        self._run_git("worktree", "add", "--detach", str(path), ref)
+    
+    def remove_worktree(self, path: str):
+        """
+        Remove a worktree and its directory if it exists.
+        
+        Args:
+            path: Worktree directory
+        """
+        self._run_git("worktree", "remove", "--force", str(path), check=False)
+        self._run_git("worktree", "prune", check=False)
+    
     def create_branch(self, branch_name: str, start_point: Optional[str] = None):
         """
         Create a new branch.
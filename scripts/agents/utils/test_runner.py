@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 """Test runner utilities for pytest execution and result parsing."""
 
+import importlib.util
+import os
 import subprocess
+import sys
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
 
 
+# pytest-xdist is optional; without it tests run in a single process. Tests run
+# under this interpreter (python -m pytest), so probing it here is accurate.
+XDIST_AVAILABLE = importlib.util.find_spec("xdist") is not None
+
+
 @dataclass
 class TestResult:
     """Represents test execution results."""
@@ -28,14 +36,16 @@ class TestResult:
 class TestRunner:
     """Pytest execution and result parsing."""
     
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", env: Optional[Dict[str, str]] = None):
         """
         Initialize test runner.
         
         Args:
             repo_path: Path to repository
+            env: Environment variables to set for pytest, on top of this process's
         """
         self.repo_path = Path(repo_path).resolve()
+        self.env = env or {}
     
     def run_tests(
         self,
@@ -44,6 +54,7 @@ class TestRunner:
         coverage: bool = True,
         verbose: bool = True,
         json_output: bool = True,
+        xdist_workers: Optional[Union[int, str]] = None,
     ) -> TestResult:
         """
         Run pytest tests.
@@ -54,12 +65,13 @@ class TestRunner:
             coverage: Enable coverage reporting
             verbose: Enable verbose output
             json_output: Generate JSON report
+            xdist_workers: pytest-xdist worker count or "auto" (ignored if xdist is missing)
             
         Returns:
             TestResult object
         """
-        # Build pytest command
-        cmd = ["pytest"]
+        # Build pytest command with this interpreter, where XDIST_AVAILABLE was probed
+        cmd = [sys.executable, "-m", "pytest"]
         
         # Add test path
         if test_path:
@@ -76,6 +88,15 @@ class TestRunner:
         if verbose:
             cmd.append("-v")
         
+        # Distribute test files across workers
+        parallel = xdist_workers is not None and XDIST_AVAILABLE
+        if parallel:
+            cmd.extend([
+                "-n", str(xdist_workers),
+                "--dist=loadfile",
+                "--max-worker-restart=0",
+            ])
+        
         # Add coverage
         if coverage:
             cmd.extend([
@@ -98,6 +119,7 @@ class TestRunner:
             cwd=self.repo_path,
             capture_output=True,
             text=True,
+            env={**os.environ, **self.env} if self.env else None,
         )
         
         # Parse results
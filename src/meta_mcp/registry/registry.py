@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import os
+from collections.abc import Iterable
 from pathlib import Path
 
 import yaml
@@ -19,6 +20,10 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader; PyYAML builds without libyaml only ship the
+# pure-Python SafeLoader.
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _resolve_governance_mode():
     try:
@@ -47,7 +52,13 @@ class ToolRegistry:
         self._servers: dict[str, ServerRecord] = {}
         self._tools_by_server: dict[str, list[ToolRecord]] = {}
         self._bootstrap_tools = {"search_tools", "get_tool_schema"}
+        # Bumped on every add so caches derived from tool records can tell they're stale
+        self._version = 0
 
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever a tool is added or replaced."""
+        return self._version
 
     @classmethod
     def from_yaml(cls, yaml_path: str) -> "ToolRegistry":
@@ -71,7 +82,7 @@ class ToolRegistry:
             raise FileNotFoundError(f"Registry YAML not found: {yaml_path}")
 
         with open(yaml_file) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlSafeLoader)
 
         # Validate YAML structure
         if not isinstance(data, dict):
@@ -112,6 +123,7 @@ class ToolRegistry:
 
         tool.validate_invariants()
         self._tools[tool.tool_id] = tool
+        self._version += 1
         self._tools_by_server.setdefault(tool.server_id, [])
         if tool not in self._tools_by_server[tool.server_id]:
             self._tools_by_server[tool.server_id].append(tool)
@@ -133,6 +145,9 @@ class ToolRegistry:
         """
         Get tool record by ID.
 
+        O(1): tools are stored in a dict keyed by tool_id, so hot retrieval
+        loops can call this directly without a separate lookup cache.
+
         Args:
             tool_id: Tool identifier
 
@@ -141,6 +156,18 @@ class ToolRegistry:
         """
         return self._tools.get(tool_id)
 
+    def get_many(self, tool_ids: Iterable[str]) -> list[ToolRecord | None]:
+        """
+        Get tool records for several IDs in one call.
+
+        Args:
+            tool_ids: Tool identifiers
+
+        Returns:
+            One entry per ID, in order: the ToolRecord, or None if not found
+        """
+        return list(map(self._tools.get, tool_ids))
+
     def add(self, tool: ToolRecord) -> None:
         """
         Add tool to registry.
@@ -156,6 +183,7 @@ class ToolRegistry:
         """
         tool.validate_invariants()
         self._tools[tool.tool_id] = tool
+        self._version += 1
 
     def search(self, query: str) -> list[ToolCandidate]:
         """
@@ -260,6 +288,28 @@ class ToolRegistry:
         """
         return list(self._tools.values())
 
+    def get_summary_columns(self) -> dict:
+        """
+        Get tool summaries as columns (structure of arrays).
+
+        Lets bulk checks over every tool run as vectorized array operations
+        instead of per-record attribute access. Rows follow
+        get_all_summaries() order. Requires numpy.
+
+        Returns:
+            Dict of numpy arrays: tool_id, risk_level and description_1line
+            (strings) and tag_count (integers)
+        """
+        import numpy  # type: ignore[import-not-found]
+
+        tools = self.get_all_summaries()
+        return {
+            "tool_id": numpy.array([t.tool_id for t in tools], dtype=str),
+            "risk_level": numpy.array([t.risk_level for t in tools], dtype=str),
+            "description_1line": numpy.array([t.description_1line for t in tools], dtype=str),
+            "tag_count": numpy.array([len(t.tags) for t in tools], dtype=numpy.intp),
+        }
+
 
 # Singleton instance with absolute path
 _default_tools_path = os.getenv("TOOLS_YAML_PATH") or str(
@@ -15,6 +15,29 @@ from ..registry.models import ToolRecord
 logger = logging.getLogger(__name__)
 
 
+def quantize_int8(matrix):
+    """
+    Quantize matrix rows to int8 with a per-row scale.
+
+    Each row is divided by max(|row|) / 127 and rounded, so a row dequantizes
+    as int8_row * scale. All-zero rows get a scale of 1.
+
+    Requires numpy.
+
+    Args:
+        matrix: 2-D float array
+
+    Returns:
+        (int8 matrix, float32 per-row scales)
+    """
+    import numpy  # type: ignore[import-not-found]
+
+    scales = numpy.abs(matrix).max(axis=1).astype(numpy.float32) / 127.0
+    scales[scales == 0.0] = 1.0
+    quantized = numpy.rint(matrix / scales[:, None]).astype(numpy.int8)
+    return quantized, scales
+
+
 class ToolEmbedder:
     """
     Generate embeddings for tools using TF-IDF word vectors.
@@ -33,8 +56,14 @@ class ToolEmbedder:
         self._cache: dict[str, list[float] | None] = {}  # tool_id -> embedding vector
         self._vocabulary: set[str] = set()
         self._vocab_list: list[str] = []  # Cached sorted vocabulary (PERF-001)
+        self._vocab_index: dict[str, int] = {}  # word -> position in _vocab_list
         self._idf_scores: dict[str, float] = {}
         self._document_count = 0
+        # Lazily stacked float32 copy of the cache; see get_embedding_matrix()
+        self._matrix = None
+        self._matrix_ids: tuple[str, ...] = ()
+        self._matrix_index: dict[str, int] = {}  # tool_id -> row in _matrix
+        self._int8_matrix = None  # (int8 rows, float32 scales) of _matrix
 
     def _tokenize(self, text: str) -> list[str]:
         """
@@ -87,6 +116,7 @@ class ToolEmbedder:
 
         # Cache sorted vocabulary for faster vector conversion (PERF-001)
         self._vocab_list = sorted(self._vocabulary)
+        self._vocab_index = {word: i for i, word in enumerate(self._vocab_list)}
         logger.debug(f"Vocabulary built and cached: {len(self._vocab_list)} words")
 
     def _compute_tf_idf(self, text: str) -> dict[str, float]:
@@ -153,6 +183,16 @@ class ToolEmbedder:
 
         return self._normalize_vector(vector)
 
+    @staticmethod
+    def _embedding_text(tool: ToolRecord) -> str:
+        """Combine a tool's text fields, weighting the 1-line description and tags."""
+        # Tags and 1-line description are more important for matching
+        return (
+            f"{tool.description_1line} {tool.description_1line} "  # Double weight
+            f"{tool.description_full} "
+            f"{' '.join(tool.tags)} {' '.join(tool.tags)}"  # Double weight
+        )
+
     def _compute_embedding(self, tool: ToolRecord) -> list[float]:
         """
         Generate embedding for a tool without consulting the cache.
@@ -163,18 +203,46 @@ class ToolEmbedder:
         Returns:
             Normalized embedding vector
         """
-        # Combine all text fields with appropriate weighting
-        # Tags and 1-line description are more important for matching
-        text = (
-            f"{tool.description_1line} {tool.description_1line} "  # Double weight
-            f"{tool.description_full} "
-            f"{' '.join(tool.tags)} {' '.join(tool.tags)}"  # Double weight
-        )
-
         # Compute TF-IDF and convert to vector
-        tf_idf = self._compute_tf_idf(text)
+        tf_idf = self._compute_tf_idf(self._embedding_text(tool))
         return self._tf_idf_to_vector(tf_idf)
 
+    def embed_batch(self, tools: list[ToolRecord]) -> list[list[float]]:
+        """
+        Generate embeddings for many tools in one pass, bypassing the cache.
+
+        Each tool's sparse TF-IDF scores are normalized and scattered straight
+        into its output vector, instead of normalizing a dense vector per tool
+        as _compute_embedding() does. Falls back to _compute_embedding() if the
+        vocabulary index has not been built.
+
+        This stays in pure Python because numpy is only an optional dependency
+        and build_index() has to work without it. Callers that have numpy get
+        the float32 matrix from get_embedding_matrix(), which is stacked once
+        from these vectors and cached.
+
+        Args:
+            tools: ToolRecord objects to embed
+
+        Returns:
+            Normalized embedding vectors, in the same order as tools
+        """
+        if not self._vocab_index:
+            return [self._compute_embedding(tool) for tool in tools]
+
+        vocab_index = self._vocab_index
+        dimension = len(vocab_index)
+        vectors: list[list[float]] = []
+        for tool in tools:
+            vector = [0.0] * dimension
+            tf_idf = self._compute_tf_idf(self._embedding_text(tool))
+            magnitude = math.sqrt(sum(x * x for x in tf_idf.values()))
+            if magnitude:
+                for word, score in tf_idf.items():
+                    vector[vocab_index[word]] = score / magnitude
+            vectors.append(vector)
+        return vectors
+
     def build_index(self, tools: list[ToolRecord]) -> None:
         """
         Build embedding index from all registered tools.
@@ -187,14 +255,15 @@ class ToolEmbedder:
         # Build vocabulary and IDF scores
         self._build_vocabulary(tools)
 
+        self._matrix = None
+
         # Pre-allocate cache size to reduce rehashing during build (PERF-003)
-        self._cache = dict.fromkeys([tool.tool_id for tool in tools])
+        tool_ids = [tool.tool_id for tool in tools]
+        self._cache = dict.fromkeys(tool_ids)
         logger.debug(f"Pre-allocated cache for {len(tools)} tools")
 
-        # Pre-compute embeddings for all tools
-        for tool in tools:
-            embedding = self._compute_embedding(tool)
-            self._cache[tool.tool_id] = embedding
+        # Pre-compute embeddings for all tools in one batch
+        self._cache.update(zip(tool_ids, self.embed_batch(tools), strict=True))
         logger.info(
             f"Index built: {len(self._cache)} tools cached "
             f"(pre-allocation saved {len(tools) // 8} rehashes)"
@@ -224,6 +293,7 @@ class ToolEmbedder:
 
         # Cache the result
         self._cache[tool.tool_id] = vector
+        self._matrix = None
 
         return vector
 
@@ -252,6 +322,32 @@ class ToolEmbedder:
 
         return vector
 
+    def embed_query_sparse(self, query: str) -> tuple[list[int], list[float]]:
+        """
+        Generate a sparse embedding for a search query.
+
+        Equivalent to embed_query() but returns only the non-zero entries,
+        so callers can score against just the matching vocabulary columns.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            (vocabulary column indices, normalized weights); both empty if the
+            query has no in-vocabulary words
+        """
+        if not query or not query.strip() or not self._vocab_index:
+            return [], []
+
+        tf_idf = self._compute_tf_idf(query)
+        magnitude = math.sqrt(sum(x * x for x in tf_idf.values()))
+        if magnitude == 0:
+            return [], []
+
+        columns = [self._vocab_index[word] for word in tf_idf]
+        weights = [score / magnitude for score in tf_idf.values()]
+        return columns, weights
+
     def get_cached_embedding(self, tool_id: str) -> list[float]:
         """
         Get cached embedding for a tool.
@@ -267,7 +363,71 @@ class ToolEmbedder:
             return [0.0] * len(self._vocabulary)
         return cached
 
+    def get_embedding_matrix(self):
+        """
+        Get all cached embeddings as one contiguous float32 matrix.
+
+        The matrix is built on first call and reused until the cache changes.
+        Requires numpy.
+
+        Returns:
+            (matrix of shape (N, D), tuple of the N tool IDs in row order)
+
+        Raises:
+            ValueError: If cached embeddings have inconsistent dimensions
+        """
+        import numpy  # type: ignore[import-not-found]
+
+        if self._matrix is None:
+            tool_ids = tuple(tool_id for tool_id, vector in self._cache.items() if vector)
+            if tool_ids:
+                matrix = numpy.array([self._cache[t] for t in tool_ids], dtype=numpy.float32)
+            else:
+                matrix = numpy.empty((0, len(self._vocab_list)), dtype=numpy.float32)
+            self._matrix, self._matrix_ids = matrix, tool_ids
+            self._matrix_index = {tool_id: row for row, tool_id in enumerate(tool_ids)}
+            self._int8_matrix = None
+        return self._matrix, self._matrix_ids
+
+    def get_embedding_row(self, tool_id: str):
+        """
+        Get a tool's embedding as a row view of get_embedding_matrix().
+
+        Requires numpy.
+
+        Args:
+            tool_id: Tool identifier
+
+        Returns:
+            float32 vector of shape (D,) sharing memory with the matrix, or
+            None if the tool has no cached embedding
+        """
+        matrix, _ = self.get_embedding_matrix()
+        row = self._matrix_index.get(tool_id)
+        if row is None:
+            return None
+        return matrix[row]
+
+    def get_int8_matrix(self):
+        """
+        Get the embedding matrix quantized to int8 with per-row scales.
+
+        A quarter of the float32 footprint; row i dequantizes as
+        int8_rows[i] * scales[i]. Rows follow get_embedding_matrix().
+        Requires numpy.
+
+        Returns:
+            (int8 matrix of shape (N, D), float32 scales of shape (N,))
+        """
+        matrix, _ = self.get_embedding_matrix()
+        if self._int8_matrix is None:
+            self._int8_matrix = quantize_int8(matrix)
+        return self._int8_matrix
+
     def clear_cache(self) -> None:
         """Clear embedding cache."""
         self._cache.clear()
+        self._matrix = None
+        self._matrix_ids = ()
+        self._matrix_index = {}
         # Keep _vocab_list in sync with _vocabulary/_idf_scores; rebuild via build_index().
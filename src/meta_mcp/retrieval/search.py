@@ -6,14 +6,91 @@ query and tool descriptions using embedding vectors.
 """
 
 import asyncio
+import dataclasses
 import heapq
 import math
+from collections import OrderedDict
+from threading import Lock
 
 from ..governance.policy import evaluate_policy
 from ..registry.models import AllowedInMode, ToolCandidate, extract_schema_hint
 from ..registry.registry import ToolRegistry
 from ..state import governance_state
-from .embedder import ToolEmbedder
+from .embedder import ToolEmbedder, quantize_int8
+
+
+def _top_k_indices(scores, k: int):
+    """
+    Return indices of the k highest scores along the last axis, highest first.
+
+    Uses a partition to find the k-th highest score in O(N) and only sorts the
+    selected entries, instead of fully sorting every score. Ties are broken by
+    lowest index, both at the k boundary and in the returned order, so equal
+    scores keep their original order. Works on a single score vector or a
+    (queries, tools) score matrix.
+
+    Requires numpy.
+
+    Args:
+        scores: 1-D or 2-D array of scores
+        k: Number of indices to return per row
+
+    Returns:
+        Integer array of shape (..., min(k, N))
+    """
+    import numpy  # type: ignore[import-not-found]
+
+    n = scores.shape[-1]
+    k = max(min(k, n), 0)
+    if k == 0:
+        return numpy.empty((*scores.shape[:-1], 0), dtype=numpy.intp)
+    if k < n:
+        # Take every score above the k-th highest, then the lowest-index ties
+        # with it until each row has k
+        kth = -numpy.partition(-scores, k - 1, axis=-1)[..., k - 1 : k]
+        above = scores > kth
+        ties = scores == kth
+        needed = k - above.sum(axis=-1, keepdims=True)
+        selected = above | (ties & (numpy.cumsum(ties, axis=-1) <= needed))
+        top = numpy.nonzero(selected)[-1].reshape((*scores.shape[:-1], k))
+    else:
+        top = numpy.broadcast_to(numpy.arange(n), scores.shape)
+    order = numpy.argsort(-numpy.take_along_axis(scores, top, axis=-1), axis=-1, kind="stable")
+    return numpy.take_along_axis(top, order, axis=-1)
+
+
+def _int8_dot(query_i8, matrix_i8, block_rows: int = 1024):
+    """
+    Return query_i8 @ matrix_i8.T with int32 accumulation.
+
+    numpy has no int8 matrix product that widens its accumulator, so each
+    operand is widened to int32 first. The tool matrix is widened one block
+    of rows at a time, so only block_rows rows are ever held as int32
+    instead of a full int32 copy of the matrix per call.
+
+    Requires numpy.
+
+    Args:
+        query_i8: int8 array of shape (Q, D)
+        matrix_i8: int8 array of shape (N, D)
+        block_rows: Tool matrix rows widened per step
+
+    Returns:
+        int32 array of shape (Q, N)
+    """
+    import numpy  # type: ignore[import-not-found]
+
+    query_i32 = query_i8.astype(numpy.int32)
+    raw = numpy.empty((query_i8.shape[0], matrix_i8.shape[0]), dtype=numpy.int32)
+    for start in range(0, matrix_i8.shape[0], block_rows):
+        block = matrix_i8[start : start + block_rows].astype(numpy.int32)
+        numpy.matmul(query_i32, block.T, out=raw[:, start : start + block.shape[0]])
+    return raw
+
+
+def _copy_candidates(candidates: list[ToolCandidate]) -> list[ToolCandidate]:
+    """Copy cached search results so callers cannot mutate the cache entry."""
+    return [dataclasses.replace(c, tags=list(c.tags)) for c in candidates]
 
 
 class SemanticSearch:
@@ -25,8 +102,14 @@ class SemanticSearch:
     - Cosine similarity ranking
     - Configurable result limits
     - Fallback to keyword search if embeddings fail
+    - Optional int8-quantized index for batch scoring (enable_int8)
+    - Sparse-query scoring that reads only matching columns (fused_search)
+    - LRU cache of recent search() results
     """
 
+    # Maximum number of distinct search() calls whose results are kept
+    QUERY_CACHE_SIZE = 256
+
     def __init__(self, registry: ToolRegistry):
         """
         Initialize semantic search with a tool registry.
@@ -37,6 +120,17 @@ class SemanticSearch:
         self.registry = registry
         self.embedder = ToolEmbedder()
         self._index_built = False
+        # Tool embeddings are scored from the embedder's float32 matrix (and its
+        # int8 copy once enable_int8() is called). _row_state maps that matrix to
+        # registered tools as (matrix, registry version, rows to score or None
+        # for all, tool IDs); records are re-read from the registry when scoring
+        # so governance always sees the current risk level.
+        self._int8_enabled = False
+        self._row_state = None
+        # (query, limit, min_score, registry version) -> {governance mode: results},
+        # least recently used first
+        self._query_cache: OrderedDict[tuple, dict] = OrderedDict()
+        self._query_cache_lock = Lock()
 
     def _build_index(self) -> None:
         """
@@ -110,14 +204,23 @@ class SemanticSearch:
         # Clamp to [0, 1] range (handles floating point errors)
         return max(0.0, min(1.0, score))
 
-    def search(self, query: str, limit: int = 10, min_score: float = 0.0) -> list[ToolCandidate]:
+    def search(
+        self, query: str, limit: int = 10, min_score: float = 0.0, use_cache: bool = True
+    ) -> list[ToolCandidate]:
         """
         Search tools using semantic similarity.
 
+        Results are kept in an LRU cache keyed by the query, limit, min_score,
+        current governance mode and registry version, so repeated queries skip
+        scoring and governance ranking until a tool is added or replaced. The
+        cache is cleared by rebuild_index(). Callers always get their own
+        ToolCandidate copies.
+
         Args:
             query: Search query string
             limit: Maximum number of results to return
             min_score: Minimum similarity score threshold (0.0 to 1.0)
+            use_cache: Set to False to always score the query (for benchmarks)
 
         Returns:
             List of ToolCandidate objects ranked by relevance
@@ -128,23 +231,84 @@ class SemanticSearch:
         # Build index on first search
         self._build_index()
 
+        # The cache is checked before embedding, so a hit skips tokenizing the
+        # query. The governance mode is only resolved once the query is known to
+        # be cached or to match something.
+        key = (query, limit, min_score, self.registry.version)
+        mode = None
+        if use_cache:
+            with self._query_cache_lock:
+                by_mode = self._query_cache.get(key)
+                if by_mode is not None:
+                    self._query_cache.move_to_end(key)
+            if by_mode is not None:
+                mode = self._resolve_governance_mode()
+                cached = by_mode.get(mode)
+                if cached is not None:
+                    return _copy_candidates(cached)
+
         # Generate query embedding
         query_embedding = self.embedder.embed_query(query)
         query_magnitude = self._vector_magnitude(query_embedding)
         if query_magnitude == 0.0:
             return []
 
-        tools = self.registry.get_all_summaries()
-        use_numpy = len(tools) >= 100
-        numpy = None
-        if use_numpy:
-            try:
-                import numpy as numpy  # type: ignore[import-not-found]
-            except ImportError:
-                numpy = None
-                use_numpy = False
+        if mode is None:
+            mode = self._resolve_governance_mode()
+        results = self._search_by_vector(query_embedding, query_magnitude, limit, min_score, mode)
+        if not use_cache:
+            return results
+
+        with self._query_cache_lock:
+            self._query_cache.setdefault(key, {})[mode] = _copy_candidates(results)
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return results
+
+    def search_by_vector(
+        self, query_embedding: list[float], limit: int = 10, min_score: float = 0.0
+    ) -> list[ToolCandidate]:
+        """
+        Search tools using a pre-computed query embedding.
 
+        Skips tokenization so callers that issue the same query repeatedly
+        can embed it once via embedder.embed_query() and only pay for scoring.
+
+        Args:
+            query_embedding: Query vector from embedder.embed_query()
+            limit: Maximum number of results to return
+            min_score: Minimum similarity score threshold (0.0 to 1.0)
+
+        Returns:
+            List of ToolCandidate objects ranked by relevance
+        """
+        self._build_index()
+        query_magnitude = self._vector_magnitude(query_embedding)
+        if query_magnitude == 0.0:
+            return []
         mode = self._resolve_governance_mode()
+        return self._search_by_vector(query_embedding, query_magnitude, limit, min_score, mode)
+
+    def _search_by_vector(
+        self,
+        query_embedding: list[float],
+        query_magnitude: float,
+        limit: int,
+        min_score: float,
+        mode,
+    ) -> list[ToolCandidate]:
+        """
+        search_by_vector() for a built index, a non-zero query magnitude and an
+        already resolved governance mode.
+        """
+        # Score every tool with one matrix-vector product against the cached
+        # tool matrix; the per-tool Python loop is only the no-numpy fallback.
+        try:
+            import numpy  # type: ignore[import-not-found]
+        except ImportError:
+            numpy = None
+
         top_k = max(limit, 0)
         adjusted_tools: list[tuple[float, str, object, AllowedInMode]] = []
 
@@ -158,42 +322,29 @@ class SemanticSearch:
                 heapq.heapreplace(adjusted_tools, entry)
 
         def _apply_governance(tool, raw_score: float) -> None:
-            policy = evaluate_policy(mode, tool.risk_level, tool.tool_id)
-            if policy.action == "allow":
-                penalty = 0.0
-                allowed_in_mode = AllowedInMode.ALLOWED
-            elif policy.action == "require_approval":
-                penalty = 0.20
-                allowed_in_mode = AllowedInMode.REQUIRES_APPROVAL
-            else:
-                penalty = 0.80
-                allowed_in_mode = AllowedInMode.BLOCKED
+            penalty, allowed_in_mode = self._governance_penalty(mode, tool)
             adjusted_score = raw_score * (1.0 - penalty)
             _push_top_k(tool, adjusted_score, allowed_in_mode)
 
-        if use_numpy and numpy is not None:
-            tool_vectors = []
-            tool_records = []
-            for tool in tools:
-                tool_embedding = self.embedder.get_cached_embedding(tool.tool_id)
-                if not tool_embedding or all(x == 0.0 for x in tool_embedding):
-                    continue
-                tool_vectors.append(tool_embedding)
-                tool_records.append(tool)
-
-            if tool_vectors:
-                tool_matrix = numpy.array(tool_vectors, dtype=float)
-                query_vector = numpy.array(query_embedding, dtype=float)
-                query_magnitude = numpy.linalg.norm(query_vector)
-                if query_magnitude == 0.0:
-                    return []
-                scores = tool_matrix.dot(query_vector) / query_magnitude
+        if numpy is not None:
+            tool_matrix, tool_rows, tool_records = self._tool_rows()
+
+            if tool_records:
+                query_vector = numpy.array(query_embedding, dtype=numpy.float32)
+                scores = self._select_rows(tool_matrix.dot(query_vector), tool_rows)
+                scores = scores / query_magnitude
                 scores = numpy.clip(scores, 0.0, 1.0)
-                for tool, score in zip(tool_records, scores.tolist()):
-                    if score >= min_score:
-                        _apply_governance(tool, score)
+                governance = [self._governance_penalty(mode, tool) for tool in tool_records]
+                weights = numpy.array([1.0 - penalty for penalty, _ in governance], dtype=float)
+                adjusted = numpy.where(scores >= min_score, scores * weights, -numpy.inf)
+                # Entries are appended highest first, so the final sort keeps them in order
+                for j in _top_k_indices(adjusted, top_k).tolist():
+                    if adjusted[j] != -numpy.inf:
+                        tool = tool_records[j]
+                        entry = (float(adjusted[j]), tool.tool_id, tool, governance[j][1])
+                        adjusted_tools.append(entry)
         else:
-            for tool in tools:
+            for tool in self.registry.get_all_summaries():
                 tool_embedding = self.embedder.get_cached_embedding(tool.tool_id)
 
                 # Skip if embedding failed
@@ -211,21 +362,216 @@ class SemanticSearch:
         results = []
         adjusted_tools.sort(key=lambda x: x[0], reverse=True)
         for score, _tool_id, tool, allowed_in_mode in adjusted_tools[:limit]:
-            results.append(
-                ToolCandidate(
-                    tool_id=tool.tool_id,
-                    server_id=tool.server_id,
-                    description_1line=tool.description_1line,
-                    tags=tool.tags,
-                    risk_level=tool.risk_level,
-                    relevance_score=score,
-                    allowed_in_mode=allowed_in_mode,
-                    schema_hint=extract_schema_hint(tool.schema_min),
-                )
-            )
+            results.append(self._to_candidate(tool, score, allowed_in_mode))
+
+        return results
+
+    def batch_search(
+        self, queries: list[str], limit: int = 10, min_score: float = 0.0
+    ) -> list[list[ToolCandidate]]:
+        """
+        Search tools for several queries at once.
+
+        When numpy is available, all query embeddings are scored against the
+        tool embedding matrix in a single matrix product and the top results
+        per query are selected with a partial sort. Otherwise each query is
+        scored individually via search_by_vector().
+
+        Args:
+            queries: Search query strings
+            limit: Maximum number of results to return per query
+            min_score: Minimum similarity score threshold (0.0 to 1.0)
+
+        Returns:
+            One list of ToolCandidate objects per query, in query order
+        """
+        self._build_index()
+
+        query_embeddings = [
+            self.embedder.embed_query(query) if query and query.strip() else [] for query in queries
+        ]
+
+        try:
+            import numpy  # type: ignore[import-not-found]
+        except ImportError:
+            return [
+                self.search_by_vector(embedding, limit=limit, min_score=min_score)
+                for embedding in query_embeddings
+            ]
+
+        results: list[list[ToolCandidate]] = [[] for _ in queries]
+        rows = [
+            i
+            for i, embedding in enumerate(query_embeddings)
+            if self._vector_magnitude(embedding) > 0.0
+        ]
+        top_k = max(limit, 0)
+        if not rows or top_k == 0:
+            return results
+
+        tool_matrix, tool_rows, tool_records = self._tool_rows()
+        if not tool_records:
+            return results
+
+        mode = self._resolve_governance_mode()
+        governance = [self._governance_penalty(mode, tool) for tool in tool_records]
+        weights = numpy.array([1.0 - penalty for penalty, _ in governance], dtype=float)
+
+        query_matrix = numpy.array([query_embeddings[i] for i in rows], dtype=numpy.float32)
+        query_magnitudes = numpy.linalg.norm(query_matrix, axis=1)
+
+        if self._int8_enabled:
+            int8_matrix, int8_scales = self.embedder.get_int8_matrix()
+            query_i8, query_scales = quantize_int8(query_matrix)
+            raw = _int8_dot(query_i8, int8_matrix)
+            dots = raw * (query_scales[:, None] * int8_scales[None, :])
+        else:
+            dots = query_matrix @ tool_matrix.T
+        if tool_rows is not None:
+            dots = dots[:, tool_rows]
+
+        scores = dots / query_magnitudes[:, None]
+        scores = numpy.clip(scores, 0.0, 1.0)
+        adjusted = numpy.where(scores >= min_score, scores * weights, -numpy.inf)
+
+        top = _top_k_indices(adjusted, top_k)
+        for row, query_index in enumerate(rows):
+            row_scores = adjusted[row]
+            row_top = top[row]
+            results[query_index] = [
+                self._to_candidate(tool_records[j], float(row_scores[j]), governance[j][1])
+                for j in row_top.tolist()
+                if row_scores[j] != -numpy.inf
+            ]
 
         return results
 
+    def fused_search(
+        self, query: str, limit: int = 10, min_score: float = 0.0
+    ) -> list[ToolCandidate]:
+        """
+        Search tools by scoring only the vocabulary columns the query uses.
+
+        Instead of materializing a dense query vector and multiplying it with
+        the whole tool matrix, the query is embedded sparsely and only the
+        tool matrix columns of its few non-zero terms are read and weighted:
+        O(terms * tools) rather than O(vocabulary * tools). Rankings match
+        search().
+
+        Requires numpy.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+            min_score: Minimum similarity score threshold (0.0 to 1.0)
+
+        Returns:
+            List of ToolCandidate objects ranked by relevance
+        """
+        import numpy  # type: ignore[import-not-found]
+
+        self._build_index()
+        columns, weights = self.embedder.embed_query_sparse(query)
+        top_k = max(limit, 0)
+        if not columns or top_k == 0:
+            return []
+
+        tool_matrix, tool_rows, tool_records = self._tool_rows()
+        if not tool_records:
+            return []
+        scores = self._fused_scores(tool_matrix, columns, weights)
+        scores = numpy.clip(self._select_rows(scores, tool_rows), 0.0, 1.0)
+
+        mode = self._resolve_governance_mode()
+        governance = [self._governance_penalty(mode, tool) for tool in tool_records]
+        weights_by_tool = numpy.array([1.0 - penalty for penalty, _ in governance], dtype=float)
+        adjusted = numpy.where(scores >= min_score, scores * weights_by_tool, -numpy.inf)
+
+        return [
+            self._to_candidate(tool_records[j], float(adjusted[j]), governance[j][1])
+            for j in _top_k_indices(adjusted, top_k).tolist()
+            if adjusted[j] != -numpy.inf
+        ]
+
+    @staticmethod
+    def _fused_scores(tool_matrix, columns: list[int], weights: list[float]):
+        """Score every tool row against a sparse query using only its term columns."""
+        import numpy  # type: ignore[import-not-found]
+
+        return tool_matrix[:, columns] @ numpy.array(weights, dtype=tool_matrix.dtype)
+
+    def enable_int8(self) -> None:
+        """
+        Quantize the tool embedding index to int8 for batch_search().
+
+        Each tool vector is stored as int8 with its own float32 scale
+        (max |x| / 127), a quarter of the float32 footprint. batch_search()
+        then scores with an integer matrix product and rescales afterwards.
+        Ranking is approximate; search() and search_by_vector() are
+        unaffected.
+
+        Requires numpy.
+        """
+        self._build_index()
+        self.embedder.get_int8_matrix()
+        self._int8_enabled = True
+
+    def _tool_rows(self):
+        """
+        Return (tool matrix, rows to score, current tool records).
+
+        The float32 tool matrix is the embedder's get_embedding_matrix(); only
+        rows of tools that are still registered and have a non-zero embedding
+        are scored (rows is None when that is every row). The row selection is
+        kept until the matrix or the registry changes, while records are looked
+        up fresh on every call. Requires numpy.
+        """
+        import numpy  # type: ignore[import-not-found]
+
+        matrix, matrix_ids = self.embedder.get_embedding_matrix()
+        state = self._row_state
+        if state is None or state[0] is not matrix or state[1] != self.registry.version:
+            version = self.registry.version
+            registered = {tool.tool_id for tool in self.registry.get_all_summaries()}
+            rows = [
+                row
+                for row in numpy.flatnonzero(matrix.any(axis=1)).tolist()
+                if matrix_ids[row] in registered
+            ]
+            tool_ids = [matrix_ids[row] for row in rows]
+            rows = None if len(rows) == len(matrix_ids) else numpy.array(rows, dtype=numpy.intp)
+            state = self._row_state = (matrix, version, rows, tool_ids)
+        return matrix, state[2], self.registry.get_many(state[3])
+
+    @staticmethod
+    def _select_rows(scores, rows):
+        """Keep the scores of the tool rows picked by _tool_rows()."""
+        return scores if rows is None else scores[rows]
+
+    @staticmethod
+    def _governance_penalty(mode, tool) -> tuple[float, AllowedInMode]:
+        """Return the ranking penalty and allowed-in-mode status for a tool."""
+        policy = evaluate_policy(mode, tool.risk_level, tool.tool_id)
+        if policy.action == "allow":
+            return 0.0, AllowedInMode.ALLOWED
+        if policy.action == "require_approval":
+            return 0.20, AllowedInMode.REQUIRES_APPROVAL
+        return 0.80, AllowedInMode.BLOCKED
+
+    @staticmethod
+    def _to_candidate(tool, score: float, allowed_in_mode: AllowedInMode) -> ToolCandidate:
+        """Build a ToolCandidate (no schema fields) for a ranked tool."""
+        return ToolCandidate(
+            tool_id=tool.tool_id,
+            server_id=tool.server_id,
+            description_1line=tool.description_1line,
+            tags=tool.tags,
+            risk_level=tool.risk_level,
+            relevance_score=score,
+            allowed_in_mode=allowed_in_mode,
+            schema_hint=extract_schema_hint(tool.schema_min),
+        )
+
     @staticmethod
     def _resolve_governance_mode():
         try:
@@ -241,8 +587,13 @@ class SemanticSearch:
         Useful if registry contents change.
         """
         self._index_built = False
+        self._row_state = None
+        with self._query_cache_lock:
+            self._query_cache.clear()
         self.embedder.clear_cache()
         self._build_index()
+        if self._int8_enabled:
+            self.enable_int8()
 
 
 def search_tools_semantic(
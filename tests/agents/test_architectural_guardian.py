@@ -0,0 +1,85 @@
+"""Tests for the architectural guardian agent."""
+
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+import tempfile
+import subprocess
+from scripts.agents.architectural_guardian import ArchitecturalGuardian
+
+
+def _git(repo_path, *args):
+    subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True)
+
+
+@pytest.fixture
+def guardian_repo(monkeypatch):
+    """Create a repository with a main branch and two PR branches."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir) / "repo"
+        repo_path.mkdir()
+        monkeypatch.setenv("XDG_CACHE_HOME", str(Path(tmpdir) / "cache"))
+        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+        
+        _git(repo_path, "init", "-b", "main")
+        _git(repo_path, "config", "user.email", "test@example.com")
+        _git(repo_path, "config", "user.name", "Test User")
+        
+        (repo_path / "api.py").write_text("def handle(request):\n    return request\n")
+        (repo_path / "util.py").write_text("def helper(x):\n    return x\n")
+        _git(repo_path, "add", ".")
+        _git(repo_path, "commit", "-m", "Initial commit")
+        
+        # Both PRs edit api.py against the same base
+        for pr_number in (1, 2):
+            _git(repo_path, "checkout", "-b", f"pr-{pr_number}", "main")
+            (repo_path / "api.py").write_text(
+                f"def handle(request, timeout={pr_number}):\n    return request\n"
+            )
+            _git(repo_path, "commit", "-am", f"PR {pr_number}")
+        _git(repo_path, "checkout", "main")
+        
+        yield repo_path
+
+
+def _make_guardian(repo_path):
+    guardian = ArchitecturalGuardian(repo_path=str(repo_path))
+    guardian.github.get_pr = lambda pr_number: SimpleNamespace(
+        base_ref="main",
+        title=f"Update handler {pr_number}",
+    )
+    # The PR branches already exist locally
+    guardian.git.fetch_pr = lambda pr_number, branch_name: None
+    return guardian
+
+
+@pytest.mark.unit
+def test_base_contents_cached_across_prs(guardian_repo):
+    """Test base-ref reads are shared between PRs and head reads aren't cached."""
+    guardian = _make_guardian(guardian_repo)
+    
+    for pr_number in (1, 2):
+        verdict = guardian.analyze_pr({"pr_number": pr_number, "title": "t"})
+        assert verdict.details["changed_files"] == 1
+    
+    cache_info = guardian._get_base_content.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    assert cache_info.currsize == 1
+
+
+@pytest.mark.unit
+def test_mode_only_change_skips_parsing(guardian_repo):
+    """Test a file whose blob didn't change is neither read nor parsed."""
+    _git(guardian_repo, "checkout", "-b", "pr-3", "main")
+    (guardian_repo / "util.py").chmod(0o755)
+    _git(guardian_repo, "commit", "-am", "Make util executable")
+    _git(guardian_repo, "checkout", "main")
+    guardian = _make_guardian(guardian_repo)
+    
+    verdict = guardian.analyze_pr({"pr_number": 3, "title": "t"})
+    
+    assert verdict.details["changed_files"] == 1
+    assert verdict.breaking_changes == []
+    assert guardian._get_base_content.cache_info().misses == 0
+    assert guardian.analysis_cache.misses == 0
@@ -3,7 +3,12 @@
 import pytest
 from pathlib import Path
 import tempfile
-from scripts.agents.utils.ast_analyzer import ASTAnalyzer, FunctionSignature
+from scripts.agents.utils.ast_analyzer import (
+    AnalysisCache,
+    ASTAnalyzer,
+    FunctionSignature,
+    _compare_signature_keys,
+)
 
 
 @pytest.fixture
@@ -145,3 +150,123 @@ def test_compare_signatures():
     # Should detect breaking change
     assert comparison["is_breaking"] is True
     assert len(comparison["changes"]) > 0
+
+
+@pytest.mark.unit
+def test_analysis_cache_roundtrip(temp_python_file):
+    """Test persisting analyses keyed by source content."""
+    repo_path, file_path = temp_python_file
+    analyzer = ASTAnalyzer(repo_path=str(repo_path))
+    cache = AnalysisCache(repo_path / ".cache")
+    source = (repo_path / file_path).read_text()
+    
+    key = cache.key(source, file_path)
+    assert cache.get(key) is None
+    
+    cache.put(key, analyzer.analyze_file(file_path))
+    cached = cache.get(key)
+    
+    assert cached == analyzer.analyze_file(file_path)
+    assert (cache.hits, cache.misses) == (1, 1)
+    
+    # Edited content gets a different key
+    assert cache.key(source + "\nx = 1\n", file_path) != key
+
+
+@pytest.mark.unit
+def test_analysis_cache_bad_entries_miss(temp_python_file):
+    """Test unreadable or malformed cache entries are treated as misses."""
+    repo_path, file_path = temp_python_file
+    cache = AnalysisCache(repo_path / ".cache")
+    key = cache.key("x = 1\n", file_path)
+    entry = cache._path(key)
+    entry.parent.mkdir(parents=True)
+    
+    for content in (b"\x80\x04N.", b"not json", b'{"functions": 1}', b"[]"):
+        entry.write_bytes(content)
+        assert cache.get(key) is None
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+@pytest.mark.unit
+def test_compare_signatures_memoized():
+    """Test repeated signature pairs reuse the cached comparison."""
+    analyzer = ASTAnalyzer()
+    old_sig = FunctionSignature(
+        name="memo_func",
+        args=["a"],
+        defaults=[],
+        return_type="int",
+        decorators=["cache"],
+        lineno=1,
+        file_path="old.py",
+    )
+    new_sig = FunctionSignature(
+        name="memo_func",
+        args=["a"],
+        defaults=[],
+        return_type="str",
+        decorators=["cache"],
+        lineno=5,
+        file_path="new.py",
+    )
+    
+    first = analyzer.compare_signatures(old_sig, new_sig)
+    hits = _compare_signature_keys.cache_info().hits
+    second = analyzer.compare_signatures(old_sig, new_sig)
+    
+    assert _compare_signature_keys.cache_info().hits == hits + 1
+    assert first == second == {
+        "is_breaking": False,
+        "changes": ["Return type changed: int -> str"],
+    }
+    
+    # Callers get their own result dict
+    first["changes"].append("mutated")
+    assert analyzer.compare_signatures(old_sig, new_sig)["changes"] == [
+        "Return type changed: int -> str"
+    ]
+
+
+@pytest.mark.unit
+def test_analyze_source_bytes():
+    """Test raw source bytes are decoded by the parser."""
+    analyzer = ASTAnalyzer()
+    source = "# -*- coding: latin-1 -*-\ndef café():\n    return 'é'\n"
+    
+    analysis = analyzer.analyze_source(source.encode("latin-1"), "legacy.py")
+    
+    assert [f.name for f in analysis.functions] == ["café"]
+    
+    # str and UTF-8 bytes of the same source share a cache key
+    cache = AnalysisCache(Path("unused"))
+    assert cache.key(source, "legacy.py") == cache.key(source.encode(), "legacy.py")
+
+
+@pytest.mark.unit
+def test_analyze_source_nested_blocks():
+    """Test definitions in nested blocks are found and async functions are not collected."""
+    analyzer = ASTAnalyzer()
+    source = """
+try:
+    import fast_json as json
+except ImportError:
+    def fallback(data):
+        return data
+
+async def fetch(url, timeout=5):
+    def on_done(result=None):
+        return [x for x in (lambda: result)()]
+    return on_done
+
+class Client:
+    async def close(self):
+        pass
+"""
+    
+    analysis = analyzer.analyze_source(source, "nested.py")
+    
+    func_names = sorted(f.name for f in analysis.functions)
+    assert func_names == ["fallback", "on_done"]
+    assert analysis.classes[0].methods == []
+    assert [i.module for i in analysis.imports] == ["fast_json"]
@@ -0,0 +1,95 @@
+"""Tests for the functional verifier agent."""
+
+import pytest
+from pathlib import Path
+import tempfile
+import subprocess
+from scripts.agents.functional_verifier import FunctionalVerifier, _shift_redis_db
+from scripts.agents.utils import test_runner
+
+
+def _git(repo_path, *args):
+    subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True)
+
+
+@pytest.fixture
+def verifier_repo(monkeypatch):
+    """Create a repository with a single commit on main."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir)
+        monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+        
+        _git(repo_path, "init", "-b", "main")
+        _git(repo_path, "config", "user.email", "test@example.com")
+        _git(repo_path, "config", "user.name", "Test User")
+        (repo_path / "test.txt").write_text("initial content")
+        _git(repo_path, "add", ".")
+        _git(repo_path, "commit", "-m", "Initial commit")
+        
+        yield repo_path
+
+
+def _make_verifier(repo_path, test_result):
+    verifier = FunctionalVerifier(repo_path=str(repo_path))
+    calls = []
+    
+    def fake_run_tests(**kwargs):
+        calls.append(kwargs)
+        return test_result
+    
+    verifier.test_runner.run_tests = fake_run_tests
+    return verifier, calls
+
+
+@pytest.mark.unit
+def test_baseline_cached_for_completed_run(verifier_repo):
+    """Test a completed baseline run is cached and reused for the same commit."""
+    verifier, calls = _make_verifier(
+        verifier_repo,
+        test_runner.TestResult(passed=3, failed=1, total=4, duration=12.5, exit_code=1),
+    )
+    
+    baseline = verifier._get_baseline_metrics()
+    assert baseline["tests"] == {"passed": 3, "failed": 1, "total": 4, "duration": 12.5}
+    assert baseline["performance"] == {"test_duration": 12.5}
+    # Measured with the same coverage setting as the meta-PR runs
+    assert calls[0]["coverage"] is True
+    assert len(list(verifier.baseline_cache_dir.glob("*.json"))) == 1
+    
+    assert verifier._get_baseline_metrics() == baseline
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_baseline_not_cached_for_broken_run(verifier_repo):
+    """Test a pytest usage error that collected nothing isn't cached."""
+    verifier, calls = _make_verifier(verifier_repo, test_runner.TestResult(total=0, exit_code=4))
+    
+    baseline = verifier._get_baseline_metrics()
+    assert baseline["tests"] == {"passed": 0, "failed": 0, "total": 0, "duration": 0.0}
+    assert not verifier.baseline_cache_dir.exists() or not list(
+        verifier.baseline_cache_dir.glob("*.json")
+    )
+    
+    verifier._get_baseline_metrics()
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_shift_redis_db():
+    """Test worktree Redis URLs are offset from the configured database."""
+    assert _shift_redis_db("redis://localhost:6379", 4) == "redis://localhost:6379/4"
+    assert _shift_redis_db("redis://:pw@redis:6380/2", 4) == "redis://:pw@redis:6380/6"
+
+
+@pytest.mark.unit
+def test_duration_compared_against_baseline(verifier_repo):
+    """Test a meta-PR run is compared against the recorded baseline duration."""
+    verifier, _ = _make_verifier(
+        verifier_repo, test_runner.TestResult(passed=4, total=4, duration=10.0)
+    )
+    baseline = verifier._get_baseline_metrics()
+    
+    performance = verifier._run_performance_benchmarks(baseline, {"duration": 12.0})
+    assert performance["baseline_duration"] == 10.0
+    assert performance["degradation_percent"] == pytest.approx(20.0)
@@ -122,3 +122,67 @@ def test_get_changed_files(temp_git_repo):
     # Get changed files
     changed = git_ops.get_changed_files()
     assert "changed.txt" in changed
+
+
+@pytest.mark.unit
+def test_cat_file_batch(temp_git_repo):
+    """Test reading several blobs through one cat-file process."""
+    git_ops = GitOperations(repo_path=str(temp_git_repo))
+    
+    with git_ops.open_cat_file_batch() as batch:
+        sha, content = batch.read_blob("HEAD", "test.txt")
+        assert content == b"initial content"
+        assert len(sha) == 40
+        
+        # Missing paths don't break the stream
+        assert batch.read_blob("HEAD", "missing.txt") is None
+        assert batch.read_blob("HEAD", "test.txt")[1] == b"initial content"
+
+
+@pytest.mark.unit
+def test_get_blob_shas(temp_git_repo):
+    """Test looking up blob SHAs at a ref, omitting paths not committed there."""
+    git_ops = GitOperations(repo_path=str(temp_git_repo))
+    (temp_git_repo / "new_file.txt").write_text("untracked")
+    
+    base_shas = git_ops.get_blob_shas("HEAD", ["test.txt", "new_file.txt"])
+    assert list(base_shas) == ["test.txt"]
+
+
+@pytest.mark.unit
+def test_get_changed_files_between_refs(temp_git_repo):
+    """Test diffing two commits without touching the working tree."""
+    git_ops = GitOperations(repo_path=str(temp_git_repo))
+    base = git_ops.resolve_ref("HEAD")
+    
+    git_ops.create_branch("feature")
+    git_ops.checkout("feature")
+    (temp_git_repo / "feature.txt").write_text("feature")
+    git_ops.add_all()
+    git_ops.commit("Add feature file")
+    head = git_ops.resolve_ref("feature")
+    git_ops.checkout(base)
+    
+    assert head != base
+    assert git_ops.get_changed_files(base, head) == ["feature.txt"]
+    assert not (temp_git_repo / "feature.txt").exists()
+
+
+@pytest.mark.unit
+def test_worktree_add_and_remove(temp_git_repo):
+    """Test provisioning a detached worktree on a branch checked out elsewhere."""
+    git_ops = GitOperations(repo_path=str(temp_git_repo))
+    branch = git_ops.get_current_branch()
+    worktree = temp_git_repo / ".verify-wt" / "0"
+    
+    git_ops.add_worktree(str(worktree), branch)
+    assert (worktree / "test.txt").read_text() == "initial content"
+    
+    # Re-adding replaces the stale worktree instead of failing
+    git_ops.add_worktree(str(worktree), branch)
+    sandbox = GitOperations(repo_path=str(worktree))
+    sandbox.checkout(branch, detach=True)
+    assert sandbox.resolve_ref("HEAD") == git_ops.resolve_ref(branch)
+    
+    git_ops.remove_worktree(str(worktree))
+    assert not worktree.exists()
@@ -319,3 +319,42 @@ class TestLLMAgents:
         assert "Minor issues found" in markdown
         assert "Function too long" in markdown
         assert "src/test.py" in markdown
+    
+    @pytest.mark.unit
+    async def test_pr_context_fetch_shared(self, monkeypatch):
+        """Test agents given one task dict share a PR context fetch."""
+        import asyncio
+        from scripts.agents.llm_base_agent import BaseAgent
+        
+        calls = []
+        
+        async def fake_fetch(self, pr_number):
+            calls.append(pr_number)
+            await asyncio.sleep(0)
+            if len(calls) == 1 and pr_number == 7:
+                raise RuntimeError("GitHub unavailable")
+            return {"number": pr_number}
+        
+        monkeypatch.setattr(BaseAgent, "_fetch_pr_context", fake_fetch)
+        pr_context_tasks = {}
+        agents = [
+            LLMValidationAgent(dry_run=True, pr_context_tasks=pr_context_tasks),
+            LLMRemediationAgent(dry_run=True, pr_context_tasks=pr_context_tasks),
+            LLMArchitecturalGuardian(dry_run=True, pr_context_tasks=pr_context_tasks),
+            LLMFunctionalVerifier(dry_run=True, pr_context_tasks=pr_context_tasks),
+        ]
+        
+        with pytest.raises(RuntimeError):
+            await agents[0].get_pr_context(7)
+        assert await agents[1].get_pr_context(7) == {"number": 7}
+        
+        contexts = await asyncio.gather(*(agent.get_pr_context(123) for agent in agents))
+        assert all(context is contexts[0] for context in contexts)
+        assert calls == [7, 7, 123]
+        
+        # Agents created without a shared dict don't see other agents' fetches,
+        # nor memoize their own
+        standalone = LLMValidationAgent(dry_run=True)
+        await standalone.get_pr_context(123)
+        await standalone.get_pr_context(123)
+        assert calls == [7, 7, 123, 123, 123]
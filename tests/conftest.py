@@ -7,15 +7,42 @@ import os
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import urlsplit, urlunsplit
 
 import pytest
 from redis import asyncio as aioredis
 
+from src.meta_mcp.config import Config
 from src.meta_mcp.state import ExecutionMode, governance_state
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 
 
+def _worker_redis_url(url: str) -> str:
+    """
+    Give each pytest-xdist worker its own Redis database.
+
+    Workers run tests concurrently and the redis_client fixture flushes the
+    database, so sharing one would wipe other workers' state mid-test. Worker
+    gwN uses the URL's database index plus N.
+
+    Args:
+        url: Base Redis URL (its database index defaults to 0)
+
+    Returns:
+        Redis URL for this worker (unchanged outside xdist)
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "")
+    if not worker.startswith("gw"):
+        return url
+    parts = urlsplit(url)
+    db = int(parts.path.lstrip("/") or 0) + int(worker[2:])
+    return urlunsplit(parts._replace(path=f"/{db}"))
+
+
+WORKER_REDIS_URL = _worker_redis_url(REDIS_URL)
+
+
 # ============================================================================
 # PYTEST CONFIGURATION & MARKERS
 # ============================================================================
@@ -97,10 +124,13 @@ def pytest_collection_modifyitems(config, items):
 
 
 @pytest.fixture
-async def redis_client():
+async def redis_client(monkeypatch):
     """
     Provide clean Redis connection with flush before and after test.
 
+    Under pytest-xdist, the test and the server's shared client both use this
+    worker's own database (see _worker_redis_url).
+
     Yields:
         Redis client instance with clean database
 
@@ -115,10 +145,11 @@ async def redis_client():
     from src.meta_mcp.redis_client import close_redis_client
 
     await close_redis_client()
+    monkeypatch.setattr(Config, "REDIS_URL", WORKER_REDIS_URL)
 
     # Create Redis client
     client = aioredis.from_url(
-        REDIS_URL,
+        WORKER_REDIS_URL,
         encoding="utf-8",
         decode_responses=True,
         socket_connect_timeout=2,
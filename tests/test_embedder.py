@@ -8,6 +8,8 @@ Tests:
 - Edge cases (empty descriptions, special characters)
 """
 
+import pytest
+
 from src.meta_mcp.registry.models import ToolRecord
 from src.meta_mcp.retrieval.embedder import ToolEmbedder
 
@@ -223,6 +225,84 @@ class TestToolEmbedder:
         embedder.clear_cache()
         assert "test_tool" not in embedder._cache
 
+    def test_embedding_matrix(self):
+        """Test cached embeddings stack into float32 and int8 matrices in row order."""
+        np = pytest.importorskip("numpy")
+        embedder = ToolEmbedder()
+
+        tools = [
+            ToolRecord(
+                tool_id="read_file",
+                server_id="core",
+                description_1line="Read files",
+                description_full="Read files from disk",
+                tags=["file", "read"],
+                risk_level="safe",
+            ),
+            ToolRecord(
+                tool_id="send_email",
+                server_id="network",
+                description_1line="Send email",
+                description_full="Send email messages",
+                tags=["email"],
+                risk_level="sensitive",
+            ),
+        ]
+
+        embedder.build_index(tools)
+        matrix, tool_ids = embedder.get_embedding_matrix()
+
+        assert tool_ids == ("read_file", "send_email")
+        assert matrix.dtype == np.float32
+        assert matrix.flags["C_CONTIGUOUS"]
+        assert matrix.shape == (2, len(embedder._vocabulary))
+        assert matrix[1].tolist() == pytest.approx(embedder.get_cached_embedding("send_email"))
+        assert embedder.get_embedding_matrix()[0] is matrix
+
+        row = embedder.get_embedding_row("send_email")
+        assert np.shares_memory(row, matrix)
+        assert row.tolist() == matrix[1].tolist()
+        assert embedder.get_embedding_row("missing") is None
+
+        quantized, scales = embedder.get_int8_matrix()
+        assert quantized.dtype == np.int8
+        assert quantized.shape == matrix.shape
+        assert np.abs(quantized * scales[:, None] - matrix).max() < 1e-2
+
+        embedder.clear_cache()
+        assert embedder.get_embedding_matrix()[1] == ()
+
+    def test_embed_batch_matches_per_tool(self):
+        """Test batch embeddings equal the per-tool embeddings in input order."""
+        embedder = ToolEmbedder()
+
+        tools = [
+            ToolRecord(
+                tool_id="read_file",
+                server_id="core",
+                description_1line="Read files",
+                description_full="Read files from disk",
+                tags=["file", "read"],
+                risk_level="safe",
+            ),
+            ToolRecord(
+                tool_id="send_email",
+                server_id="network",
+                description_1line="Send email",
+                description_full="Send email messages",
+                tags=["email"],
+                risk_level="sensitive",
+            ),
+        ]
+
+        embedder.build_index(tools)
+        batch = embedder.embed_batch(list(reversed(tools)))
+
+        assert len(batch) == 2
+        assert batch[0] == pytest.approx(embedder._compute_embedding(tools[1]))
+        assert batch[1] == pytest.approx(embedder._compute_embedding(tools[0]))
+        assert embedder.get_cached_embedding("read_file") == pytest.approx(batch[1])
+
     def test_query_embedding(self):
         """Test query embedding generation."""
         embedder = ToolEmbedder()
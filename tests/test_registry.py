@@ -1,5 +1,7 @@
 """Tests for tool registry."""
 
+import pytest
+
 from src.meta_mcp.registry import tool_registry
 from src.meta_mcp.registry.models import AllowedInMode, ToolCandidate, ToolRecord
 from src.meta_mcp.state import ExecutionMode, governance_state
@@ -80,6 +82,12 @@ def test_get_tool_not_found():
     assert tool is None
 
 
+def test_get_many_preserves_order():
+    """get_many() should return one entry per ID, in order, with None for misses."""
+    tools = tool_registry.get_many(["write_file", "nonexistent_tool", "read_file"])
+    assert tools == [tool_registry.get("write_file"), None, tool_registry.get("read_file")]
+
+
 def test_all_tools_have_required_fields():
     """All tools should have required metadata fields."""
     summaries = tool_registry.get_all_summaries()
@@ -128,6 +136,18 @@ def test_is_registered_works():
     assert tool_registry.is_registered("nonexistent") is False
 
 
+def test_summary_columns_match_summaries():
+    """get_summary_columns() should mirror get_all_summaries() column by column."""
+    pytest.importorskip("numpy")
+    tools = tool_registry.get_all_summaries()
+    columns = tool_registry.get_summary_columns()
+
+    assert columns["tool_id"].tolist() == [t.tool_id for t in tools]
+    assert columns["risk_level"].tolist() == [t.risk_level for t in tools]
+    assert columns["description_1line"].tolist() == [t.description_1line for t in tools]
+    assert columns["tag_count"].tolist() == [len(t.tags) for t in tools]
+
+
 def test_search_allowed_in_mode_blocked(monkeypatch):
     """Search should mark sensitive tools blocked in READ_ONLY mode."""
 
@@ -8,12 +8,18 @@ Tests:
 - Edge cases and error handling
 """
 
+from dataclasses import replace
 
 import pytest
 
-from src.meta_mcp.registry.models import ToolCandidate, ToolRecord
+from src.meta_mcp.registry.models import AllowedInMode, ToolCandidate, ToolRecord
 from src.meta_mcp.retrieval.embedder import ToolEmbedder
-from src.meta_mcp.retrieval.search import SemanticSearch, search_tools_semantic
+from src.meta_mcp.retrieval.search import (
+    SemanticSearch,
+    _int8_dot,
+    _top_k_indices,
+    search_tools_semantic,
+)
 
 
 class TestSemanticSearch:
@@ -260,6 +266,246 @@ class TestSemanticSearch:
         results2 = searcher.search("files")
         assert len(results2) > 0
 
+    def test_query_cache(self, registry_with_tools, monkeypatch):
+        """Test repeated searches are served from the LRU cache until rebuild."""
+        searcher = SemanticSearch(registry_with_tools)
+        monkeypatch.setattr(SemanticSearch, "QUERY_CACHE_SIZE", 2)
+
+        first = searcher.search("read files", limit=3)
+        calls = []
+        score = searcher._search_by_vector
+        monkeypatch.setattr(
+            searcher, "_search_by_vector", lambda *args: calls.append(args) or score(*args)
+        )
+        embedded = []
+        embed_query = searcher.embedder.embed_query
+        monkeypatch.setattr(
+            searcher.embedder,
+            "embed_query",
+            lambda query: embedded.append(query) or embed_query(query),
+        )
+
+        second = searcher.search("read files", limit=3)
+        assert calls == []
+        assert embedded == []
+        assert second == first
+        assert second is not first
+        assert all(a is not b for a, b in zip(first, second, strict=True))
+
+        # Mutating a returned candidate must not leak into the cache entry
+        second[0].relevance_score = -1.0
+        assert searcher.search("read files", limit=3) == first
+
+        searcher.search("read files", limit=3, use_cache=False)
+        assert len(calls) == 1
+
+        searcher.search("read files", limit=2)
+        searcher.search("send email", limit=3)
+        assert len(searcher._query_cache) == 2
+        assert ("read files", 3) not in {key[:2] for key in searcher._query_cache}
+
+        searcher.rebuild_index()
+        assert len(searcher._query_cache) == 0
+
+    def test_query_cache_keyed_by_governance_mode(self, registry_with_tools, monkeypatch):
+        """Test cached results are per governance mode and no-match queries skip the lookup."""
+        searcher = SemanticSearch(registry_with_tools)
+        modes = []
+        mode = ["permission"]
+        monkeypatch.setattr(
+            searcher, "_resolve_governance_mode", lambda: modes.append(mode[0]) or mode[0]
+        )
+
+        assert searcher.search("xyzabc123nonexistent") == []
+        assert modes == []
+
+        searcher.search("read files", limit=3)
+        searcher.search("read files", limit=3)
+        mode[0] = "read_only"
+        calls = []
+        score = searcher._search_by_vector
+        monkeypatch.setattr(
+            searcher, "_search_by_vector", lambda *args: calls.append(args) or score(*args)
+        )
+        searcher.search("read files", limit=3)
+
+        assert modes == ["permission", "permission", "read_only"]
+        assert [args[-1] for args in calls] == ["read_only"]
+        assert set(searcher._query_cache[("read files", 3, 0.0, registry_with_tools.version)]) == {
+            "permission",
+            "read_only",
+        }
+
+    def test_query_cache_invalidated_by_registry_change(self, registry_with_tools):
+        """Test cached results are not served after a tool is replaced."""
+        searcher = SemanticSearch(registry_with_tools)
+        before = searcher.search("read files from disk", limit=1)[0]
+        assert before.tool_id == "read_file"
+        assert before.risk_level == "safe"
+
+        registry_with_tools.add(
+            replace(registry_with_tools.get("read_file"), risk_level="dangerous")
+        )
+
+        after = searcher.search("read files from disk", limit=6)
+        read_file = next(c for c in after if c.tool_id == "read_file")
+        assert read_file.risk_level == "dangerous"
+
+    def test_search_by_vector_matches_search(self, registry_with_tools):
+        """Test searching with a pre-computed query embedding."""
+        searcher = SemanticSearch(registry_with_tools)
+        query = "read files from disk"
+
+        expected = searcher.search(query, limit=3)
+        query_embedding = searcher.embedder.embed_query(query)
+        results = searcher.search_by_vector(query_embedding, limit=3)
+
+        assert [r.tool_id for r in results] == [r.tool_id for r in expected]
+        assert [r.relevance_score for r in results] == [r.relevance_score for r in expected]
+
+    def test_batch_search_matches_search(self, registry_with_tools):
+        """Test batch search returns the same ranking as individual searches."""
+        searcher = SemanticSearch(registry_with_tools)
+        queries = ["read files from disk", "send email", "", "xyzabc123nonexistent"]
+
+        batch_results = searcher.batch_search(queries, limit=3)
+
+        assert len(batch_results) == len(queries)
+        for query, results in zip(queries, batch_results, strict=True):
+            expected = searcher.search(query, limit=3)
+            assert [(r.tool_id, r.allowed_in_mode) for r in results] == [
+                (r.tool_id, r.allowed_in_mode) for r in expected
+            ]
+            assert [r.relevance_score for r in results] == pytest.approx(
+                [r.relevance_score for r in expected]
+            )
+
+    def test_int8_batch_search(self, registry_with_tools):
+        """Test int8-quantized batch search ranks close to the float index."""
+        pytest.importorskip("numpy")
+        searcher = SemanticSearch(registry_with_tools)
+        queries = ["read files from disk", "send email messages"]
+        expected = searcher.batch_search(queries, limit=1)
+
+        searcher.enable_int8()
+
+        int8_matrix, int8_scales = searcher.embedder.get_int8_matrix()
+        assert int8_matrix.dtype.name == "int8"
+        assert len(int8_scales) == len(searcher.embedder.get_embedding_matrix()[1])
+        results = searcher.batch_search(queries, limit=1)
+        for quantized, exact in zip(results, expected, strict=True):
+            assert quantized[0].tool_id == exact[0].tool_id
+            assert quantized[0].relevance_score == pytest.approx(
+                exact[0].relevance_score, abs=0.02
+            )
+
+        # Rebuilding keeps the quantized index
+        searcher.rebuild_index()
+        assert searcher._int8_enabled
+        assert searcher.embedder._int8_matrix is not None
+
+    def test_fused_search_matches_search(self, registry_with_tools):
+        """Test sparse column scoring ranks the same as the dense search."""
+        pytest.importorskip("numpy")
+        searcher = SemanticSearch(registry_with_tools)
+
+        for query in ["read files from disk", "send email messages", "network"]:
+            expected = searcher.search(query, limit=3)
+            results = searcher.fused_search(query, limit=3)
+            assert [c.tool_id for c in results] == [c.tool_id for c in expected]
+            for fused, dense in zip(results, expected, strict=True):
+                assert fused.relevance_score == pytest.approx(dense.relevance_score)
+
+        assert searcher.fused_search("xyzzy plugh", limit=3) == []
+        assert searcher.fused_search("", limit=3) == []
+
+    def test_large_registry_uses_cached_matrix(self, sample_tools, fresh_registry):
+        """Test the numpy paths share the embedder's matrix and rank alike."""
+        pytest.importorskip("numpy")
+        for i in range(20):
+            for tool in sample_tools:
+                fresh_registry.add_for_testing(replace(tool, tool_id=f"{tool.tool_id}_{i}"))
+        searcher = SemanticSearch(fresh_registry)
+
+        results = searcher.search("read files from disk", limit=5)
+        matrix = searcher._row_state[0]
+        assert matrix is searcher.embedder.get_embedding_matrix()[0]
+        assert matrix.shape[0] == 120
+
+        fused = searcher.fused_search("read files from disk", limit=5)
+        assert [c.relevance_score for c in results] == pytest.approx(
+            [c.relevance_score for c in fused]
+        )
+        searcher.search("send email", limit=5)
+        assert searcher._row_state[0] is matrix
+
+        searcher.rebuild_index()
+        assert searcher._row_state is None
+
+    def test_scoring_uses_current_risk_level(self, registry_with_tools):
+        """Test cached tool matrices don't keep governing with replaced records."""
+        pytest.importorskip("numpy")
+        searcher = SemanticSearch(registry_with_tools)
+        query = "read files from disk"
+        searcher.enable_int8()
+        embedding = searcher.embedder.embed_query(query)
+
+        before = searcher.search_by_vector(embedding, limit=1)[0]
+        searcher.fused_search(query, limit=1)
+        searcher.batch_search([query], limit=1)
+        assert before.tool_id == "read_file"
+        assert before.risk_level == "safe"
+
+        registry_with_tools.add(
+            replace(registry_with_tools.get("read_file"), risk_level="dangerous")
+        )
+
+        results = [
+            searcher.search_by_vector(embedding, limit=6),
+            searcher.fused_search(query, limit=6),
+            searcher.batch_search([query], limit=6)[0],
+        ]
+        for candidates in results:
+            read_file = next(c for c in candidates if c.tool_id == "read_file")
+            assert read_file.risk_level == "dangerous"
+            assert read_file.allowed_in_mode != AllowedInMode.ALLOWED
+            assert read_file.relevance_score < before.relevance_score
+
+    def test_top_k_indices(self):
+        """Test partial top-k selection returns the highest scores in order."""
+        np = pytest.importorskip("numpy")
+        scores = np.array([[0.1, 0.9, 0.5, 0.7], [0.4, 0.2, 0.8, 0.0]])
+
+        assert _top_k_indices(scores, 2).tolist() == [[1, 3], [2, 0]]
+        assert _top_k_indices(scores[0], 10).tolist() == [1, 3, 2, 0]
+        assert _top_k_indices(scores, 0).shape == (2, 0)
+
+    def test_top_k_indices_ties(self):
+        """Test tied scores are selected and ordered by lowest index."""
+        np = pytest.importorskip("numpy")
+        scores = np.zeros(500)
+        scores[3] = 1.0
+
+        assert _top_k_indices(scores, 5).tolist() == [3, 0, 1, 2, 4]
+        assert _top_k_indices(np.stack([scores, scores[::-1]]), 3).tolist() == [
+            [3, 0, 1],
+            [496, 0, 1],
+        ]
+        assert _top_k_indices(np.zeros(4), 4).tolist() == [0, 1, 2, 3]
+
+    def test_int8_dot_blocks(self):
+        """Test blockwise int8 products match a full int32 product."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        queries = rng.integers(-127, 128, size=(3, 16), dtype=np.int8)
+        matrix = rng.integers(-127, 128, size=(10, 16), dtype=np.int8)
+        expected = queries.astype(np.int32) @ matrix.astype(np.int32).T
+
+        for block_rows in (1, 3, 10, 64):
+            raw = _int8_dot(queries, matrix, block_rows=block_rows)
+            assert raw.dtype == np.int32
+            assert np.array_equal(raw, expected)
+
     def test_convenience_function(self, registry_with_tools):
         """Test convenience search function."""
         results = search_tools_semantic(registry_with_tools, "file operations")